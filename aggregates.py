@@ -0,0 +1,139 @@
+"""Additive aggregates of classified activity rows"""
+import numpy as np
+import pandas as pd
+
+from ingest import merge_schema_errors
+
+# Grain of the aggregate frame. Every chart groups by a subset of these columns,
+# so monthly, per-user, per-matter and per-category sums are all rollups of it.
+AGGREGATE_KEYS = [
+    'Year', 'Month', 'User', 'Matter number', 'Matter description',
+    'Task_Category', 'Automation_Potential', 'OLI_Category', 'OLI_Automation_Potential',
+]
+# Row-level measures, plus the entry counts, summed at that grain
+ROW_MEASURES = [
+    'Hours', 'Automatable_Hours', 'Manual_Hours', 'OLI_Automatable_Hours', 'OLI_Manual_Hours',
+    'Billable ($)',
+]
+AGGREGATE_MEASURES = ROW_MEASURES + ['Entries', 'Flat_Fee_Entries']
+# Key columns stored as categoricals in a finished aggregate frame
+_CATEGORICAL_KEYS = ['User', 'Matter number', 'Matter description', 'Task_Category', 'OLI_Category']
+
+
+MONTH_NAMES = {
+    1: 'January', 2: 'February', 3: 'March', 4: 'April', 5: 'May', 6: 'June',
+    7: 'July', 8: 'August', 9: 'September', 10: 'October', 11: 'November', 12: 'December',
+}
+
+# Columns computed on demand from stored ones instead of being kept on every row.
+# Aggregate frames store the summed hours measures, so only the rest is derived there.
+DERIVED_COLUMNS = {
+    'Month_Name': lambda frame: frame['Month'].map(MONTH_NAMES),
+    'Quarter': lambda frame: (frame['Month'] - 1) // 3 + 1,
+    'Automatable_Hours': lambda frame: frame['Hours'] * frame['Automation_Potential'],
+    'Manual_Hours': lambda frame: frame['Hours'] - frame['Hours'] * frame['Automation_Potential'],
+    'OLI_Automatable_Hours': lambda frame: frame['Hours'] * frame['OLI_Automation_Potential'],
+    'OLI_Manual_Hours': lambda frame: frame['Hours'] - frame['Hours'] * frame['OLI_Automation_Potential'],
+}
+
+
+def with_derived(frame, columns):
+    """Return frame with whichever of `columns` are derived and not stored computed
+
+    The input is never modified; a new frame is returned only if something was added.
+    """
+    missing = {column: DERIVED_COLUMNS[column] for column in columns
+               if column not in frame and column in DERIVED_COLUMNS}
+    if not missing:
+        return frame
+    return frame.assign(**missing)
+
+
+def _group_sum(frame):
+    """Sum the measures over AGGREGATE_KEYS, keeping rows with missing keys"""
+    return frame.groupby(AGGREGATE_KEYS, observed=True, dropna=False, sort=False)[
+        AGGREGATE_MEASURES
+    ].sum().reset_index()
+
+
+def aggregate_activities(df):
+    """Collapse classified rows to the aggregate grain"""
+    frame = with_derived(df, ROW_MEASURES)[AGGREGATE_KEYS + ROW_MEASURES].astype(
+        {measure: 'float64' for measure in ROW_MEASURES}
+    )
+    frame['Entries'] = 1
+    frame['Flat_Fee_Entries'] = df['Is_Flat_Fee'].astype('int64')
+    return _group_sum(frame)
+
+
+def combine_aggregates(parts):
+    """Merge aggregate frames (e.g. one per chunk) into one"""
+    parts = [part for part in parts if part is not None]
+    if len(parts) == 1:
+        return parts[0]
+    # Chunk categoricals have different categories, so group on plain values
+    frame = pd.concat(
+        [part.astype({key: object for key in _CATEGORICAL_KEYS}) for part in parts],
+        ignore_index=True,
+    )
+    return _group_sum(frame)
+
+
+def compact_aggregates(aggregates):
+    """Dictionary-encode the text keys of a finished aggregate frame"""
+    return aggregates.astype({key: 'category' for key in _CATEGORICAL_KEYS})
+
+
+def rollup(aggregates, keys, measures):
+    """Sum measures by a subset of the aggregate keys (rows with a missing key are dropped)
+
+    Derived keys and measures (see DERIVED_COLUMNS) are computed on the fly.
+    """
+    frame = with_derived(aggregates, keys + measures)
+    return frame.groupby(keys, observed=True)[measures].sum().reset_index()
+
+
+def top_k(frame, column, k, offset=0):
+    """Rows offset..offset + k of frame ranked by column, largest first, without sorting all rows
+
+    np.partition finds the cut-off value in linear time and only the rows
+    above it are sorted, so deeper pages cost a little more, never a full
+    sort. Ties keep frame order; missing values rank last.
+    """
+    values = frame[column].to_numpy(dtype='float64')
+    stop = min(offset + k, len(values))
+    if stop <= offset:
+        return frame.iloc[:0]
+    negated = np.where(np.isnan(values), np.inf, -values)
+    if stop < len(values):
+        # Everything up to the stop-th value, including all rows tied with it
+        threshold = np.partition(negated, stop - 1)[stop - 1]
+        candidates = np.flatnonzero(negated <= threshold)
+    else:
+        candidates = np.arange(len(values))
+    order = candidates[np.lexsort((candidates, negated[candidates]))]
+    return frame.iloc[order[offset:stop]]
+
+
+def stream_aggregates(chunks, prepare):
+    """Fold a stream of raw chunks into one aggregate frame
+
+    `chunks` yields (chunk, schema_errors) pairs (see ingest.iter_activity_chunks)
+    and `prepare` turns a raw chunk into classified rows.
+    Only one chunk of rows is held in memory at a time. The result carries the
+    total row count and merged schema errors in attrs.
+    """
+    aggregates = None
+    rows = 0
+    schema_errors = {}
+    for chunk, chunk_errors in chunks:
+        rows += len(chunk)
+        merge_schema_errors(schema_errors, chunk_errors)
+        aggregates = combine_aggregates([aggregates, aggregate_activities(prepare(chunk))])
+
+    if aggregates is None:
+        aggregates = pd.DataFrame(columns=AGGREGATE_KEYS + AGGREGATE_MEASURES)
+    aggregates = compact_aggregates(aggregates)
+    aggregates.attrs['rows'] = rows
+    aggregates.attrs['schema_errors'] = schema_errors
+    return aggregates
@@ -0,0 +1,277 @@
+"""Token statistics over the unique activity descriptions"""
+import numpy as np
+import pandas as pd
+
+from task_classifier import keyword_matches
+
+# Words of four or more letters, as counted by the keyword views
+TOKEN_PATTERN = r'\b[a-z]{4,}\b'
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 're', 'from', 'by', 'as', 'is', 'was', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those',
+})
+
+
+class DescriptionTokens:
+    """Token counts of every unique description, tokenized once
+
+    Counts are stored as (description id, token id) pairs with the number of
+    times the token occurs in that description and the word position of its
+    first occurrence. Summing them for any subset of rows only needs the
+    subset's description ids, so filters never re-run the tokenizer.
+    """
+
+    def __init__(self, descriptions):
+        self.descriptions = pd.Index(pd.unique(pd.Series(descriptions, dtype=object).dropna()))
+
+        # One regex pass per unique description, flattened to (description, token) in text order
+        tokens = pd.Series(self.descriptions, dtype=object).str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+        tokens = tokens[~tokens.isin(STOP_WORDS)]
+        description_ids = tokens.index.to_numpy(dtype=np.int64)
+        token_ids, vocabulary = pd.factorize(tokens.to_numpy(dtype=object))
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        positions = tokens.groupby(level=0).cumcount().to_numpy(dtype=np.int64)
+
+        # Collapse repeats; np.unique's first index is the earliest position in the text
+        n_tokens = max(len(self.vocabulary), 1)
+        pairs, first, counts = np.unique(description_ids * n_tokens + token_ids,
+                                         return_index=True, return_counts=True)
+        self.pair_descriptions = pairs // n_tokens
+        self.pair_tokens = pairs % n_tokens
+        self.pair_counts = counts
+        self.pair_positions = positions[first]
+
+    def description_ids(self, descriptions):
+        """Map descriptions (one per row) to ids; NaN or unknown descriptions are dropped"""
+        ids = self.descriptions.get_indexer(pd.Series(descriptions, dtype=object).dropna())
+        return ids[ids >= 0]
+
+    def top_tokens(self, ids, n=30):
+        """Most common tokens over rows given by their description ids (in row order), as (token, count) pairs
+
+        Equivalent to Counter(all tokens in row order).most_common(n): ties
+        keep the order in which tokens were first seen. Map description
+        strings with description_ids first; DescriptionIndex.top_tokens takes
+        row ids and skips hashing the strings altogether.
+        """
+        if not len(ids) or not len(self.pair_tokens):
+            return []
+        n_descriptions = len(self.descriptions)
+        rows_per_description = np.bincount(ids, minlength=n_descriptions)
+        first_row = np.full(n_descriptions, len(ids), dtype=np.int64)
+        unique_ids, first_index = np.unique(ids, return_index=True)
+        first_row[unique_ids] = first_index
+
+        weights = rows_per_description[self.pair_descriptions]
+        keep = weights > 0
+        tokens = self.pair_tokens[keep]
+        totals = np.bincount(tokens, weights=(weights[keep] * self.pair_counts[keep]),
+                             minlength=len(self.vocabulary))
+
+        # First sighting of each token: earliest row, then earliest position in that row
+        span = int(self.pair_positions.max()) + 1
+        seen = first_row[self.pair_descriptions[keep]] * span + self.pair_positions[keep]
+        first_seen = np.full(len(self.vocabulary), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first_seen, tokens, seen)
+
+        candidates = np.flatnonzero(totals > 0)
+        order = np.lexsort((first_seen[candidates], -totals[candidates]))[:n]
+        return [(self.vocabulary[token], int(totals[token])) for token in candidates[order]]
+
+
+def _pack_strings(values):
+    """Strings as (UTF-8 bytes, offsets) arrays, so they can be saved without pickling"""
+    encoded = [str(value).encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(data, offsets):
+    """Inverse of _pack_strings, as an object array"""
+    blob = data.tobytes()
+    return np.array([blob[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])],
+                    dtype=object)
+
+
+def _postings(keys, values, n_keys):
+    """Group values by integer key into CSR (offsets, values) arrays, values ascending per key"""
+    order = np.lexsort((values, keys))
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(keys, minlength=n_keys))
+    return offsets, np.asarray(values, dtype=np.int64)[order]
+
+
+class DescriptionIndex:
+    """Inverted index from tokens, taxonomy keywords and categories to row ids
+
+    Everything is array-backed postings lists (CSR offsets + sorted ids):
+    term -> unique description ids, and description id -> row ids. A lookup
+    expands the few matching descriptions to their rows, so drilldowns never
+    scan the Description column. Row ids are positions in the indexed frame.
+    """
+
+    def __init__(self, descriptions, categories, matcher):
+        descriptions = pd.Series(descriptions, dtype=object)
+        self.tokens = DescriptionTokens(descriptions)
+        n_descriptions = len(self.tokens.descriptions)
+        self.n_rows = len(descriptions)
+
+        # description id -> rows
+        self.row_descriptions = self.tokens.descriptions.get_indexer(descriptions)
+        described = np.flatnonzero(self.row_descriptions >= 0)
+        self.row_offsets, self.description_rows = _postings(
+            self.row_descriptions[described], described, n_descriptions
+        )
+
+        # token -> descriptions
+        self.token_ids = {token: index for index, token in enumerate(self.tokens.vocabulary)}
+        self.token_offsets, self.token_descriptions = _postings(
+            self.tokens.pair_tokens, self.tokens.pair_descriptions, len(self.token_ids)
+        )
+
+        # taxonomy keyword (substring semantics, as classified) -> descriptions
+        self.keyword_ids = dict(matcher.keyword_ids)
+        matched, keyword_ids = keyword_matches(matcher, np.asarray(self.tokens.descriptions, dtype=object))
+        self.keyword_offsets, self.keyword_descriptions = _postings(keyword_ids, matched, len(self.keyword_ids))
+
+        # category -> descriptions (every row of a description has the same category)
+        categories = pd.Categorical(categories)
+        self.category_ids = {category: index for index, category in enumerate(categories.categories)}
+        first_rows = self.description_rows[self.row_offsets[:-1]]
+        self.category_offsets, self.category_descriptions = _postings(
+            np.asarray(categories.codes)[first_rows], np.arange(n_descriptions), len(self.category_ids)
+        )
+
+    # Arrays written by save, besides the strings
+    _SAVED_ARRAYS = [
+        'row_descriptions', 'row_offsets', 'description_rows', 'token_offsets', 'token_descriptions',
+        'keyword_offsets', 'keyword_descriptions', 'category_offsets', 'category_descriptions',
+    ]
+    _SAVED_TOKEN_ARRAYS = ['pair_descriptions', 'pair_tokens', 'pair_counts', 'pair_positions']
+    _SAVED_STRINGS = ['descriptions', 'vocabulary', 'keywords', 'categories']
+
+    def save(self, path):
+        """Write the index to an .npz file (see load)"""
+        strings = {
+            'descriptions': self.tokens.descriptions,
+            'vocabulary': self.tokens.vocabulary,
+            'keywords': list(self.keyword_ids),
+            'categories': list(self.category_ids),
+        }
+        arrays = {name: getattr(self, name) for name in self._SAVED_ARRAYS}
+        arrays.update({name: getattr(self.tokens, name) for name in self._SAVED_TOKEN_ARRAYS})
+        for name, values in strings.items():
+            arrays[f"{name}_data"], arrays[f"{name}_offsets"] = _pack_strings(values)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save, without rebuilding it from the descriptions"""
+        with np.load(path) as saved:
+            strings = {name: _unpack_strings(saved[f"{name}_data"], saved[f"{name}_offsets"])
+                       for name in cls._SAVED_STRINGS}
+            tokens = DescriptionTokens.__new__(DescriptionTokens)
+            tokens.descriptions = pd.Index(strings['descriptions'], dtype=object)
+            tokens.vocabulary = strings['vocabulary']
+            for name in cls._SAVED_TOKEN_ARRAYS:
+                setattr(tokens, name, saved[name])
+            index = cls.__new__(cls)
+            index.tokens = tokens
+            for name in cls._SAVED_ARRAYS:
+                setattr(index, name, saved[name])
+        index.n_rows = len(index.row_descriptions)
+        index.token_ids = {token: i for i, token in enumerate(tokens.vocabulary)}
+        index.keyword_ids = {keyword: i for i, keyword in enumerate(strings['keywords'])}
+        index.category_ids = {category: i for i, category in enumerate(strings['categories'])}
+        return index
+
+    @staticmethod
+    def _lookup(ids, offsets, values, key):
+        """Postings of one key, empty if the key is unknown"""
+        index = ids.get(key)
+        if index is None:
+            return np.array([], dtype=np.int64)
+        return values[offsets[index]:offsets[index + 1]]
+
+    def rows_for_descriptions(self, description_ids):
+        """Sorted row ids of the given description ids"""
+        starts = self.row_offsets[description_ids]
+        counts = self.row_offsets[description_ids + 1] - starts
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.sort(self.description_rows[np.repeat(starts, counts) + within])
+
+    def token_rows(self, token):
+        """Rows whose description contains the (lower-case) token as a word"""
+        return self.rows_for_descriptions(
+            self._lookup(self.token_ids, self.token_offsets, self.token_descriptions, token)
+        )
+
+    def keyword_rows(self, keyword):
+        """Rows whose description contains a taxonomy keyword"""
+        return self.rows_for_descriptions(
+            self._lookup(self.keyword_ids, self.keyword_offsets, self.keyword_descriptions, keyword)
+        )
+
+    def category_rows(self, category):
+        """Rows with a description that were classified into a category"""
+        return self.rows_for_descriptions(
+            self._lookup(self.category_ids, self.category_offsets, self.category_descriptions, category)
+        )
+
+    def term_rows(self, term):
+        """Rows matching a taxonomy keyword, or else containing the word"""
+        if term in self.keyword_ids:
+            return self.keyword_rows(term)
+        return self.token_rows(term.lower())
+
+    def top_tokens(self, rows, n=30):
+        """Most common tokens over the descriptions of rows (sorted row ids), see DescriptionTokens.top_tokens"""
+        ids = self.row_descriptions[rows]
+        return self.tokens.top_tokens(ids[ids >= 0], n=n)
+
+    def top_descriptions(self, rows, n=5):
+        """Most frequent descriptions among rows, as a count Series (ties in first-seen order)"""
+        ids = self.row_descriptions[rows]
+        ids = ids[ids >= 0]
+        counts = np.bincount(ids, minlength=len(self.tokens.descriptions))
+        unique_ids, first_index = np.unique(ids, return_index=True)
+        order = np.lexsort((first_index, -counts[unique_ids]))[:n]
+        top = unique_ids[order]
+        return pd.Series(counts[top], index=self.tokens.descriptions[top], name='count')
+
+    def top_descriptions_by_category(self, rows, n=5):
+        """top_descriptions for every category at once, as {category: count Series}
+
+        One bincount over the rows' descriptions, then a single sort by
+        (category, count descending, first seen); each category keeps its first n.
+        Categories without rows among `rows` are left out.
+        """
+        ids = self.row_descriptions[rows]
+        ids = ids[ids >= 0]
+        counts = np.bincount(ids, minlength=len(self.tokens.descriptions))
+        unique_ids, first_index = np.unique(ids, return_index=True)
+
+        # Category of each description, from the category -> descriptions postings
+        description_categories = np.empty(len(self.tokens.descriptions), dtype=np.int64)
+        description_categories[self.category_descriptions] = np.repeat(
+            np.arange(len(self.category_ids)), np.diff(self.category_offsets)
+        )
+        categories = description_categories[unique_ids]
+        order = np.lexsort((first_index, -counts[unique_ids], categories))
+        categories = categories[order]
+        top = unique_ids[order]
+
+        # Each category is one run of the sorted order; keep the head of every run
+        starts = np.flatnonzero(np.r_[True, categories[1:] != categories[:-1]]) if len(top) else np.array([], dtype=np.int64)
+        ends = np.r_[starts[1:], len(top)]
+        names = list(self.category_ids)
+        return {
+            names[categories[start]]: pd.Series(
+                counts[top[start:min(end, start + n)]],
+                index=self.tokens.descriptions[top[start:min(end, start + n)]], name='count',
+            )
+            for start, end in zip(starts, ends)
+        }
@@ -0,0 +1,214 @@
+"""Monthly forecasts with prediction intervals from the aggregate cube"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from aggregates import rollup
+
+SEASON_LENGTH = 12
+# Smoothing parameters searched per series (error-correction form of additive Holt-Winters)
+ALPHAS = np.array([0.1, 0.2, 0.3, 0.5, 0.7, 0.9])
+BETAS = np.array([0.0, 0.05, 0.1, 0.2, 0.3, 0.5])
+GAMMAS = np.array([0.0, 0.05, 0.1, 0.2, 0.3])
+# Fewer observed months than this are forecast as their mean
+MIN_SMOOTHING_MONTHS = 3
+# Known months whose least-squares line starts the level and trend of a non-seasonal series
+TREND_INIT_MONTHS = 6
+
+
+def monthly_series(frame, measure, keys=(), start=None):
+    """Monthly totals of measure per group, as (periods, group frame, values matrix)
+
+    Periods (year * 12 + month - 1) run from the first month of frame (or
+    start, if earlier) to its last. Months in which frame has no rows at all
+    are unknown (NaN); in months with data, a group without rows has 0.
+    """
+    keys = list(keys)
+    monthly = rollup(frame, keys + ['Year', 'Month'], [measure])
+    monthly_periods = (monthly['Year'] * 12 + monthly['Month'] - 1).astype('int64').to_numpy()
+    if not len(monthly):
+        return np.array([], dtype=np.int64), pd.DataFrame(columns=keys), np.zeros((0, 0))
+    first_period = monthly_periods.min() if start is None else min(monthly_periods.min(), start)
+    periods = np.arange(first_period, monthly_periods.max() + 1)
+
+    if keys:
+        groups = monthly[keys].drop_duplicates().reset_index(drop=True)
+        group_ids = pd.MultiIndex.from_frame(groups).get_indexer(pd.MultiIndex.from_frame(monthly[keys]))
+    else:
+        groups = pd.DataFrame(index=[0])
+        group_ids = np.zeros(len(monthly), dtype=np.int64)
+
+    observed = np.zeros(len(periods), dtype=bool)
+    observed[monthly_periods - periods[0]] = True
+    values = np.where(observed, 0.0, np.nan)[None, :].repeat(len(groups), axis=0)
+    values[group_ids, monthly_periods - periods[0]] = monthly[measure].to_numpy(dtype='float64')
+    return periods, groups, values
+
+
+def _line(values, positions):
+    """Least-squares (intercept, slope) of each row over positions, ignoring unknown (NaN) values
+
+    Rows with fewer than two known values get their mean and a slope of 0.
+    """
+    known = ~np.isnan(values)
+    n_known = known.sum(axis=1, keepdims=True)
+    x = np.where(known, positions, 0.0)
+    y = np.where(known, values, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = x.sum(axis=1, keepdims=True) / n_known
+        y_mean = y.sum(axis=1, keepdims=True) / n_known
+        dx = np.where(known, positions - x_mean, 0.0)
+        variance = (dx ** 2).sum(axis=1, keepdims=True)
+        slope = np.where(variance > 0, (dx * (y - y_mean)).sum(axis=1, keepdims=True) / variance, 0.0)
+    intercept = y_mean - slope * x_mean
+    return np.nan_to_num(intercept), np.nan_to_num(slope)
+
+
+def _smooth(values, alpha, beta, gamma, season_length):
+    """Run additive Holt-Winters over series (rows of values) for each parameter set
+
+    alpha, beta and gamma broadcast to (series, parameter sets). Returns the
+    one-step squared error sum and its count, the final level, trend and
+    seasonal states, and the one-step forecast of every month. Months with
+    unknown values take the one-step forecast.
+    """
+    n_series, n_periods = values.shape
+    shape = np.broadcast_shapes((n_series, 1), np.shape(alpha), np.shape(beta), np.shape(gamma))
+
+    # Starting states describe t = -1, so the first one-step forecast is for t = 0.
+    # Seasonal: the trend is the mean change between the same months of the
+    # first two seasons, and each month of the season takes its detrended
+    # value from whichever season knows it; the level is their mean and the
+    # seasonal indices the deviations from it. Otherwise (season length 1) a
+    # least-squares line over the first known months gives the level and trend.
+    if season_length > 1:
+        first = values[:, :season_length]
+        second = values[:, season_length:2 * season_length]
+        positions = np.arange(season_length, dtype='float64')
+        changes = second - first
+        with np.errstate(invalid='ignore', divide='ignore'):
+            trend = np.nansum(changes, axis=1, keepdims=True) / (~np.isnan(changes)).sum(axis=1, keepdims=True)
+            trend = np.nan_to_num(trend) / season_length
+            detrended = np.where(np.isnan(first), second - trend * season_length, first) - trend * positions
+            level = np.nansum(detrended, axis=1, keepdims=True) / (~np.isnan(detrended)).sum(axis=1, keepdims=True)
+        seasonal = np.nan_to_num(detrended - level)
+        level = np.nan_to_num(level) - trend
+    else:
+        known = ~np.isnan(values)
+        first_known = known & (np.cumsum(known, axis=1) <= TREND_INIT_MONTHS)
+        intercept, trend = _line(np.where(first_known, values, np.nan), np.arange(n_periods, dtype='float64'))
+        level = intercept - trend
+        seasonal = np.zeros((n_series, 1))
+    level = np.broadcast_to(np.nan_to_num(level), shape).copy()
+    trend = np.broadcast_to(np.nan_to_num(trend), shape).copy()
+    seasonal = np.broadcast_to(seasonal[:, None, :], shape + (season_length,)).copy()
+
+    sse = np.zeros(shape)
+    count = np.zeros(shape)
+    fitted = np.empty(shape + (n_periods,))
+    for t in range(n_periods):
+        position = t % season_length
+        y = values[:, [t]]
+        known = ~np.isnan(y)
+        fitted[:, :, t] = level + trend + seasonal[:, :, position]
+        error = np.where(known, y - fitted[:, :, t], 0.0)
+        # The first season only initializes the seasonal indices
+        if t >= season_length or season_length == 1:
+            sse += error ** 2
+            count += known
+        level = level + trend + alpha * error
+        trend = trend + beta * error
+        seasonal[:, :, position] += gamma * error
+    return sse, count, level, trend, seasonal, fitted
+
+
+def _parameter_grid(seasonal):
+    """(alpha, beta, gamma) rows with beta <= alpha and gamma <= 1 - alpha"""
+    gammas = GAMMAS if seasonal else GAMMAS[:1]
+    grid = np.array(np.meshgrid(ALPHAS, BETAS, gammas, indexing='ij')).reshape(3, -1).T
+    return grid[(grid[:, 1] <= grid[:, 0]) & (grid[:, 2] <= 1 - grid[:, 0])]
+
+
+def forecast_series(values, horizon, level=0.8, season_length=SEASON_LENGTH, fitted=False):
+    """Forecast each row of values for the next horizon months, with a central prediction interval
+
+    Series with two full seasons get additive Holt-Winters, shorter ones
+    Holt's linear trend, and series with fewer than MIN_SMOOTHING_MONTHS
+    known months their mean. Smoothing parameters are chosen per series by
+    one-step squared error over a small grid, evaluated for all series and
+    parameter sets at once. Returns (forecast, lower, upper, model names);
+    hours cannot be negative, so all three are clipped at 0. With fitted,
+    the forecasts start with the one-step forecast of every month of values.
+    """
+    n_series, n_periods = values.shape
+    seasonal = n_periods >= 2 * season_length
+    season_length = season_length if seasonal else 1
+    grid = _parameter_grid(seasonal)
+
+    sse, count, *_ = _smooth(values, grid[:, 0], grid[:, 1], grid[:, 2], season_length)
+    best = np.argmin(sse, axis=1)
+    alpha, beta, gamma = (grid[best, column][:, None] for column in range(3))
+    sse, count, level_state, trend, seasonal_state, fits = _smooth(values, alpha, beta, gamma, season_length)
+
+    # h-step variance of additive Holt-Winters: sigma^2 (1 + sum_j (alpha + beta j + gamma [j % m == 0])^2)
+    steps = np.arange(1, horizon + 1)
+    sigma = np.sqrt(sse / np.maximum(count - 1, 1))
+    lags = np.arange(1, horizon)
+    weights = (alpha + beta * lags + gamma * (lags % season_length == 0)) ** 2
+    variance_factor = 1 + np.concatenate([np.zeros((n_series, 1)), np.cumsum(weights, axis=1)], axis=1)
+    positions = (n_periods - 1 + steps) % season_length
+    forecast = level_state + trend * steps + seasonal_state[:, 0, positions]
+    spread = sigma * np.sqrt(variance_factor[:, :horizon])
+    if fitted:
+        forecast = np.concatenate([fits[:, 0], forecast], axis=1)
+        spread = np.concatenate([np.repeat(sigma, n_periods, axis=1), spread], axis=1)
+    models = np.where(seasonal, 'Holt-Winters', "Holt's linear")
+
+    # Too few known months to smooth: flat mean with the spread of the months seen
+    known = np.sum(~np.isnan(values), axis=1)
+    short = known < MIN_SMOOTHING_MONTHS
+    if short.any():
+        with np.errstate(invalid='ignore'):
+            forecast[short] = np.nan_to_num(np.nanmean(values[short], axis=1))[:, None]
+            spread[short] = np.nan_to_num(np.nanstd(values[short], axis=1))[:, None]
+    models = np.where(short, 'Mean', models)
+
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    lower = forecast - z * spread
+    upper = forecast + z * spread
+    return np.maximum(forecast, 0), np.maximum(lower, 0), np.maximum(upper, 0), models
+
+
+def forecast_monthly(frame, measure, keys=(), horizon=12, level=0.8, start=None):
+    """Forecast monthly measure totals per group for the horizon months after frame's last month
+
+    Fits on every month of frame, across years (see monthly_series and
+    forecast_series). With start (a period, year * 12 + month - 1), the
+    months from start on in which frame has no data are forecast too, from
+    the model fitted around them. Returns one row per group and month with
+    the keys, Year, Month, Forecast, Lower, Upper and Model.
+    """
+    keys = list(keys)
+    periods, groups, values = monthly_series(frame, measure, keys, start)
+    columns = keys + ['Year', 'Month', 'Forecast', 'Lower', 'Upper', 'Model']
+    horizon = max(horizon, 0)
+    if not len(periods) or (not horizon and start is None):
+        return pd.DataFrame(columns=columns)
+
+    forecast, lower, upper, models = forecast_series(values, horizon, level, fitted=start is not None)
+    months = periods[-1] + np.arange(1, horizon + 1)
+    if start is not None:
+        # Unknown months are unknown for every group
+        gaps = (periods >= start) & np.isnan(values[0])
+        taken = np.concatenate([np.flatnonzero(gaps), len(periods) + np.arange(horizon)])
+        forecast, lower, upper = forecast[:, taken], lower[:, taken], upper[:, taken]
+        months = np.concatenate([periods[gaps], months])
+    result = groups.loc[groups.index.repeat(len(months))].reset_index(drop=True)
+    result['Year'] = np.tile(months // 12, len(groups))
+    result['Month'] = np.tile(months % 12 + 1, len(groups))
+    result['Forecast'] = forecast.ravel()
+    result['Lower'] = lower.ravel()
+    result['Upper'] = upper.ravel()
+    result['Model'] = np.repeat(models, len(months))
+    return result[columns]
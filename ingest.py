@@ -0,0 +1,501 @@
+"""CSV ingestion helpers for the activity exports"""
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - falls back to pandas' parser and no columnar cache
+    pa = None
+    pa_csv = None
+    pq = None
+
+# Columns the dashboard reads from an activity export, and their in-memory types
+CSV_SCHEMA = {
+    'Date': 'datetime',
+    'Hours': 'float32',
+    'User': 'category',
+    'Description': 'str',
+    'Matter number': 'category',
+    'Matter description': 'category',
+    'Billable ($)': 'currency',
+    'Flat rate': 'category',
+}
+DATE_FORMAT = '%m/%d/%Y'
+
+# pyarrow's multithreaded CSV reader when available, pandas' C parser otherwise
+CSV_ENGINE = 'pyarrow' if pa_csv is not None else 'c'
+
+# Rows per chunk in streaming mode
+STREAM_CHUNK_ROWS = 250_000
+
+# Bump when the layout of load_data's output changes so old cache files are ignored
+COLUMNAR_CACHE_VERSION = 4
+COLUMNAR_CACHE_KEY = b'activity_cache'
+
+# Daily exports picked up by the incremental store, e.g. activities_2025-10-30_10-21-00.csv
+EXPORT_PATTERN = 'activities*.csv'
+STORE_DIRNAME = '.activity_store'
+# Serializes store updates between sessions of the same process
+_STORE_LOCK = threading.Lock()
+# Export directory -> (file listing, taxonomy version, summary) of its last update in this process
+_STORE_STATE = {}
+
+
+def file_sha256(path):
+    """SHA-256 of a file's content, read in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _schema_failures(raw, parsed):
+    """Count and locate values that were present but could not be converted"""
+    failed = raw.notna().to_numpy() & parsed.isna().to_numpy()
+    # raw's index is the 0-based data row; line 1 of the file is the header
+    lines = (raw.index.to_numpy()[failed][:10] + 2).tolist()
+    return {'count': int(failed.sum()), 'lines': lines}
+
+
+def parse_currency(raw, dtype='float32'):
+    """Vectorized parse of exported money text like "$1,200.00", "(350)" or "-75"
+
+    Blank or missing (None/NaN) values become 0 and values that still are not numbers become NaN.
+    """
+    text = raw.astype('string').fillna('').str.replace(r'[$,\s]', '', regex=True)
+    # Accounting style negatives: (1,200.00)
+    negative = (text.str.startswith('(') & text.str.endswith(')')).to_numpy(dtype=bool)
+    digits = text.str.strip('()')
+    values = pd.to_numeric(digits.mask(digits == '', '0'), errors='coerce')
+    return values.mask(negative, -values).astype(dtype)
+
+
+def merge_schema_errors(total, errors):
+    """Fold one chunk's schema errors into a running report (in place)"""
+    for column, info in errors.items():
+        merged = total.setdefault(column, {'count': 0, 'lines': []})
+        merged['count'] += info['count']
+        merged['lines'] = (merged['lines'] + info['lines'])[:10]
+    return total
+
+
+def _read_text_columns(csv_path, columns):
+    """Read the given columns as untyped text (empty fields become NaN)"""
+    if CSV_ENGINE == 'pyarrow':
+        # pyarrow.csv directly, because pandas' pyarrow engine infers types before applying dtype
+        table = pa_csv.read_csv(csv_path, convert_options=_text_convert_options(columns))
+        return table.to_pandas()
+    return pd.read_csv(csv_path, encoding='utf-8-sig', usecols=columns,
+                       dtype={column: str for column in columns})
+
+
+def _text_convert_options(columns):
+    """pyarrow conversion options that keep every column as nullable text"""
+    return pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: pa.string() for column in columns},
+        strings_can_be_null=True,
+    )
+
+
+def _check_columns(csv_path, schema):
+    """Raise ValueError if the CSV header lacks any schema column"""
+    header = pd.read_csv(csv_path, encoding='utf-8-sig', nrows=0).columns
+    missing = [column for column in schema if column not in header]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+
+
+def apply_schema(raw, schema=CSV_SCHEMA):
+    """Convert text columns to the schema types; returns (df, schema_errors)
+
+    raw's index must be the 0-based row number within the file, so failures
+    can be reported by CSV line.
+    """
+    df = pd.DataFrame(index=raw.index)
+    schema_errors = {}
+    for column, kind in schema.items():
+        if kind == 'datetime':
+            df[column] = pd.to_datetime(raw[column], format=DATE_FORMAT, errors='coerce')
+        elif kind.startswith('float'):
+            df[column] = pd.to_numeric(raw[column], errors='coerce').astype(kind)
+        elif kind == 'currency':
+            df[column] = parse_currency(raw[column])
+        elif kind == 'category':
+            df[column] = raw[column].astype('category')
+            continue
+        else:
+            df[column] = raw[column]
+            continue
+        failures = _schema_failures(raw[column], df[column])
+        if failures['count']:
+            schema_errors[column] = failures
+    return df, schema_errors
+
+
+def read_activity_csv(csv_path, schema=CSV_SCHEMA):
+    """Read only the schema columns of an activity export, typed per the schema
+
+    Every column is read as text and then converted explicitly, so values
+    that do not fit the schema are counted in df.attrs['schema_errors']
+    ({column: {'count', 'lines'}}) instead of being silently coerced to NaN.
+    """
+    _check_columns(csv_path, schema)
+    df, schema_errors = apply_schema(_read_text_columns(csv_path, list(schema)), schema)
+    df.attrs['schema_errors'] = schema_errors
+    return df
+
+
+def iter_activity_chunks(csv_path, chunk_rows=STREAM_CHUNK_ROWS, schema=CSV_SCHEMA):
+    """Yield (typed chunk, schema_errors) pairs without loading the whole CSV"""
+    _check_columns(csv_path, schema)
+    columns = list(schema)
+    if CSV_ENGINE == 'pyarrow':
+        # Roughly chunk_rows rows per block at ~200 bytes per exported row
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=max(chunk_rows * 200, 1 << 20)),
+            convert_options=_text_convert_options(columns),
+        )
+        raw_chunks = (batch.to_pandas() for batch in reader)
+    else:
+        raw_chunks = pd.read_csv(csv_path, encoding='utf-8-sig', usecols=columns,
+                                 dtype={column: str for column in columns}, chunksize=chunk_rows)
+    start = 0
+    for raw in raw_chunks:
+        # Number rows across chunks so schema errors point at the right CSV line
+        raw.index = pd.RangeIndex(start, start + len(raw))
+        start += len(raw)
+        yield apply_schema(raw, schema)
+
+
+def add_derived_columns(df):
+    """Fill missing hours and add Year, Month and Is_Flat_Fee (in place)
+
+    Month names, quarters and automation hours are not stored; they are
+    derived on demand (see aggregates.DERIVED_COLUMNS).
+    """
+    # Fill NaN hours with 0
+    df['Hours'] = df['Hours'].fillna(0)
+
+    # Extract year and month
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+
+    # Flat fee flag (the column may be parsed as bools or as 'true'/'false' strings)
+    df['Is_Flat_Fee'] = df['Flat rate'].astype(str).str.lower() == 'true'
+    return df
+
+
+def apply_flat_fee_hours(df):
+    """Count flat fee entries as 1 hour (in place)"""
+    df.loc[df['Is_Flat_Fee'], 'Hours'] = 1.0
+    return df
+
+
+def columnar_cache_path(csv_path):
+    """Location of the Parquet cache that sits next to a CSV"""
+    return f"{csv_path}.cache.parquet"
+
+
+def _cache_metadata(path):
+    """Read our metadata block from a Parquet file's schema, or None"""
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return None
+    if COLUMNAR_CACHE_KEY not in metadata:
+        return None
+    return json.loads(metadata[COLUMNAR_CACHE_KEY])
+
+
+def read_columnar_cache(csv_path):
+    """Return the cached frame for csv_path, or None when missing or stale
+
+    The cache is valid when the CSV's mtime and size are unchanged. If only
+    the mtime differs (e.g. the file was copied onto a new pod), the content
+    hash decides instead.
+    """
+    if pq is None:
+        return None
+    cache_path = columnar_cache_path(csv_path)
+    if not os.path.exists(cache_path):
+        return None
+    meta = _cache_metadata(cache_path)
+    if meta is None or meta.get('version') != COLUMNAR_CACHE_VERSION:
+        return None
+
+    stat = os.stat(csv_path)
+    if meta['size'] != stat.st_size:
+        return None
+    if meta['mtime_ns'] != stat.st_mtime_ns and meta['sha256'] != file_sha256(csv_path):
+        return None
+
+    try:
+        df = pq.read_table(cache_path).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+    df.attrs.update(meta.get('attrs', {}))
+    return df
+
+
+def csv_sha256(csv_path):
+    """Content hash of csv_path, taken from its columnar cache while the mtime and size match
+
+    Only the cache's schema metadata is read; otherwise the file is hashed.
+    """
+    cache_path = columnar_cache_path(csv_path)
+    if pq is not None and os.path.exists(cache_path):
+        meta = _cache_metadata(cache_path)
+        stat = os.stat(csv_path)
+        if meta is not None and (meta.get('mtime_ns'), meta.get('size')) == (stat.st_mtime_ns, stat.st_size):
+            return meta['sha256']
+    return file_sha256(csv_path)
+
+
+def write_columnar_cache(csv_path, df):
+    """Persist df as a typed Parquet file next to csv_path; returns True on success"""
+    if pq is None:
+        return False
+    stat = os.stat(csv_path)
+    meta = {
+        'version': COLUMNAR_CACHE_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': file_sha256(csv_path),
+        'attrs': df.attrs,
+    }
+    cache_path = columnar_cache_path(csv_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            COLUMNAR_CACHE_KEY: json.dumps(meta).encode('utf-8'),
+        })
+        pq.write_table(table, tmp_path)
+        # Atomic swap so concurrent readers never see a half-written file
+        os.replace(tmp_path, cache_path)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def list_export_files(export_dir):
+    """Export CSVs in a directory, oldest first (names embed the export timestamp)"""
+    if not export_dir or not os.path.isdir(export_dir):
+        return []
+    return sorted(
+        os.path.join(export_dir, name) for name in os.listdir(export_dir)
+        if fnmatch.fnmatch(name, EXPORT_PATTERN)
+    )
+
+
+def row_keys(raw):
+    """Stable 64-bit key per raw text row
+
+    Hashes the schema columns as exported, plus the row's occurrence number
+    among identical rows of the same file, so genuinely repeated entries
+    survive while re-exported history is recognized.
+
+    Occurrences are numbered per file, so exports must be complete for every
+    date they cover (e.g. cumulative snapshots or whole-day extracts): a
+    repeat of an identical entry is only kept if some export contains it
+    together with the earlier occurrences. Numbering against the stored
+    counts instead would double every re-exported repeat.
+    """
+    row_hash = pd.util.hash_pandas_object(raw[list(CSV_SCHEMA)], index=False)
+    occurrence = row_hash.groupby(row_hash.to_numpy()).cumcount()
+    return pd.util.hash_pandas_object(
+        pd.DataFrame({'row': row_hash.to_numpy(), 'occurrence': occurrence.to_numpy()}), index=False
+    ).to_numpy()
+
+
+def _store_paths(export_dir):
+    """(store directory, manifest path) of an export directory"""
+    store_dir = os.path.join(export_dir, STORE_DIRNAME)
+    return store_dir, os.path.join(store_dir, 'manifest.json')
+
+
+def _read_manifest(export_dir):
+    """Load the store manifest, or an empty one"""
+    _, manifest_path = _store_paths(export_dir)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            return json.load(f)
+    return _empty_manifest()
+
+
+def _empty_manifest():
+    """Manifest of a store with no ingested files"""
+    return {'files': {}, 'rejected_files': {}, 'parts': [], 'generation': 0, 'taxonomy_version': None,
+            'schema_errors': {}, 'format': COLUMNAR_CACHE_VERSION}
+
+
+def _write_manifest(export_dir, manifest):
+    """Atomically replace the store manifest"""
+    _, manifest_path = _store_paths(export_dir)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def _export_listing(export_dir):
+    """{file name: {'size', 'mtime_ns'}} of the export files in a directory"""
+    listing = {}
+    for path in list_export_files(export_dir):
+        stat = os.stat(path)
+        listing[os.path.basename(path)] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    return listing
+
+
+def _read_parts(store_dir, parts, columns=None):
+    """Concatenate stored Parquet parts (optionally only some columns)"""
+    frames = [pq.read_table(os.path.join(store_dir, part), columns=columns).to_pandas() for part in parts]
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+
+def _remove_parts(store_dir, parts):
+    """Delete parts the manifest no longer lists (already missing ones are skipped)"""
+    for part in parts:
+        try:
+            os.remove(os.path.join(store_dir, part))
+        except FileNotFoundError:
+            pass
+
+
+def update_activity_store(export_dir, classify, taxonomy_version):
+    """Merge new rows from an export directory into its persisted store
+
+    Only files that are new or changed since the last run are parsed, and
+    only rows whose key is not already stored are typed, classified (by
+    calling `classify(df)`) and written as a new Parquet part. A new
+    taxonomy version reclassifies the stored rows once. Files that cannot be
+    read (e.g. missing columns) are skipped and listed in the summary and the
+    manifest's `rejected_files` until they change. Returns a summary dict
+    including a `version` string that changes whenever the store does.
+    """
+    if pq is None:
+        raise RuntimeError("Incremental ingestion needs pyarrow installed")
+    # Nothing to do when the exports are as this process last saw them
+    listing = _export_listing(export_dir)
+    state = _STORE_STATE.get(export_dir)
+    if state is not None and state[:2] == (listing, taxonomy_version):
+        return dict(state[2], new_files=0, new_rows=0, duplicate_rows=0, reclassified_rows=0)
+
+    store_dir, _ = _store_paths(export_dir)
+    with _STORE_LOCK:
+        os.makedirs(store_dir, exist_ok=True)
+        manifest = _read_manifest(export_dir)
+        original = json.dumps(manifest, sort_keys=True)
+        manifest.setdefault('rejected_files', {})
+        summary = {'new_files': 0, 'new_rows': 0, 'duplicate_rows': 0, 'reclassified_rows': 0}
+
+        # Superseded parts are only deleted once a manifest without them is
+        # written, so an interrupted run never leaves it listing missing parts
+
+        # Parts written with an older row layout are dropped and the exports re-ingested
+        if manifest.get('format') != COLUMNAR_CACHE_VERSION:
+            old_parts = manifest['parts']
+            manifest = dict(_empty_manifest(), generation=manifest['generation'] + 1)
+            _write_manifest(export_dir, manifest)
+            original = json.dumps(manifest, sort_keys=True)
+            _remove_parts(store_dir, old_parts)
+
+        # Taxonomy changed: reclassify stored rows into one fresh part
+        if manifest['parts'] and manifest['taxonomy_version'] != taxonomy_version:
+            stored = _read_parts(store_dir, manifest['parts'])
+            old_parts = manifest['parts']
+            part = f"part-{manifest['generation'] + 1:05d}.parquet"
+            classify(stored).to_parquet(os.path.join(store_dir, part), index=False)
+            manifest['parts'] = [part]
+            manifest['generation'] += 1
+            manifest['taxonomy_version'] = taxonomy_version
+            _write_manifest(export_dir, manifest)
+            original = json.dumps(manifest, sort_keys=True)
+            _remove_parts(store_dir, old_parts)
+            summary['reclassified_rows'] = len(stored)
+        manifest['taxonomy_version'] = taxonomy_version
+
+        # New or changed export files (a rejected file is retried once it changes)
+        changed = [
+            (name, seen) for name, seen in listing.items()
+            if seen != manifest['files'].get(name)
+            and seen != {key: value for key, value in manifest['rejected_files'].get(name, {}).items() if key != 'error'}
+        ]
+
+        if changed:
+            stored_keys = _read_parts(store_dir, manifest['parts'], columns=['Row_Key'])
+            known = np.array([], dtype=np.uint64) if stored_keys is None else stored_keys['Row_Key'].to_numpy()
+            new_frames = []
+            for name, seen in changed:
+                path = os.path.join(export_dir, name)
+                try:
+                    _check_columns(path, CSV_SCHEMA)
+                    raw = _read_text_columns(path, list(CSV_SCHEMA))
+                except (ValueError, OSError) as error:
+                    manifest['rejected_files'][name] = dict(seen, error=str(error))
+                    continue
+                manifest['rejected_files'].pop(name, None)
+
+                keys = row_keys(raw)
+                # Vectorised lookup against the stored keys and those of earlier files in this batch
+                is_new = ~pd.Series(keys).isin(known).to_numpy()
+                summary['duplicate_rows'] += int((~is_new).sum())
+                known = np.concatenate([known, keys[is_new]])
+                if is_new.any():
+                    df, schema_errors = apply_schema(raw[is_new], CSV_SCHEMA)
+                    # Line numbers refer to the export file they came from
+                    merge_schema_errors(manifest['schema_errors'], {
+                        f"{column} ({name})": info for column, info in schema_errors.items()
+                    })
+                    df['Row_Key'] = keys[is_new]
+                    new_frames.append(df.reset_index(drop=True))
+                manifest['files'][name] = seen
+                summary['new_files'] += 1
+
+            if new_frames:
+                new_rows = pd.concat(new_frames, ignore_index=True)
+                add_derived_columns(new_rows)
+                part = f"part-{manifest['generation'] + 1:05d}.parquet"
+                classify(new_rows).to_parquet(os.path.join(store_dir, part), index=False)
+                manifest['parts'].append(part)
+                manifest['generation'] += 1
+                summary['new_rows'] = len(new_rows)
+
+        # Rewritten only when something changed, so reruns leave the store untouched
+        if json.dumps(manifest, sort_keys=True) != original:
+            _write_manifest(export_dir, manifest)
+        summary['version'] = f"{manifest['generation']}-{taxonomy_version}"
+        summary['rejected_files'] = {name: info['error'] for name, info in manifest['rejected_files'].items()
+                                     if name in listing}
+        _STORE_STATE[export_dir] = (listing, taxonomy_version, summary)
+        return summary
+
+
+def read_activity_store(export_dir):
+    """Load every stored row of an export directory's store"""
+    store_dir, _ = _store_paths(export_dir)
+    manifest = _read_manifest(export_dir)
+    df = _read_parts(store_dir, manifest['parts'])
+    if df is None:
+        df = pd.DataFrame(columns=list(CSV_SCHEMA))
+    # Parts were dictionary-encoded separately; re-encode over the whole store
+    categorical = [column for column, kind in CSV_SCHEMA.items() if kind == 'category']
+    df = df.astype({column: 'category' for column in categorical})
+    df.attrs['schema_errors'] = manifest['schema_errors']
+    return df
@@ -5,10 +5,29 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
-import re
-from collections import Counter
+import os
+import time
 import PyPDF2
 
+from aggregates import aggregate_activities, compact_aggregates, rollup, stream_aggregates, top_k, with_derived
+from description_index import DescriptionIndex
+from forecasting import forecast_monthly
+from ingest import (
+    add_derived_columns,
+    apply_flat_fee_hours,
+    csv_sha256,
+    iter_activity_chunks,
+    list_export_files,
+    read_activity_store,
+    update_activity_store,
+)
+from pipeline import classify_rows as classify_activity_rows
+from pipeline import prepare_activities, read_artifact_index, read_artifact_manifest, read_artifacts
+from row_filters import FilterIndex, period_labels
+from savings import SIMULATION_DISTRIBUTIONS, add_hour_savings, savings_grid, savings_summary, simulate_net_savings
+from task_classifier import ClassificationMemo
+from taxonomies import LEGALBENCH_MATCHER, LEGALBENCH_TASKS, TAXONOMY_VERSION
+
 # Page configuration
 st.set_page_config(
     page_title="Scale Legal AI Automation Dashboard",
@@ -43,492 +62,111 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Comprehensive LegalBench Task Categories with automation potential
-# Based on 162 tasks from LegalBench framework
-LEGALBENCH_TASKS = {
-    # CONTRACT ANALYSIS & REVIEW (High automation 85-95%)
-    'Contract-Clause-Identification': {
-        'description': 'Identifying and extracting specific contract clauses (CUAD tasks)',
-        'automation_potential': 0.92,
-        'keywords': ['anti-assignment', 'audit rights', 'cap on liability', 'change of control', 
-                    'competitive restriction', 'covenant not to sue', 'effective date', 'exclusivity',
-                    'expiration date', 'governing law', 'insurance', 'ip ownership', 'license grant',
-                    'liquidated damages', 'minimum commitment', 'most favored nation', 'non-compete',
-                    'notice period', 'post-termination', 'price restrictions', 'renewal term',
-                    'revenue share', 'rofr', 'source code escrow', 'termination', 'warranty duration',
-                    'volume restriction', 'unlimited liability', 'clause review', 'provision'],
-        'examples': ['CUAD contract review', 'Clause extraction', 'Contract provision identification']
-    },
-    'Contract-NLI-Analysis': {
-        'description': 'Natural language inference for contract interpretation',
-        'automation_potential': 0.88,
-        'keywords': ['confidentiality', 'explicit identification', 'limited use', 'no licensing',
-                    'notice on disclosure', 'permissible copy', 'sharing with employees',
-                    'sharing with third parties', 'survival of obligations', 'contract entailment',
-                    'agreement interpretation', 'contract meaning'],
-        'examples': ['Contract clause interpretation', 'Confidentiality analysis', 'Obligation identification']
-    },
-    'Contract-QA': {
-        'description': 'Question answering about contract terms and provisions',
-        'automation_potential': 0.85,
-        'keywords': ['contract question', 'agreement terms', 'what does contract say', 'contract provision',
-                    'consumer contract', 'terms of service', 'contract language'],
-        'examples': ['Contract Q&A', 'Consumer contract analysis', 'Terms clarification']
-    },
-    
-    # M&A AND CORPORATE (Medium-High automation 75-90%)
-    'MA-Deal-Terms': {
-        'description': 'M&A deal terms analysis (MAUD tasks)',
-        'automation_potential': 0.82,
-        'keywords': ['maud', 'accuracy of target', 'accuracy of fundamental', 'capitalization',
-                    'matching rights', 'buyer consent', 'change in law', 'changes in gaap',
-                    'cor permitted', 'cor standard', 'intervening event', 'liability standard',
-                    'ordinary course', 'pandemic', 'public health', 'relational language',
-                    'tail period', 'type of consideration', 'merger agreement', 'acquisition'],
-        'examples': ['M&A agreement review', 'Deal term extraction', 'Acquisition document analysis']
-    },
-    'Corporate-Transactions': {
-        'description': 'Corporate transaction elements and terms',
-        'automation_potential': 0.80,
-        'keywords': ['ability to consummate', 'accounting principles', 'negative covenant',
-                    'outstanding shares', 'superior offer', 'no shop', 'shop breach',
-                    'determination trigger', 'transferable license', 'corporate action'],
-        'examples': ['Transaction document review', 'Corporate covenant analysis', 'Deal structure review']
-    },
-    'Corporate-Governance': {
-        'description': 'Corporate governance and compliance matters',
-        'automation_potential': 0.75,
-        'keywords': ['corporate lobbying', 'supply chain disclosure', 'best practice audits',
-                    'disclosed training', 'governance', 'compliance disclosure', 'corporate policy'],
-        'examples': ['Corporate lobbying analysis', 'Supply chain compliance', 'Disclosure review']
-    },
-    
-    # LITIGATION & PROCEDURE (Medium automation 70-85%)
-    'Case-Law-Analysis': {
-        'description': 'Case law research and citation analysis',
-        'automation_potential': 0.90,
-        'keywords': ['citation prediction', 'citation open', 'overruling', 'precedent',
-                    'case law', 'judicial decision', 'court opinion', 'legal authority'],
-        'examples': ['Citation research', 'Precedent analysis', 'Case law review']
-    },
-    'Legal-Issue-Spotting': {
-        'description': 'Identifying legal issues across practice areas (Learned Hands)',
-        'automation_potential': 0.85,
-        'keywords': ['learned hands', 'business law', 'consumer law', 'courts', 'crime',
-                    'divorce', 'domestic violence', 'education law', 'employment law',
-                    'estates', 'family law', 'health law', 'housing law', 'immigration',
-                    'torts', 'legal issue', 'identify problem', 'legal matter'],
-        'examples': ['Issue identification', 'Practice area classification', 'Legal problem spotting']
-    },
-    'Litigation-Documents': {
-        'description': 'Securities complaints and litigation document analysis',
-        'automation_potential': 0.87,
-        'keywords': ['securities complaint', 'ssla', 'company defendants', 'individual defendants',
-                    'plaintiff', 'complaint extraction', 'litigation document', 'pleading'],
-        'examples': ['Complaint analysis', 'Securities litigation review', 'Pleading extraction']
-    },
-    'Procedural-Analysis': {
-        'description': 'Court procedures and jurisdiction',
-        'automation_potential': 0.75,
-        'keywords': ['personal jurisdiction', 'diversity jurisdiction', 'oral argument',
-                    'question purpose', 'function of decision', 'court procedure'],
-        'examples': ['Jurisdiction analysis', 'Procedural review', 'Court filing analysis']
-    },
-    
-    # REGULATORY & COMPLIANCE (High automation 80-95%)
-    'Regulatory-Compliance': {
-        'description': 'Regulatory requirements and compliance analysis',
-        'automation_potential': 0.88,
-        'keywords': ['telemarketing sales rule', 'privacy policy', 'unfair tos',
-                    'unfair terms', 'consumer protection', 'regulatory requirement',
-                    'compliance check', 'regulation'],
-        'examples': ['Regulatory compliance review', 'Privacy policy analysis', 'Consumer protection']
-    },
-    'Privacy-Policy-Analysis': {
-        'description': 'Privacy policy interpretation and Q&A (OPP-115)',
-        'automation_potential': 0.90,
-        'keywords': ['opp-115', 'privacy policy qa', 'privacy policy entailment',
-                    'data collection', 'user choice', 'first party use', 'third party sharing',
-                    'data retention', 'data security', 'policy change', 'privacy'],
-        'examples': ['Privacy policy review', 'Data practice analysis', 'Privacy compliance']
-    },
-    'Insurance-Policy': {
-        'description': 'Insurance policy interpretation',
-        'automation_potential': 0.83,
-        'keywords': ['insurance policy', 'policy interpretation', 'coverage analysis',
-                    'insurance claim', 'policy language', 'insurance terms'],
-        'examples': ['Insurance policy review', 'Coverage determination', 'Policy interpretation']
-    },
-    
-    # STATUTORY INTERPRETATION (Medium-High automation 75-85%)
-    'Statutory-Interpretation': {
-        'description': 'Textualism and statutory construction',
-        'automation_potential': 0.78,
-        'keywords': ['textualism', 'tool dictionaries', 'tool plain', 'statutory interpretation',
-                    'statute', 'legislative intent', 'plain meaning', 'statutory construction'],
-        'examples': ['Statute interpretation', 'Legislative analysis', 'Statutory meaning']
-    },
-    'Legal-Rule-Application': {
-        'description': 'Applying legal rules to specific scenarios',
-        'automation_potential': 0.82,
-        'keywords': ['rule qa', 'abercrombie', 'hearsay', 'ucc v common law',
-                    'successor liability', 'legal reasoning causality', 'apply rule',
-                    'legal standard', 'legal test'],
-        'examples': ['Rule application', 'Legal standard analysis', 'UCC analysis']
-    },
-    'Trademark-Law': {
-        'description': 'Trademark distinctiveness analysis (Abercrombie)',
-        'automation_potential': 0.80,
-        'keywords': ['abercrombie', 'trademark', 'distinctiveness', 'generic', 'descriptive',
-                    'suggestive', 'arbitrary', 'fanciful', 'trademark analysis'],
-        'examples': ['Trademark classification', 'Distinctiveness analysis', 'Brand protection']
-    },
-    
-    # EVIDENCE & DISCOVERY (High automation 85-92%)
-    'Evidence-Analysis': {
-        'description': 'Hearsay and evidence rules',
-        'automation_potential': 0.85,
-        'keywords': ['hearsay', 'evidence', 'admissibility', 'exception', 'testimonial',
-                    'declaration', 'evidence rule', 'proof'],
-        'examples': ['Hearsay analysis', 'Evidence admissibility', 'Evidentiary review']
-    },
-    'Document-Discovery': {
-        'description': 'Document review and discovery analysis',
-        'automation_potential': 0.92,
-        'keywords': ['document production', 'discovery', 'responsive document', 'privilege',
-                    'work product', 'review document', 'ediscovery', 'document analysis'],
-        'examples': ['Discovery document review', 'Privilege review', 'Document production']
-    },
-    
-    # SPECIALIZED LEGAL DOMAINS (Medium automation 70-85%)
-    'Tax-Law': {
-        'description': 'Tax court outcomes and tax law analysis',
-        'automation_potential': 0.73,
-        'keywords': ['canada tax court', 'tax court outcomes', 'tax law', 'tax analysis',
-                    'tax dispute', 'tax assessment', 'tax ruling'],
-        'examples': ['Tax case analysis', 'Tax outcome prediction', 'Tax law research']
-    },
-    'International-Law': {
-        'description': 'International citizenship and cross-border legal questions',
-        'automation_potential': 0.85,
-        'keywords': ['international citizenship', 'citizenship questions', 'immigration',
-                    'nationality', 'cross-border', 'international law'],
-        'examples': ['Citizenship law analysis', 'Immigration questions', 'International legal research']
-    },
-    'Employment-Law': {
-        'description': 'Employment contracts and non-compete analysis',
-        'automation_potential': 0.80,
-        'keywords': ['solicit of employees', 'solicit of customers', 'employment',
-                    'non-compete', 'non-solicitation', 'employee agreement', 'restrictive covenant'],
-        'examples': ['Employment contract review', 'Non-compete analysis', 'Solicitation restrictions']
-    },
-    'Ethics-Professional': {
-        'description': 'Legal ethics and professional responsibility',
-        'automation_potential': 0.70,
-        'keywords': ['nys judicial ethics', 'judicial ethics', 'professional responsibility',
-                    'ethics rules', 'conflict of interest', 'attorney ethics'],
-        'examples': ['Ethics analysis', 'Conflict checking', 'Professional conduct review']
-    },
-    
-    # LEGAL REASONING & ANALYSIS (Medium automation 65-80%)
-    'Legal-Reasoning': {
-        'description': 'Causality and legal reasoning patterns',
-        'automation_potential': 0.75,
-        'keywords': ['legal reasoning causality', 'intra rule distinguishing',
-                    'legal analysis', 'reasoning', 'distinguish cases', 'analogize'],
-        'examples': ['Legal reasoning analysis', 'Case distinction', 'Analogical reasoning']
-    },
-    'Definition-Extraction': {
-        'description': 'Extracting and classifying legal definitions',
-        'automation_potential': 0.88,
-        'keywords': ['definition extraction', 'definition classification', 'defined term',
-                    'legal definition', 'term meaning', 'glossary'],
-        'examples': ['Definition extraction', 'Term identification', 'Glossary creation']
-    },
-    'Legal-Entailment': {
-        'description': 'SARA entailment and logical inference',
-        'automation_potential': 0.80,
-        'keywords': ['sara entailment', 'sara numeric', 'logical inference', 'entailment',
-                    'legal implication', 'follows from'],
-        'examples': ['Statutory entailment', 'Logical analysis', 'Inference tasks']
-    },
-    
-    # CORPORATE ACTIONS & DEALS (Medium-High automation 75-85%)
-    'Deal-Structure': {
-        'description': 'Deal structure and agreement terms',
-        'automation_potential': 0.78,
-        'keywords': ['jcrew blocker', 'termination services', 'agreement possession',
-                    'consistent with past practice', 'occur after signing', 'deal structure',
-                    'transaction structure'],
-        'examples': ['Deal structure analysis', 'Transaction term review', 'Agreement structuring']
-    },
-    'Financial-Impact': {
-        'description': 'Disproportionate impact and financial analysis',
-        'automation_potential': 0.72,
-        'keywords': ['disproportionate impact', 'financial impact', 'material adverse',
-                    'financial analysis', 'impact assessment'],
-        'examples': ['Financial impact analysis', 'Material adverse effect', 'Impact assessment']
-    },
-    'Private-Rights': {
-        'description': 'Private right of action analysis',
-        'automation_potential': 0.77,
-        'keywords': ['proa', 'private right of action', 'standing', 'cause of action',
-                    'statutory right', 'enforcement mechanism'],
-        'examples': ['Private right analysis', 'Standing determination', 'Enforcement review']
-    },
-    
-    # DOCUMENT PROCESSING (Very High automation 90-95%)
-    'Document-Classification': {
-        'description': 'Automated document classification and routing',
-        'automation_potential': 0.93,
-        'keywords': ['classify', 'categorize', 'document type', 'filing', 'organize',
-                    'sort documents', 'document management', 'routing'],
-        'examples': ['Document classification', 'File organization', 'Document routing']
-    },
-    'Form-Completion': {
-        'description': 'Automated form filling and template completion',
-        'automation_potential': 0.95,
-        'keywords': ['form', 'fill out', 'complete form', 'template', 'standardized',
-                    'form completion', 'data entry', 'populate'],
-        'examples': ['Form automation', 'Template completion', 'Data population']
-    },
-    'Legal-Research': {
-        'description': 'General legal research and information retrieval',
-        'automation_potential': 0.90,
-        'keywords': ['research', 'find', 'search', 'locate', 'legal research',
-                    'case search', 'statute search', 'secondary source', 'treatise'],
-        'examples': ['Legal research', 'Case law search', 'Statute research']
-    },
-    
-    # ADMINISTRATIVE & ROUTINE (Very High automation 92-98%)
-    'Calendar-Deadlines': {
-        'description': 'Calendar management and deadline tracking',
-        'automation_potential': 0.96,
-        'keywords': ['calendar', 'deadline', 'docket', 'schedule', 'date',
-                    'hearing date', 'filing deadline', 'statute of limitations'],
-        'examples': ['Deadline tracking', 'Calendar management', 'Docket control']
-    },
-    'Filing-Service': {
-        'description': 'Court filing and document service',
-        'automation_potential': 0.94,
-        'keywords': ['file', 'filing', 'serve', 'service', 'efiling', 'electronic filing',
-                    'court filing', 'submit'],
-        'examples': ['E-filing', 'Document filing', 'Service of process']
-    },
-    'Time-Billing': {
-        'description': 'Time entry and billing tasks',
-        'automation_potential': 0.92,
-        'keywords': ['time entry', 'billing', 'invoice', 'billable', 'hourly',
-                    'time tracking', 'matter', 'client billing'],
-        'examples': ['Time tracking', 'Billing preparation', 'Invoice generation']
-    },
-    
-    # DRAFTING & WRITING (Lower-Medium automation 55-75%)
-    'Brief-Drafting': {
-        'description': 'Legal brief and memorandum drafting',
-        'automation_potential': 0.58,
-        'keywords': ['draft brief', 'memorandum', 'motion', 'opposition', 'reply',
-                    'brief', 'legal writing', 'argument'],
-        'examples': ['Motion drafting', 'Brief preparation', 'Legal memoranda']
-    },
-    'Contract-Drafting': {
-        'description': 'Contract and agreement drafting',
-        'automation_potential': 0.65,
-        'keywords': ['draft contract', 'draft agreement', 'prepare contract', 'new agreement',
-                    'create contract', 'contract preparation'],
-        'examples': ['Contract creation', 'Agreement drafting', 'Document preparation']
-    },
-    'Client-Communication': {
-        'description': 'Client correspondence and communications',
-        'automation_potential': 0.55,
-        'keywords': ['email client', 'client communication', 'correspondence', 'letter',
-                    'client update', 'status update', 'client call'],
-        'examples': ['Client emails', 'Status updates', 'Client correspondence']
-    }
-}
+# Maximum number of (taxonomy, description) results kept in the shared memo
+CLASSIFICATION_MEMO_SIZE = 200_000
 
-# OLI BENCHMARK - Scale Law Firm's Custom Automation Estimates
-# Based on real-world assessment of AI capabilities for specific legal tasks
-OLI_BENCHMARK_TASKS = {
-    '100% AI Replaceable - NDAs & Standard Agreements': {
-        'automation_potential': 1.00,
-        'keywords': [
-            'nda', 'non-disclosure agreement', 'non disclosure agreement', 'non disclosure',
-            'msa', 'master service agreement',
-            'confidentiality agreement',
-            'employment agreement',
-            'consultation agreement', 'consulting agreement', 'contractor agreement',
-            'vendor agreement',
-            '1099 agreement',
-            'lease agreement', 'leases',
-            'licensing agreement',
-            'procurement agreement',
-            'commercial contract',
-            'promissory note',
-            'release',
-            'order', 'orders', 'court orders',
-            'advisor agreement',
-            'ip assignment', 'assignment', 'ip agreement',
-            'convertible note',
-            'hold letter',
-            'termination letter'
-        ],
-        'description': 'Standard contract drafting, review, and analysis - highly templated work',
-        'examples': ['NDA drafting', 'MSA review', 'Employment agreement preparation']
-    },
-    '100% AI Replaceable - Document Search': {
-        'automation_potential': 1.00,
-        'keywords': [
-            'searching for document', 'search for document', 'find document', 'locate document',
-            'document search', 'retrieve document'
-        ],
-        'description': 'Document search and retrieval tasks',
-        'examples': ['Finding contracts', 'Locating agreements', 'Document retrieval']
-    },
-    '70% AI Replaceable - Legal Research & Analysis': {
-        'automation_potential': 0.70,
-        'keywords': [
-            'search case law', 'case law research', 'case search',
-            'interpret bill', 'interpret statute', 'interpret law', 'interpret ordinance', 'interpret regulations',
-            'statute interpretation', 'statutory analysis',
-            'discovery requests', 'discovery', 'written discovery', 'document production'
-        ],
-        'description': 'Legal research, statutory interpretation, and discovery work',
-        'examples': ['Case law research', 'Bill interpretation', 'Discovery requests']
-    },
-    '30% AI Replaceable - Complex Agreements': {
-        'automation_potential': 0.30,
-        'keywords': [
-            'drafting memo', 'memorandum', 'draft memo',
-            'loan document', 'loan agreement',
-            'saas agreement', 'software agreement',
-            'ecommerce agreement',
-            'agreement of purchase and sale', 'purchase agreement',
-            'settlement agreement',
-            'trademark office actions', 'trademark response', 'trademark application',
-            'patent office actions', 'patent office responses', 'patent application',
-            'closing documents', 'transaction',
-            'financing documents', 'finance',
-            'motion', 'notice of motion', 'draft motion',
-            'complaints', 'answer to complaint', 'claim',
-            'reseller agreement',
-            'referral agreement',
-            'term sheet', 'term agreement',
-            'sales representative agreement',
-            'option agreement',
-            'opinion', 'legal opinion',
-            'click agreement'
-        ],
-        'description': 'Complex agreements and documents requiring more judgment',
-        'examples': ['Loan documents', 'Settlement agreements', 'Patent responses']
-    },
-    '20% AI Replaceable - General Drafting': {
-        'automation_potential': 0.20,
-        'keywords': [
-            'draft email', 'draft letter', 'draft amendments', 'draft subscription agreement',
-            'draft update', 'drafting', 'prepare',
-            'email', 'response to', 'respond to', 'communication', 'correspondence'
-        ],
-        'description': 'General drafting and communications - requires significant human input',
-        'examples': ['Email drafting', 'Letter preparation', 'General correspondence']
-    },
-    '0% AI Replaceable - Strategic Work': {
-        'automation_potential': 0.00,
-        'keywords': [
-            'strategy', 'confer', 'spoke with', 'conference call', 'attended',
-            'meeting', 'discussion', 'call with', 'spoke to', 'consultation',
-            'advise', 'counseling', 'negotiate', 'negotiation'
-        ],
-        'description': 'Strategic work, client communications, and relationship management',
-        'examples': ['Strategy sessions', 'Client meetings', 'Negotiations']
-    }
-}
+# Processes used to classify large batches of new descriptions (1 = in-process)
+CLASSIFY_WORKERS = int(os.environ.get('CLASSIFY_WORKERS', '1'))
 
-def classify_task_oli(description):
-    """Classify a task description using OLI Benchmark"""
-    if pd.isna(description):
-        return 'Unclassified', 0.0
-    
-    description_lower = description.lower()
-    
-    # Check for strategic work first (0% automation)
-    strategic_keywords = OLI_BENCHMARK_TASKS['0% AI Replaceable - Strategic Work']['keywords']
-    if any(keyword in description_lower for keyword in strategic_keywords):
-        return '0% AI Replaceable - Strategic Work', 0.0
-    
-    # Score each category
-    scores = {}
-    for category, info in OLI_BENCHMARK_TASKS.items():
-        if category == '0% AI Replaceable - Strategic Work':
-            continue
-        score = sum(1 for keyword in info['keywords'] if keyword in description_lower)
-        if score > 0:
-            scores[category] = score
-    
-    if scores:
-        best_category = max(scores, key=scores.get)
-        automation_potential = OLI_BENCHMARK_TASKS[best_category]['automation_potential']
-        return best_category, automation_potential
-    else:
-        return 'Unclassified', 0.0
+@st.cache_resource
+def get_classification_memo():
+    """LRU memo of classified descriptions, shared by both taxonomies, sessions and reruns"""
+    return ClassificationMemo(maxsize=CLASSIFICATION_MEMO_SIZE)
 
-@st.cache_data
-def load_data(csv_path):
-    """Load and preprocess the CSV data"""
-    df = pd.read_csv(csv_path, encoding='utf-8-sig')
-    
-    # Convert date to datetime
-    df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y', errors='coerce')
-    
-    # Convert hours to numeric
-    df['Hours'] = pd.to_numeric(df['Hours'], errors='coerce')
-    
-    # Fill NaN hours with 0
-    df['Hours'] = df['Hours'].fillna(0)
-    
-    # Extract year and month
-    df['Year'] = df['Date'].dt.year
-    df['Month'] = df['Date'].dt.month
-    df['Month_Name'] = df['Date'].dt.strftime('%B')
-    df['Quarter'] = df['Date'].dt.quarter
-    
-    return df
+@st.cache_data(show_spinner=False)
+def file_hash(csv_path, mtime, size):
+    """Content hash of the CSV (cached per path, modification time and size; reused from the columnar cache)"""
+    return csv_sha256(csv_path)
 
-def classify_task(description):
-    """Classify a task description into LegalBench categories"""
-    if pd.isna(description):
-        return 'Unclassified', 0.0
-    
-    description_lower = description.lower()
+def classify_rows(df):
+    """Add LegalBench and OLI category and potential columns to a frame (in place), through the shared memo"""
+    return classify_activity_rows(df, memo=get_classification_memo(), workers=CLASSIFY_WORKERS)
+
+# Shared row data lives in st.cache_resource: one read-only frame for all sessions and reruns
+# instead of the deep copy st.cache_data hands out on every call. Never modify it after load.
+SHARED_DATA_VERSIONS = 2
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def classify_data(csv_path, content_hash, taxonomy_version):
+    """Load the CSV, count flat fee entries as 1 hour and classify every row once (shared, per content and taxonomy)"""
+    return prepare_activities(csv_path, memo=get_classification_memo(), workers=CLASSIFY_WORKERS)
+
+# Files above this size default to streaming mode
+STREAMING_THRESHOLD_BYTES = 1 << 30
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def stream_data(csv_path, content_hash, taxonomy_version):
+    """Classify and aggregate the CSV chunk by chunk, never holding all rows (cached like classify_data)"""
+    def prepare(chunk):
+        add_derived_columns(chunk)
+        apply_flat_fee_hours(chunk)
+        return classify_rows(chunk)
     
-    # Score each category
-    scores = {}
-    for category, info in LEGALBENCH_TASKS.items():
-        score = sum(1 for keyword in info['keywords'] if keyword in description_lower)
-        if score > 0:
-            scores[category] = score
-    
-    if scores:
-        best_category = max(scores, key=scores.get)
-        automation_potential = LEGALBENCH_TASKS[best_category]['automation_potential']
-        return best_category, automation_potential
-    else:
-        return 'Unclassified', 0.3
+    return stream_aggregates(iter_activity_chunks(csv_path), prepare)
+
+# Directory of daily activities_<timestamp>.csv exports; when it has files it replaces the single CSV
+EXPORT_DIR = os.environ.get('ACTIVITY_EXPORT_DIR', 'exports')
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def load_activity_store(export_dir, store_version):
+    """Every classified row of the export store, flat fees counted as 1 hour (shared, per store version)"""
+    return apply_flat_fee_hours(read_activity_store(export_dir))
+
+# Output of `python pipeline.py` (headless batch run); when present it replaces all of the above
+ARTIFACT_DIR = os.environ.get('ACTIVITY_ARTIFACT_DIR', 'artifacts')
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def load_artifacts(artifact_dir, data_version):
+    """Precomputed (rows, cube) from a batch run (shared, per artifact version)"""
+    return read_artifacts(artifact_dir)
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def build_cube(_df, data_version):
+    """Aggregate cube that every chart and metric rolls up from (cached per data version)"""
+    return compact_aggregates(aggregate_activities(_df))
 
-def extract_keywords(descriptions):
-    """Extract common keywords from descriptions"""
-    all_words = []
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                  'of', 'with', 're', 'from', 'by', 'as', 'is', 'was', 'be', 'been',
-                  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                  'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
-    
-    for desc in descriptions:
-        if pd.notna(desc):
-            words = re.findall(r'\b[a-z]{4,}\b', desc.lower())
-            all_words.extend([w for w in words if w not in stop_words])
-    
-    return Counter(all_words).most_common(30)
+@st.cache_resource(show_spinner=False, max_entries=2 * SHARED_DATA_VERSIONS)
+def filter_index(_frame, data_version, level):
+    """Row bitmaps for the sidebar filters over the 'rows' or 'cube' frame (shared, per data version)"""
+    return FilterIndex(_frame)
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def matter_labels(_cube, data_version):
+    """'number - description' label per matter number, for searching the matter filter (shared, per data version)"""
+    pairs = _cube[['Matter number', 'Matter description']].dropna(subset=['Matter number'])
+    pairs = pairs.drop_duplicates('Matter number').astype(object)
+    numbers = pairs['Matter number'].astype(str)
+    labels = pd.Series((numbers + ' - ' + pairs['Matter description'].fillna('').astype(str)).to_numpy(),
+                       index=numbers.to_numpy())
+    return labels.sort_index()
+
+def entry_count(frame):
+    """Number of time entries behind a row-level or aggregated frame"""
+    return int(frame['Entries'].sum()) if 'Entries' in frame else len(frame)
+
+def mean_automation_potential(frame):
+    """Per-entry average LegalBench automation potential of a row-level or aggregated frame"""
+    if 'Entries' not in frame:
+        return frame['Automation_Potential'].mean()
+    entries = frame['Entries'].sum()
+    return (frame['Automation_Potential'] * frame['Entries']).sum() / entries if entries else np.nan
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_DATA_VERSIONS)
+def description_index(_df, data_version, artifact_dir=None):
+    """Token, keyword and category postings over the row descriptions (built once per data version)
+
+    Artifacts from the batch pipeline carry a persisted index, so it survives restarts.
+    """
+    index = read_artifact_index(artifact_dir) if artifact_dir is not None else None
+    if index is None:
+        index = DescriptionIndex(_df['Description'], _df['Task_Category'], LEGALBENCH_MATCHER)
+    return index
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_keywords(_index, _df, _selected_rows, selection_key):
+    """Common keywords of the selected high-automation (> 70%) rows (cached per filter selection)"""
+    high_automation = _selected_rows & (_df['Automation_Potential'] > 0.7).to_numpy()
+    return _index.top_tokens(np.flatnonzero(high_automation), n=30)
 
 def check_password():
     """Returns `True` if the user had the correct password."""
@@ -582,6 +220,8 @@ def check_password():
         return True
 
 def main():
+    run_started = time.perf_counter()
+    
     # Check password first
     if not check_password():
         return
@@ -602,7 +242,6 @@ def main():
     # Load data
     try:
         # Try the filename with spaces first (as uploaded)
-        import os
         csv_path = None
         
         # Check for the file with spaces
@@ -611,1336 +250,1938 @@ def main():
         # Also check for underscore version
         elif os.path.exists('activities_2025-10-30_10-21-00.csv'):
             csv_path = 'activities_2025-10-30_10-21-00.csv'
-        else:
+        
+        # Precomputed artifacts take precedence (no classification on request),
+        # then a directory of daily exports, then a single CSV
+        artifact_manifest = read_artifact_manifest(ARTIFACT_DIR)
+        use_artifacts = artifact_manifest is not None
+        use_export_store = not use_artifacts and bool(list_export_files(EXPORT_DIR))
+        if csv_path is None and not use_export_store and not use_artifacts:
             # List available files to help debug
             available_files = os.listdir('/mnt/user-data/uploads/')
             st.error(f"❌ CSV file not found. Available files: {', '.join(available_files)}")
             st.info("💡 Please ensure your CSV file is uploaded to /mnt/user-data/uploads/")
             return
         
-        df = load_data(csv_path)
+        # Streaming mode keeps only additive aggregates, for CSVs too large to hold in memory
+        streaming = False
+        if not use_export_store and not use_artifacts:
+            stat = os.stat(csv_path)
+            streaming = st.sidebar.toggle(
+                "🌊 Streaming mode",
+                value=stat.st_size > STREAMING_THRESHOLD_BYTES,
+                help="Aggregate the CSV in chunks instead of loading every row. "
+                     "Description-level views are unavailable in this mode."
+            )
+        
+        # Classification runs once per file (or once per new export row); filter changes reuse the cached columns
+        with st.spinner("🤖 Analyzing tasks for AI automation potential..."):
+            if use_artifacts:
+                data_version = artifact_manifest['version']
+                df, cube = load_artifacts(ARTIFACT_DIR, data_version)
+            else:
+                if use_export_store:
+                    store_summary = update_activity_store(EXPORT_DIR, classify_rows, TAXONOMY_VERSION)
+                    data_version = store_summary['version']
+                    df = load_activity_store(EXPORT_DIR, data_version)
+                else:
+                    content_hash = file_hash(csv_path, stat.st_mtime_ns, stat.st_size)
+                    data_version = f"{content_hash}-{TAXONOMY_VERSION}"
+                    if streaming:
+                        # A different frame from the same file, so its derived caches need their own key
+                        data_version += '-streamed'
+                        df = stream_data(csv_path, content_hash, TAXONOMY_VERSION)
+                    else:
+                        df = classify_data(csv_path, content_hash, TAXONOMY_VERSION)
+                
+                # Every chart rolls up from this cube instead of rescanning the rows
+                # (streaming already produced it)
+                cube = df if streaming else build_cube(df, data_version)
+        
+        if use_artifacts:
+            st.sidebar.info(f"📦 Precomputed by the batch pipeline at {artifact_manifest['created_at']}")
+        
+        if use_export_store and (store_summary['new_rows'] or store_summary['reclassified_rows']):
+            st.sidebar.info(
+                f"📥 {store_summary['new_rows']:,} new rows from {store_summary['new_files']} export(s); "
+                f"{store_summary['duplicate_rows']:,} already-stored rows skipped"
+            )
         
-        # Handle flat fee entries - count them as 1 hour
-        df['Original_Hours'] = df['Hours'].copy()
-        df.loc[df['Flat rate'] == 'true', 'Hours'] = 1.0
+        if use_export_store and store_summary['rejected_files']:
+            st.sidebar.warning(
+                "⚠️ Skipped unreadable export(s): "
+                + "; ".join(f"{name} ({error})" for name, error in store_summary['rejected_files'].items())
+            )
         
-        st.sidebar.success(f"✅ Loaded {len(df):,} activities")
+        st.sidebar.success(f"✅ Loaded {entry_count(cube):,} activities")
         
         # Show flat fee info
-        flat_fee_count = (df['Flat rate'] == 'true').sum()
+        flat_fee_count = cube['Flat_Fee_Entries'].sum()
         if flat_fee_count > 0:
             st.sidebar.info(f"ℹ️ {flat_fee_count:,} flat fee entries counted as 1 hour each")
+        
+        # Values that did not fit the declared CSV schema
+        schema_errors = df.attrs.get('schema_errors', {})
+        if schema_errors:
+            st.sidebar.warning(
+                "⚠️ Rows failing the CSV schema: " +
+                ", ".join(f"{column} ({info['count']:,})" for column, info in schema_errors.items())
+            )
+            with st.sidebar.expander("Schema issues", expanded=False):
+                for column, info in schema_errors.items():
+                    st.caption(f"**{column}** - first lines: {', '.join(map(str, info['lines']))}")
+        
+        # Classification memo counters (dedup ratio = rows per unique description)
+        memo_stats = get_classification_memo().stats()
+        with st.sidebar.expander("🧠 Classification Cache", expanded=False):
+            st.caption(
+                f"Memo: {memo_stats['hits']:,} hits / {memo_stats['misses']:,} misses "
+                f"({memo_stats['hit_rate']*100:.1f}% hit rate), "
+                f"{memo_stats['size']:,} of {memo_stats['maxsize']:,} entries"
+            )
+            st.caption(
+                f"Dedup: {memo_stats['rows']:,} rows → {memo_stats['unique_descriptions']:,} unique "
+                f"descriptions ({memo_stats['dedup_ratio']:.1f}x)"
+            )
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.info("💡 Make sure your CSV file is in /mnt/user-data/uploads/ directory")
         return
     
-    # Filters
-    st.sidebar.subheader("🔍 Filters")
+    # Per-value row bitmaps for the rows and for the cube, built once per dataset
+    row_filters = filter_index(df, data_version, 'rows')
+    cube_filters = filter_index(cube, data_version, 'cube') if cube is not df else row_filters
     
-    # Year filter
-    years = sorted(df['Year'].dropna().unique())
-    selected_years = st.sidebar.multiselect("Select Years", years, default=years)
+    # Filters (edited in their own fragment; the dashboard follows the applied selection)
+    with st.sidebar:
+        filter_panel(cube, cube_filters, matter_labels(cube, data_version))
+    selection = st.session_state['applied_filters']
     
-    # User filter
-    users = sorted(df['User'].dropna().unique())
-    selected_users = st.sidebar.multiselect("Select Users", users, default=[])
-    
-    # Apply filters
-    filtered_df = df[df['Year'].isin(selected_years)]
-    if selected_users:
-        filtered_df = filtered_df[filtered_df['User'].isin(selected_users)]
-    
-    # Classify tasks
-    with st.spinner("🤖 Analyzing tasks for AI automation potential..."):
-        filtered_df[['Task_Category', 'Automation_Potential']] = filtered_df['Description'].apply(
-            lambda x: pd.Series(classify_task(x))
-        )
+    # Identifies the filtered data for caches of per-selection results
+    selection_key = (data_version, tuple(selection['years']), tuple(selection['users']),
+                     tuple(selection['matters']), selection['periods'])
+    
+    # Row views read through this mask; the shared frame is never copied per session
+    selected_rows = selection_mask(row_filters, selection)
     
-    # Calculate automation hours
-    filtered_df['Automatable_Hours'] = filtered_df['Hours'] * filtered_df['Automation_Potential']
-    filtered_df['Manual_Hours'] = filtered_df['Hours'] - filtered_df['Automatable_Hours']
+    # Inverted index for description drilldowns (streaming mode keeps no descriptions)
+    index = (description_index(df, data_version, ARTIFACT_DIR if use_artifacts else None)
+             if 'Description' in df else None)
+    
+    # Charts and metrics roll up from the (much smaller) aggregate cube
+    filtered_cube = cube[selection_mask(cube_filters, selection)]
+    
+    # Cost Savings inputs are also read by Predictions, so they outlive their tab
+    keep_cost_assumptions()
+    
+    # Lazy mode tracks the open tab and renders only that one; the rest cost nothing until opened
+    lazy_tabs = st.sidebar.toggle(
+        "⚡ Render only the open tab",
+        value=True,
+        help="Switching tabs then reruns the app and computes the newly opened tab"
+    )
     
     # Main tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    tabs = st.tabs([
         "📈 Overview (LegalBench)", 
         "🎯 OLI Benchmark",
         "🤖 Automation Analysis", 
         "💰 Cost Savings", 
         "🔮 Predictions",
         "📚 Task Definitions"
-    ])
+    ], key="main_tab", on_change="rerun" if lazy_tabs else "ignore")
     
-    # TAB 1: Overview
-    with tab1:
-        st.header("Overview Dashboard")
-        
+    renderers = [
+        lambda: render_overview_tab(filtered_cube),
+        lambda: render_oli_tab(filtered_cube),
+        lambda: render_automation_tab(df, filtered_cube, index, selected_rows, selection_key),
+        # As a fragment its inputs rerun only that tab; with every tab rendered, Predictions
+        # also reads them, so those reruns stay full
+        lambda: (cost_savings_panel if lazy_tabs else render_cost_savings_tab)(filtered_cube, selection_key),
+        lambda: render_predictions_tab(filtered_cube, selection_key),
+        lambda: render_task_definitions_tab(index, selected_rows, selection_key),
+    ]
+    for tab, render in zip(tabs, renderers):
+        with tab:
+            # open is None when the tab selection is not tracked (every tab renders)
+            if tab.open is not False:
+                render()
+    
+    record_timing('Full app', run_started)
+    render_timing_panel()
+
+# Reruns remembered per region for the timing panel
+TIMING_HISTORY = 20
+
+def record_timing(region, started):
+    """Log the seconds since `started` (a perf_counter value) for a rerun region of this session"""
+    log = st.session_state.setdefault('rerun_timings', {}).setdefault(region, [])
+    log.append(time.perf_counter() - started)
+    del log[:-TIMING_HISTORY]
+
+def render_timing_panel():
+    """Sidebar debug panel: rerun time per region and the time a fragment rerun saves (as of the last full run)"""
+    timings = st.session_state.get('rerun_timings', {})
+    full_runs = timings.get('Full app', [])
+    full_mean = sum(full_runs) / len(full_runs) if full_runs else None
+    with st.sidebar.expander("⏱️ Rerun Timings", expanded=False):
+        for region, log in timings.items():
+            mean = sum(log) / len(log)
+            line = f"**{region}**: last {log[-1]*1000:,.0f} ms, mean {mean*1000:,.0f} ms ({len(log)} runs)"
+            if region != 'Full app' and full_mean is not None:
+                line += f" · saves ~{(full_mean - mean)*1000:,.0f} ms per interaction"
+            st.caption(line)
+
+def selection_mask(filters, selection):
+    """AND of an applied filter selection over one frame's bitmaps"""
+    mask = filters.select('Year', selection['years'])
+    if selection['users']:
+        mask &= filters.select('User', selection['users'])
+    if selection['matters']:
+        mask &= filters.select('Matter number', selection['matters'])
+    if selection['periods']:
+        mask &= filters.period_range(*selection['periods'])
+    return mask
+
+# Matter filter options sent to the browser per search (selected matters are always included)
+MATTER_OPTION_LIMIT = 200
+
+@st.fragment
+def filter_panel(cube, cube_filters, matter_labels):
+    """Sidebar filters; edits rerun only this panel until they are applied to the dashboard"""
+    started = time.perf_counter()
+    st.subheader("🔍 Filters")
+    
+    # Year filter
+    years = cube_filters.options('Year')
+    selected_years = st.multiselect("Select Years", years, default=years)
+    
+    # User filter
+    users = cube_filters.options('User')
+    selected_users = st.multiselect("Select Users", users, default=[])
+    
+    # Matter filter: searched server-side, so only a capped list of matters reaches the browser
+    matter_search = st.text_input("Search Matters", placeholder="Matter number or description",
+                                  key="matter_search")
+    matches = matter_labels
+    if matter_search:
+        matches = matter_labels[matter_labels.str.contains(matter_search, case=False, regex=False)]
+    selected_matters = st.session_state.get('matter_filter', [])
+    matter_options = list(dict.fromkeys(selected_matters + matches.index[:MATTER_OPTION_LIMIT].tolist()))
+    if len(matches) > MATTER_OPTION_LIMIT:
+        st.caption(f"Showing {MATTER_OPTION_LIMIT} of {len(matches):,} matching matters; refine the search")
+    selected_matters = st.multiselect(
+        "Select Matters",
+        matter_options,
+        format_func=lambda matter: matter_labels.get(matter, matter),
+        key="matter_filter"
+    )
+    
+    # Month range filter (None means every month)
+    periods = cube_filters.periods.tolist()
+    selected_periods = None
+    if len(periods) > 1:
+        selected_periods = st.select_slider(
+            "Date Range",
+            options=periods,
+            value=(periods[0], periods[-1]),
+            format_func=lambda period: period_labels([period])[0]
+        )
+        if tuple(selected_periods) == (periods[0], periods[-1]):
+            selected_periods = None
+    
+    selection = {
+        'years': list(selected_years),
+        'users': list(selected_users),
+        'matters': list(selected_matters),
+        'periods': tuple(selected_periods) if selected_periods else None,
+    }
+    applied = st.session_state.setdefault('applied_filters', selection)
+    if selection != applied:
+        # Previewed from the bitmaps; the rest of the dashboard reruns only on apply
+        entries = cube['Entries'][selection_mask(cube_filters, selection)].sum()
+        st.caption(f"{entries:,} entries match the edited filters")
+        if st.button("✅ Apply filters", type="primary"):
+            st.session_state['applied_filters'] = selection
+            st.rerun()
+    
+    record_timing('Filters panel', started)
+
+@st.fragment
+def cost_savings_panel(filtered_cube, selection_key):
+    """Cost Savings tab as a fragment, so its inputs rerun only this tab"""
+    started = time.perf_counter()
+    render_cost_savings_tab(filtered_cube, selection_key)
+    record_timing('Cost Savings panel', started)
+
+# Cost Savings inputs (session state key -> default)
+COST_ASSUMPTION_DEFAULTS = {
+    'avg_hourly_rate': 500,
+    'ai_efficiency_gain_pct': 60,
+    'ai_cost_per_hour': 10,
+}
+
+def keep_cost_assumptions():
+    """Seed the Cost Savings inputs and keep their values while their tab is not rendered"""
+    for key, default in COST_ASSUMPTION_DEFAULTS.items():
+        st.session_state[key] = st.session_state.get(key, default)
+
+def cost_assumptions():
+    """Current (hourly rate, efficiency gain fraction, AI cost per hour) from the Cost Savings inputs"""
+    return (
+        st.session_state['avg_hourly_rate'],
+        st.session_state['ai_efficiency_gain_pct'] / 100,
+        st.session_state['ai_cost_per_hour'],
+    )
+
+def render_overview_tab(filtered_cube):
+    """Overview tab: LegalBench headline metrics, monthly trends and category breakdown"""
+    st.header("Overview Dashboard")
+    
+    st.markdown("""
+    ### 🎯 Understanding AI Automation Potential
+    This analysis is based on the **LegalBench framework** - a research-backed benchmark that evaluates 
+    how well AI can perform 162+ specific legal tasks. Each task category has been assigned an automation 
+    potential based on current AI capabilities.
+    
+    **Note:** *Flat fee entries are counted as 1 hour for analysis purposes.*
+    """)
+    
+    # Add methodology expander
+    with st.expander("📊 **How We Calculate Your Automation Potential**", expanded=False):
         st.markdown("""
-        ### 🎯 Understanding AI Automation Potential
-        This analysis is based on the **LegalBench framework** - a research-backed benchmark that evaluates 
-        how well AI can perform 162+ specific legal tasks. Each task category has been assigned an automation 
-        potential based on current AI capabilities.
-        
-        **Note:** *Flat fee entries are counted as 1 hour for analysis purposes.*
+        #### Calculation Methodology
+        
+        **Step 1: Task Classification**
+        - We scan each time entry description for specific keywords
+        - Match activities to one of 37 LegalBench task categories
+        - Examples: Contract Review, Legal Research, Document Discovery, etc.
+        
+        **Step 2: Apply Automation Potential**
+        - Each category has a researched automation potential (55%-96%)
+        - Based on LegalBench research and current AI capabilities
+        - Higher % = more suitable for AI assistance
+        
+        **Step 3: Calculate Automatable Hours**
+        ```
+        Automatable Hours = Total Hours × Automation Potential %
+        
+        Example:
+        • Task: Contract Review (92% automation potential)
+        • Time Spent: 100 hours
+        • Automatable: 100 × 0.92 = 92 hours
+        • Manual Oversight: 8 hours
+        ```
+        
+        #### 🤖 What Makes Hours "Automatable"?
+        
+        **High Automation Potential (85-96%):**
+        - ✅ Repetitive tasks (same type of review/analysis)
+        - ✅ Rule-based decisions (clear criteria)
+        - ✅ Pattern matching (finding similar clauses/cases)
+        - ✅ Data extraction (pulling specific information)
+        - ✅ Initial document review and categorization
+        - ✅ Research and citation checking
+        - ✅ Form completion and template population
+        
+        **Examples:**
+        - Contract clause identification (92% automatable)
+        - Legal research and case finding (90% automatable)
+        - Document classification (93% automatable)
+        - Privacy policy review (90% automatable)
+        
+        **Lower Automation Potential (55-70%):**
+        - ⚠️ Strategic decision-making
+        - ⚠️ Creative legal writing
+        - ⚠️ Complex negotiations
+        - ⚠️ Client relationship management
+        - ⚠️ Novel legal arguments
+        
+        #### 💡 Important Notes
+        - "Automatable" means AI can **assist or accelerate** the work
+        - Human oversight and final judgment always required
+        - Automation frees attorneys for higher-value strategic work
+        - Based on 2024-2025 AI capabilities (GPT-4, Claude, etc.)
         """)
+    
+    st.markdown("---")
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_hours = filtered_cube['Hours'].sum()
+    automatable_hours = filtered_cube['Automatable_Hours'].sum()
+    automation_rate = (automatable_hours / total_hours * 100) if total_hours > 0 else 0
+    
+    with col1:
+        st.metric(
+            label="Total Hours Logged",
+            value=f"{total_hours:,.0f}",
+            delta=None
+        )
+    
+    with col2:
+        st.metric(
+            label="AI-Automatable Hours",
+            value=f"{automatable_hours:,.0f}",
+            delta=f"{automation_rate:.1f}% of total",
+            help="Hours that could be accelerated with AI assistance"
+        )
+    
+    with col3:
+        total_billable = filtered_cube['Billable ($)'].sum()
+        st.metric(
+            label="Total Billable",
+            value=f"${total_billable:,.0f}"
+        )
+    
+    with col4:
+        unique_matters = filtered_cube['Matter number'].nunique()
+        st.metric(
+            label="Unique Matters",
+            value=f"{unique_matters:,}"
+        )
+    
+    st.markdown("---")
+    
+    # Add new visualization: Automation potential breakdown
+    st.subheader("💰 What Could Have Been Saved This Year with AI")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        # Stacked area chart showing potential savings over time
+        monthly_data = rollup(
+            filtered_cube, ['Year', 'Month', 'Month_Name'],
+            ['Hours', 'Automatable_Hours', 'Manual_Hours']
+        )
+        monthly_data = monthly_data.sort_values(['Year', 'Month'])
+        monthly_data['Period'] = monthly_data['Month_Name'] + ' ' + monthly_data['Year'].astype(str)
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=monthly_data['Period'],
+            y=monthly_data['Automatable_Hours'],
+            name='AI-Automatable',
+            mode='lines',
+            line=dict(width=0.5, color='rgb(34, 139, 34)'),
+            stackgroup='one',
+            fillcolor='rgba(34, 139, 34, 0.6)',
+            hovertemplate='%{y:.0f} automatable hours<extra></extra>'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=monthly_data['Period'],
+            y=monthly_data['Manual_Hours'],
+            name='Human-Required',
+            mode='lines',
+            line=dict(width=0.5, color='rgb(255, 140, 0)'),
+            stackgroup='one',
+            fillcolor='rgba(255, 140, 0, 0.6)',
+            hovertemplate='%{y:.0f} manual hours<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title='Monthly Hours: AI-Automatable vs. Human-Required',
+            xaxis_title='Month',
+            yaxis_title='Hours',
+            height=400,
+            hovermode='x unified',
+            showlegend=True
+        )
         
-        # Add methodology expander
-        with st.expander("📊 **How We Calculate Your Automation Potential**", expanded=False):
-            st.markdown("""
-            #### Calculation Methodology
-            
-            **Step 1: Task Classification**
-            - We scan each time entry description for specific keywords
-            - Match activities to one of 37 LegalBench task categories
-            - Examples: Contract Review, Legal Research, Document Discovery, etc.
-            
-            **Step 2: Apply Automation Potential**
-            - Each category has a researched automation potential (55%-96%)
-            - Based on LegalBench research and current AI capabilities
-            - Higher % = more suitable for AI assistance
-            
-            **Step 3: Calculate Automatable Hours**
-            ```
-            Automatable Hours = Total Hours × Automation Potential %
-            
-            Example:
-            • Task: Contract Review (92% automation potential)
-            • Time Spent: 100 hours
-            • Automatable: 100 × 0.92 = 92 hours
-            • Manual Oversight: 8 hours
-            ```
-            
-            #### 🤖 What Makes Hours "Automatable"?
-            
-            **High Automation Potential (85-96%):**
-            - ✅ Repetitive tasks (same type of review/analysis)
-            - ✅ Rule-based decisions (clear criteria)
-            - ✅ Pattern matching (finding similar clauses/cases)
-            - ✅ Data extraction (pulling specific information)
-            - ✅ Initial document review and categorization
-            - ✅ Research and citation checking
-            - ✅ Form completion and template population
-            
-            **Examples:**
-            - Contract clause identification (92% automatable)
-            - Legal research and case finding (90% automatable)
-            - Document classification (93% automatable)
-            - Privacy policy review (90% automatable)
-            
-            **Lower Automation Potential (55-70%):**
-            - ⚠️ Strategic decision-making
-            - ⚠️ Creative legal writing
-            - ⚠️ Complex negotiations
-            - ⚠️ Client relationship management
-            - ⚠️ Novel legal arguments
-            
-            #### 💡 Important Notes
-            - "Automatable" means AI can **assist or accelerate** the work
-            - Human oversight and final judgment always required
-            - Automation frees attorneys for higher-value strategic work
-            - Based on 2024-2025 AI capabilities (GPT-4, Claude, etc.)
-            """)
-        
-        st.markdown("---")
-        
-        # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        total_hours = filtered_df['Hours'].sum()
-        automatable_hours = filtered_df['Automatable_Hours'].sum()
-        automation_rate = (automatable_hours / total_hours * 100) if total_hours > 0 else 0
-        
-        with col1:
-            st.metric(
-                label="Total Hours Logged",
-                value=f"{total_hours:,.0f}",
-                delta=None
-            )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Pie chart showing overall split
+        fig = go.Figure(data=[go.Pie(
+            labels=['AI-Automatable Hours', 'Human-Required Hours'],
+            values=[automatable_hours, total_hours - automatable_hours],
+            hole=0.5,
+            marker_colors=['#228B22', '#FF8C00'],
+            textinfo='label+percent',
+            textposition='outside'
+        )])
+        
+        fig.update_layout(
+            title='Overall Work Distribution',
+            height=400,
+            showlegend=False,
+            annotations=[dict(
+                text=f'{automation_rate:.1f}%<br>Automatable',
+                x=0.5, y=0.5,
+                font_size=20,
+                showarrow=False
+            )]
+        )
         
-        with col2:
-            st.metric(
-                label="AI-Automatable Hours",
-                value=f"{automatable_hours:,.0f}",
-                delta=f"{automation_rate:.1f}% of total",
-                help="Hours that could be accelerated with AI assistance"
-            )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Add automation potential by category (excluding unclassified)
+    st.subheader("📊 Top Automation Opportunities by Task Type")
+    
+    # Filter out unclassified and get top categories
+    # (a category's potential is constant, so it can ride along as a key)
+    category_data = rollup(
+        filtered_cube[filtered_cube['Task_Category'] != 'Unclassified'],
+        ['Task_Category', 'Automation_Potential'], ['Hours', 'Automatable_Hours']
+    )
+    category_data = category_data.sort_values('Automatable_Hours', ascending=False).head(12)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Bar chart of top automatable categories
+        fig = px.bar(
+            category_data,
+            x='Automatable_Hours',
+            y='Task_Category',
+            orientation='h',
+            title='Top 12 Categories by AI-Automatable Hours',
+            labels={'Automatable_Hours': 'AI-Automatable Hours', 'Task_Category': 'Task Category'},
+            color='Automation_Potential',
+            color_continuous_scale='Greens',
+            text='Automatable_Hours'
+        )
         
-        with col3:
-            total_billable = filtered_df['Billable ($)'].apply(
-                lambda x: float(x) if pd.notna(x) and str(x).strip() else 0
-            ).sum()
-            st.metric(
-                label="Total Billable",
-                value=f"${total_billable:,.0f}"
-            )
+        fig.update_traces(
+            texttemplate='%{text:.0f}h',
+            textposition='outside'
+        )
         
-        with col4:
-            unique_matters = filtered_df['Matter number'].nunique()
-            st.metric(
-                label="Unique Matters",
-                value=f"{unique_matters:,}"
+        fig.update_layout(
+            height=500,
+            yaxis={'categoryorder': 'total ascending'},
+            xaxis_title='Hours',
+            coloraxis_colorbar=dict(
+                title="Automation<br>Potential"
             )
+        )
         
-        st.markdown("---")
-        
-        # Add new visualization: Automation potential breakdown
-        st.subheader("💰 What Could Have Been Saved This Year with AI")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Show potential time savings percentage by category
+        category_data['Potential_Savings_Pct'] = category_data['Automation_Potential'] * 100
         
-        col1, col2 = st.columns([3, 2])
+        fig = go.Figure()
         
-        with col1:
-            # Stacked area chart showing potential savings over time
-            monthly_data = filtered_df.groupby(['Year', 'Month', 'Month_Name']).agg({
-                'Hours': 'sum',
-                'Automatable_Hours': 'sum',
-                'Manual_Hours': 'sum'
-            }).reset_index()
-            monthly_data = monthly_data.sort_values(['Year', 'Month'])
-            monthly_data['Period'] = monthly_data['Month_Name'] + ' ' + monthly_data['Year'].astype(str)
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=monthly_data['Period'],
-                y=monthly_data['Automatable_Hours'],
-                name='AI-Automatable',
-                mode='lines',
-                line=dict(width=0.5, color='rgb(34, 139, 34)'),
-                stackgroup='one',
-                fillcolor='rgba(34, 139, 34, 0.6)',
-                hovertemplate='%{y:.0f} automatable hours<extra></extra>'
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=monthly_data['Period'],
-                y=monthly_data['Manual_Hours'],
-                name='Human-Required',
-                mode='lines',
-                line=dict(width=0.5, color='rgb(255, 140, 0)'),
-                stackgroup='one',
-                fillcolor='rgba(255, 140, 0, 0.6)',
-                hovertemplate='%{y:.0f} manual hours<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                title='Monthly Hours: AI-Automatable vs. Human-Required',
-                xaxis_title='Month',
-                yaxis_title='Hours',
-                height=400,
-                hovermode='x unified',
-                showlegend=True
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        fig.add_trace(go.Bar(
+            y=category_data['Task_Category'],
+            x=category_data['Hours'],
+            name='Total Hours',
+            orientation='h',
+            marker_color='lightblue',
+            text=category_data['Hours'].round(0),
+            textposition='inside'
+        ))
+        
+        fig.update_layout(
+            title='Total Hours by Category<br><sub>Darker green = higher automation potential</sub>',
+            xaxis_title='Hours',
+            yaxis_title='',
+            height=500,
+            yaxis={'categoryorder': 'total ascending'},
+            showlegend=False
+        )
         
-        with col2:
-            # Pie chart showing overall split
-            fig = go.Figure(data=[go.Pie(
-                labels=['AI-Automatable Hours', 'Human-Required Hours'],
-                values=[automatable_hours, total_hours - automatable_hours],
-                hole=0.5,
-                marker_colors=['#228B22', '#FF8C00'],
-                textinfo='label+percent',
-                textposition='outside'
-            )])
-            
-            fig.update_layout(
-                title='Overall Work Distribution',
-                height=400,
-                showlegend=False,
-                annotations=[dict(
-                    text=f'{automation_rate:.1f}%<br>Automatable',
-                    x=0.5, y=0.5,
-                    font_size=20,
-                    showarrow=False
-                )]
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        # Add color coding based on automation potential
+        colors = category_data['Automation_Potential'].apply(
+            lambda x: f'rgba(34, 139, 34, {x})' if x > 0.8 else 
+                     f'rgba(255, 165, 0, {x})' if x > 0.7 else 
+                     f'rgba(255, 99, 71, {x})'
+        )
+        fig.data[0].marker.color = colors
         
-        st.markdown("---")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Time series
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📅 Monthly Trend Analysis")
+        monthly_data = rollup(filtered_cube, ['Year', 'Month', 'Month_Name'], ['Hours', 'Automatable_Hours'])
+        monthly_data = monthly_data.sort_values(['Year', 'Month'])
+        monthly_data['Period'] = monthly_data['Month_Name'] + ' ' + monthly_data['Year'].astype(str)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=monthly_data['Period'],
+            y=monthly_data['Hours'],
+            name='Total Hours',
+            marker_color='lightblue',
+            text=monthly_data['Hours'].round(0),
+            textposition='outside'
+        ))
+        fig.add_trace(go.Bar(
+            x=monthly_data['Period'],
+            y=monthly_data['Automatable_Hours'],
+            name='AI-Automatable',
+            marker_color='darkgreen',
+            text=monthly_data['Automatable_Hours'].round(0),
+            textposition='inside'
+        ))
+        fig.update_layout(
+            barmode='overlay',
+            height=400,
+            hovermode='x unified',
+            xaxis_tickangle=-45
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("👥 Top 10 Users by Hours")
+        user_hours = rollup(filtered_cube, ['User'], ['Hours', 'Automatable_Hours'])
+        user_hours = user_hours.sort_values('Hours', ascending=False).head(10)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            y=user_hours['User'],
+            x=user_hours['Hours'],
+            name='Total Hours',
+            orientation='h',
+            marker_color='lightcoral'
+        ))
+        fig.add_trace(go.Bar(
+            y=user_hours['User'],
+            x=user_hours['Automatable_Hours'],
+            name='AI-Automatable',
+            orientation='h',
+            marker_color='darkred'
+        ))
+        fig.update_layout(
+            barmode='overlay',
+            height=400,
+            hovermode='y unified'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Add potential savings summary box
+    st.markdown("---")
+    st.subheader("💡 Key Insights")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.info(f"""
+        **🤖 AI Could Assist With:**
+        - {automatable_hours:,.0f} hours ({automation_rate:.1f}%)
+        - Equivalent to {automatable_hours/40:.0f} work weeks
+        - Or {automatable_hours/2080:.1f} full-time employees
+        """)
+    
+    with col2:
+        # Calculate average automation rate
+        avg_automation = mean_automation_potential(filtered_cube) * 100
+        st.success(f"""
+        **📈 Average Task Automation:**
+        - {avg_automation:.1f}% automation potential
+        - Based on {entry_count(filtered_cube):,} time entries
+        - Across {unique_matters:,} matters
+        """)
+    
+    with col3:
+        # Get highest automation category
+        top_category = category_data.iloc[0]
+        st.warning(f"""
+        **🎯 Top Opportunity:**
+        - **{top_category['Task_Category']}**
+        - {top_category['Automatable_Hours']:.0f} automatable hours
+        - {top_category['Automation_Potential']*100:.0f}% automation potential
+        """)
+
+def render_oli_tab(filtered_cube):
+    """OLI Benchmark tab: hours split by the OLI taxonomy"""
+    st.header("🎯 OLI Benchmark - Scale Law Firm's Custom Analysis")
+    
+    st.markdown("""
+    ### 📊 Scale Law Firm's AI Automation Estimates
+    This tab uses **OLI Benchmark** - Scale Law Firm's proprietary assessment of which legal tasks 
+    can be automated with AI. Unlike the LegalBench academic framework, this reflects your firm's 
+    real-world experience and specific task categorization.
+    
+    **Note:** *Flat fee entries are counted as 1 hour for analysis purposes.*
+    """)
+    
+    # OLI Methodology explanation
+    with st.expander("📋 **OLI Benchmark Categories & Methodology**", expanded=False):
+        st.markdown("""
+        ### OLI Benchmark Classification
+        
+        Scale Law Firm has identified **6 automation tiers** based on task complexity and AI readiness:
+        
+        #### 🟢 100% AI Replaceable
+        **Standard Contracts & Documents:**
+        - NDAs, MSAs, Employment Agreements
+        - Consultation/Contractor Agreements
+        - Vendor & 1099 Agreements
+        - Lease & Licensing Agreements
+        - IP Assignments, Convertible Notes
+        - Promissory Notes, Releases
+        - Court Orders, Hold Letters
+        - **Document Search Tasks**
+        
+        *These are highly templated tasks where AI can handle the entire workflow with minimal oversight.*
+        
+        #### 🟡 70% AI Replaceable
+        **Legal Research & Discovery:**
+        - Case Law Research
+        - Statutory Interpretation
+        - Bill/Regulation Analysis
+        - Discovery Requests
+        - Written Discovery
+        
+        *AI excels at research but requires human verification and strategic thinking.*
+        
+        #### 🟠 30% AI Replaceable
+        **Complex Agreements:**
+        - Loan Documents, SaaS Agreements
+        - Settlement Agreements
+        - Patent/Trademark Office Actions
+        - Closing & Financing Documents
+        - Motions, Complaints, Answers
+        - Term Sheets, Legal Opinions
+        - Purchase & Sale Agreements
+        
+        *Requires significant human judgment but AI can assist with drafting and analysis.*
+        
+        #### 🔴 20% AI Replaceable
+        **General Drafting & Communications:**
+        - Email Drafting & Responses
+        - Letters & Amendments
+        - General Correspondence
+        - Updates & Communications
+        
+        *Highly contextual and relationship-focused work.*
+        
+        #### ⚫ 0% AI Replaceable
+        **Strategic & Relationship Work:**
+        - Strategy Sessions
+        - Client Conferences
+        - Negotiations
+        - Meetings & Consultations
+        - Any task with: "strategy", "confer", "spoke with", "conference call", "attended"
+        
+        *Pure human work requiring judgment, relationships, and strategic thinking.*
+        
+        ### Calculation Method
+        ```
+        OLI Automatable Hours = Total Hours × OLI Automation %
+        
+        Example:
+        • Task: NDA Review (100% OLI automation)
+        • Time Spent: 10 hours
+        • Automatable: 10 × 1.00 = 10 hours (fully automatable)
+        • Manual Oversight: 0 hours
+        ```
+        """)
+    
+    st.markdown("---")
+    
+    # OLI Key metrics
+    st.subheader("📈 OLI Benchmark Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    oli_total_hours = filtered_cube['Hours'].sum()
+    oli_automatable = filtered_cube['OLI_Automatable_Hours'].sum()
+    oli_automation_rate = (oli_automatable / oli_total_hours * 100) if oli_total_hours > 0 else 0
+    oli_manual = filtered_cube['OLI_Manual_Hours'].sum()
+    
+    with col1:
+        st.metric(
+            label="Total Hours Analyzed",
+            value=f"{oli_total_hours:,.0f}",
+            help="Total hours using OLI classification"
+        )
+        st.caption("📊 All activities reviewed")
+    
+    with col2:
+        st.metric(
+            label="OLI AI-Automatable",
+            value=f"{oli_automatable:,.0f}",
+            delta=f"{oli_automation_rate:.1f}% of total",
+            help="Hours automatable per Scale Law Firm's assessment"
+        )
+        st.caption("🤖 OLI automation potential")
+    
+    with col3:
+        st.metric(
+            label="Human-Required Hours",
+            value=f"{oli_manual:,.0f}",
+            delta=f"{(oli_manual/oli_total_hours*100):.1f}% of total",
+            delta_color="inverse",
+            help="Hours requiring human expertise"
+        )
+        st.caption("👨‍⚖️ Strategic human work")
+    
+    with col4:
+        # Calculate potential savings at $500/hour
+        potential_savings = oli_automatable * 0.60 * 500  # 60% efficiency gain
+        st.metric(
+            label="Potential Annual Savings",
+            value=f"${potential_savings:,.0f}",
+            help="At 60% efficiency gain, $500/hour"
+        )
+        st.caption("💰 Estimated savings")
+    
+    st.markdown("---")
+    
+    # OLI Breakdown visualization
+    st.subheader("💰 What Could Have Been Saved (OLI Benchmark)")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        # OLI Monthly trend
+        oli_monthly = rollup(
+            filtered_cube, ['Year', 'Month', 'Month_Name'],
+            ['Hours', 'OLI_Automatable_Hours', 'OLI_Manual_Hours']
+        )
+        oli_monthly = oli_monthly.sort_values(['Year', 'Month'])
+        oli_monthly['Period'] = oli_monthly['Month_Name'] + ' ' + oli_monthly['Year'].astype(str)
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=oli_monthly['Period'],
+            y=oli_monthly['OLI_Automatable_Hours'],
+            name='AI-Automatable (OLI)',
+            mode='lines',
+            line=dict(width=0.5, color='rgb(0, 128, 0)'),
+            stackgroup='one',
+            fillcolor='rgba(0, 128, 0, 0.7)',
+            hovertemplate='%{y:.0f} automatable hours<extra></extra>'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=oli_monthly['Period'],
+            y=oli_monthly['OLI_Manual_Hours'],
+            name='Human-Required',
+            mode='lines',
+            line=dict(width=0.5, color='rgb(220, 20, 60)'),
+            stackgroup='one',
+            fillcolor='rgba(220, 20, 60, 0.7)',
+            hovertemplate='%{y:.0f} manual hours<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title='OLI Benchmark: Monthly Hours Distribution',
+            xaxis_title='Month',
+            yaxis_title='Hours',
+            height=400,
+            hovermode='x unified',
+            showlegend=True
+        )
         
-        # Add automation potential by category (excluding unclassified)
-        st.subheader("📊 Top Automation Opportunities by Task Type")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # OLI Donut chart
+        fig = go.Figure(data=[go.Pie(
+            labels=['AI-Automatable (OLI)', 'Human-Required'],
+            values=[oli_automatable, oli_manual],
+            hole=0.5,
+            marker_colors=['#008000', '#DC143C'],
+            textinfo='label+percent',
+            textposition='outside'
+        )])
+        
+        fig.update_layout(
+            title='OLI Work Distribution',
+            height=400,
+            showlegend=False,
+            annotations=[dict(
+                text=f'{oli_automation_rate:.1f}%<br>Automatable',
+                x=0.5, y=0.5,
+                font_size=20,
+                showarrow=False
+            )]
+        )
         
-        # Filter out unclassified and get top categories
-        category_data = filtered_df[filtered_df['Task_Category'] != 'Unclassified'].groupby('Task_Category').agg({
-            'Hours': 'sum',
-            'Automatable_Hours': 'sum',
-            'Automation_Potential': 'first'
-        }).reset_index()
-        category_data = category_data.sort_values('Automatable_Hours', ascending=False).head(12)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # OLI Category breakdown
+    st.subheader("📊 OLI Benchmark: Hours by Automation Tier")
+    
+    # Group by OLI categories (exclude Unclassified)
+    oli_category_data = rollup(
+        filtered_cube[filtered_cube['OLI_Category'] != 'Unclassified'],
+        ['OLI_Category', 'OLI_Automation_Potential'], ['Hours', 'OLI_Automatable_Hours']
+    )
+    
+    # Sort by automation potential descending
+    oli_category_data = oli_category_data.sort_values('OLI_Automation_Potential', ascending=False)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Horizontal bar chart by category
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            y=oli_category_data['OLI_Category'],
+            x=oli_category_data['Hours'],
+            name='Total Hours',
+            orientation='h',
+            marker_color='lightblue',
+            text=oli_category_data['Hours'].round(0),
+            textposition='inside'
+        ))
+        
+        fig.add_trace(go.Bar(
+            y=oli_category_data['OLI_Category'],
+            x=oli_category_data['OLI_Automatable_Hours'],
+            name='Automatable',
+            orientation='h',
+            marker_color='darkgreen',
+            text=oli_category_data['OLI_Automatable_Hours'].round(0),
+            textposition='inside'
+        ))
+        
+        fig.update_layout(
+            title='Hours by OLI Category',
+            xaxis_title='Hours',
+            height=450,
+            barmode='overlay',
+            yaxis={'categoryorder': 'array', 'categoryarray': oli_category_data['OLI_Category'].tolist()}
+        )
         
-        col1, col2 = st.columns(2)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Show automation % for each tier
+        fig = px.bar(
+            oli_category_data,
+            y='OLI_Category',
+            x='OLI_Automatable_Hours',
+            orientation='h',
+            title='Automatable Hours by Tier',
+            labels={'OLI_Automatable_Hours': 'Automatable Hours'},
+            color='OLI_Automation_Potential',
+            color_continuous_scale='RdYlGn',
+            text='OLI_Automatable_Hours'
+        )
         
-        with col1:
-            # Bar chart of top automatable categories
-            fig = px.bar(
-                category_data,
-                x='Automatable_Hours',
-                y='Task_Category',
-                orientation='h',
-                title='Top 12 Categories by AI-Automatable Hours',
-                labels={'Automatable_Hours': 'AI-Automatable Hours', 'Task_Category': 'Task Category'},
-                color='Automation_Potential',
-                color_continuous_scale='Greens',
-                text='Automatable_Hours'
-            )
-            
-            fig.update_traces(
-                texttemplate='%{text:.0f}h',
-                textposition='outside'
-            )
-            
-            fig.update_layout(
-                height=500,
-                yaxis={'categoryorder': 'total ascending'},
-                xaxis_title='Hours',
-                coloraxis_colorbar=dict(
-                    title="Automation<br>Potential"
-                )
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        fig.update_traces(
+            texttemplate='%{text:.0f}h',
+            textposition='outside'
+        )
         
-        with col2:
-            # Show potential time savings percentage by category
-            category_data['Potential_Savings_Pct'] = category_data['Automation_Potential'] * 100
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                y=category_data['Task_Category'],
-                x=category_data['Hours'],
-                name='Total Hours',
-                orientation='h',
-                marker_color='lightblue',
-                text=category_data['Hours'].round(0),
-                textposition='inside'
-            ))
-            
-            fig.update_layout(
-                title='Total Hours by Category<br><sub>Darker green = higher automation potential</sub>',
-                xaxis_title='Hours',
-                yaxis_title='',
-                height=500,
-                yaxis={'categoryorder': 'total ascending'},
-                showlegend=False
-            )
-            
-            # Add color coding based on automation potential
-            colors = category_data['Automation_Potential'].apply(
-                lambda x: f'rgba(34, 139, 34, {x})' if x > 0.8 else 
-                         f'rgba(255, 165, 0, {x})' if x > 0.7 else 
-                         f'rgba(255, 99, 71, {x})'
+        fig.update_layout(
+            height=450,
+            yaxis={'categoryorder': 'array', 'categoryarray': oli_category_data['OLI_Category'].tolist()},
+            coloraxis_colorbar=dict(
+                title="Automation<br>%"
             )
-            fig.data[0].marker.color = colors
-            
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Time series
-        col1, col2 = st.columns(2)
+        )
         
-        with col1:
-            st.subheader("📅 Monthly Trend Analysis")
-            monthly_data = filtered_df.groupby(['Year', 'Month', 'Month_Name']).agg({
-                'Hours': 'sum',
-                'Automatable_Hours': 'sum'
-            }).reset_index()
-            monthly_data = monthly_data.sort_values(['Year', 'Month'])
-            monthly_data['Period'] = monthly_data['Month_Name'] + ' ' + monthly_data['Year'].astype(str)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=monthly_data['Period'],
-                y=monthly_data['Hours'],
-                name='Total Hours',
-                marker_color='lightblue',
-                text=monthly_data['Hours'].round(0),
-                textposition='outside'
-            ))
-            fig.add_trace(go.Bar(
-                x=monthly_data['Period'],
-                y=monthly_data['Automatable_Hours'],
-                name='AI-Automatable',
-                marker_color='darkgreen',
-                text=monthly_data['Automatable_Hours'].round(0),
-                textposition='inside'
-            ))
-            fig.update_layout(
-                barmode='overlay',
-                height=400,
-                hovermode='x unified',
-                xaxis_tickangle=-45
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("👥 Top 10 Users by Hours")
-            user_hours = filtered_df.groupby('User').agg({
-                'Hours': 'sum',
-                'Automatable_Hours': 'sum'
-            }).reset_index().sort_values('Hours', ascending=False).head(10)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                y=user_hours['User'],
-                x=user_hours['Hours'],
-                name='Total Hours',
-                orientation='h',
-                marker_color='lightcoral'
-            ))
-            fig.add_trace(go.Bar(
-                y=user_hours['User'],
-                x=user_hours['Automatable_Hours'],
-                name='AI-Automatable',
-                orientation='h',
-                marker_color='darkred'
-            ))
-            fig.update_layout(
-                barmode='overlay',
-                height=400,
-                hovermode='y unified'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Add potential savings summary box
-        st.markdown("---")
-        st.subheader("💡 Key Insights")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.info(f"""
-            **🤖 AI Could Assist With:**
-            - {automatable_hours:,.0f} hours ({automation_rate:.1f}%)
-            - Equivalent to {automatable_hours/40:.0f} work weeks
-            - Or {automatable_hours/2080:.1f} full-time employees
-            """)
-        
-        with col2:
-            # Calculate average automation rate
-            avg_automation = filtered_df['Automation_Potential'].mean() * 100
-            st.success(f"""
-            **📈 Average Task Automation:**
-            - {avg_automation:.1f}% automation potential
-            - Based on {len(filtered_df):,} time entries
-            - Across {unique_matters:,} matters
-            """)
-        
-        with col3:
-            # Get highest automation category
-            top_category = category_data.iloc[0]
-            st.warning(f"""
-            **🎯 Top Opportunity:**
-            - **{top_category['Task_Category']}**
-            - {top_category['Automatable_Hours']:.0f} automatable hours
-            - {top_category['Automation_Potential']*100:.0f}% automation potential
-            """)
-
+        st.plotly_chart(fig, use_container_width=True)
     
-    # TAB 2: OLI BENCHMARK
-    with tab2:
-        st.header("🎯 OLI Benchmark - Scale Law Firm's Custom Analysis")
-        
-        st.markdown("""
-        ### 📊 Scale Law Firm's AI Automation Estimates
-        This tab uses **OLI Benchmark** - Scale Law Firm's proprietary assessment of which legal tasks 
-        can be automated with AI. Unlike the LegalBench academic framework, this reflects your firm's 
-        real-world experience and specific task categorization.
-        
-        **Note:** *Flat fee entries are counted as 1 hour for analysis purposes.*
+    st.markdown("---")
+    
+    # Top matters for automation (OLI)
+    st.subheader("🎯 Top Matters for AI Implementation (OLI Benchmark)")
+    
+    rank_by = matter_rank_picker('oli_matters')
+    oli_matter_analysis = rollup(
+        filtered_cube[filtered_cube['OLI_Category'] != 'Unclassified'],
+        MATTER_RANK_KEYS[rank_by], ['Hours', 'OLI_Automatable_Hours']
+    )
+    oli_matter_analysis = matter_page(oli_matter_analysis, 'OLI_Automatable_Hours', 'oli_matters')
+    oli_matter_analysis['OLI_Automation_Rate'] = (
+        oli_matter_analysis['OLI_Automatable_Hours'] / oli_matter_analysis['Hours'] * 100
+    )
+    
+    st.dataframe(
+        oli_matter_analysis.style.format({
+            'Hours': '{:.1f}',
+            'OLI_Automatable_Hours': '{:.1f}',
+            'OLI_Automation_Rate': '{:.1f}%'
+        }).background_gradient(subset=['OLI_Automatable_Hours'], cmap='Greens'),
+        use_container_width=True,
+        height=400
+    )
+    
+    st.markdown("---")
+    
+    # OLI Key Insights
+    st.subheader("💡 OLI Benchmark Key Insights")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Find 100% automatable hours
+        full_auto = filtered_cube[filtered_cube['OLI_Automation_Potential'] == 1.0]['Hours'].sum()
+        st.success(f"""
+        **🟢 100% Automatable:**
+        - {full_auto:,.0f} hours
+        - Standard contracts & docs
+        - Immediate AI deployment ready
         """)
+    
+    with col2:
+        # Find 70% automatable (research); potentials are stored as float32
+        research_auto = filtered_cube[filtered_cube['OLI_Automation_Potential'] == np.float32(0.7)]['Hours'].sum()
+        st.info(f"""
+        **🟡 70% Automatable:**
+        - {research_auto:,.0f} hours
+        - Legal research & discovery
+        - High-value AI assistance
+        """)
+    
+    with col3:
+        # Find strategic work (0%)
+        strategic = filtered_cube[filtered_cube['OLI_Automation_Potential'] == 0.0]['Hours'].sum()
+        st.warning(f"""
+        **⚫ Strategic Work (0%):**
+        - {strategic:,.0f} hours
+        - Client relationships
+        - Stays human-led
+        """)
+
+def render_automation_tab(df, filtered_cube, index, selected_rows, selection_key):
+    """Automation Analysis tab: category distribution, keywords and keyword drilldown"""
+    st.header("🤖 AI Automation Analysis")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("Task Category Distribution")
+        category_data = rollup(filtered_cube, ['Task_Category'], ['Hours', 'Automatable_Hours'])
+        category_data = category_data.sort_values('Hours', ascending=False)
         
-        # Classify using OLI Benchmark
-        with st.spinner("🤖 Analyzing tasks using OLI Benchmark..."):
-            filtered_df[['OLI_Category', 'OLI_Automation_Potential']] = filtered_df['Description'].apply(
-                lambda x: pd.Series(classify_task_oli(x))
-            )
-        
-        # Calculate OLI automatable hours
-        filtered_df['OLI_Automatable_Hours'] = filtered_df['Hours'] * filtered_df['OLI_Automation_Potential']
-        filtered_df['OLI_Manual_Hours'] = filtered_df['Hours'] - filtered_df['OLI_Automatable_Hours']
-        
-        # OLI Methodology explanation
-        with st.expander("📋 **OLI Benchmark Categories & Methodology**", expanded=False):
-            st.markdown("""
-            ### OLI Benchmark Classification
-            
-            Scale Law Firm has identified **6 automation tiers** based on task complexity and AI readiness:
-            
-            #### 🟢 100% AI Replaceable
-            **Standard Contracts & Documents:**
-            - NDAs, MSAs, Employment Agreements
-            - Consultation/Contractor Agreements
-            - Vendor & 1099 Agreements
-            - Lease & Licensing Agreements
-            - IP Assignments, Convertible Notes
-            - Promissory Notes, Releases
-            - Court Orders, Hold Letters
-            - **Document Search Tasks**
-            
-            *These are highly templated tasks where AI can handle the entire workflow with minimal oversight.*
-            
-            #### 🟡 70% AI Replaceable
-            **Legal Research & Discovery:**
-            - Case Law Research
-            - Statutory Interpretation
-            - Bill/Regulation Analysis
-            - Discovery Requests
-            - Written Discovery
-            
-            *AI excels at research but requires human verification and strategic thinking.*
-            
-            #### 🟠 30% AI Replaceable
-            **Complex Agreements:**
-            - Loan Documents, SaaS Agreements
-            - Settlement Agreements
-            - Patent/Trademark Office Actions
-            - Closing & Financing Documents
-            - Motions, Complaints, Answers
-            - Term Sheets, Legal Opinions
-            - Purchase & Sale Agreements
-            
-            *Requires significant human judgment but AI can assist with drafting and analysis.*
-            
-            #### 🔴 20% AI Replaceable
-            **General Drafting & Communications:**
-            - Email Drafting & Responses
-            - Letters & Amendments
-            - General Correspondence
-            - Updates & Communications
-            
-            *Highly contextual and relationship-focused work.*
-            
-            #### ⚫ 0% AI Replaceable
-            **Strategic & Relationship Work:**
-            - Strategy Sessions
-            - Client Conferences
-            - Negotiations
-            - Meetings & Consultations
-            - Any task with: "strategy", "confer", "spoke with", "conference call", "attended"
-            
-            *Pure human work requiring judgment, relationships, and strategic thinking.*
-            
-            ### Calculation Method
-            ```
-            OLI Automatable Hours = Total Hours × OLI Automation %
+        fig = px.bar(
+            category_data,
+            x='Task_Category',
+            y=['Hours', 'Automatable_Hours'],
+            title="Hours by Task Category",
+            labels={'value': 'Hours', 'variable': 'Type'},
+            barmode='group',
+            color_discrete_map={'Hours': 'lightblue', 'Automatable_Hours': 'darkblue'}
+        )
+        fig.update_layout(height=500, xaxis_tickangle=-45)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("Automation Potential")
+        
+        # Pie chart
+        fig = px.pie(
+            category_data,
+            values='Hours',
+            names='Task_Category',
+            title='Task Distribution',
+            hole=0.4
+        )
+        fig.update_layout(height=400)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Top automatable keywords
+    st.subheader("🔑 Top Keywords in Automatable Tasks")
+    
+    if index is not None:
+        keywords = extract_keywords(index, df, selected_rows, selection_key)
+    else:
+        st.info("ℹ️ Keyword analysis needs row-level descriptions, which streaming mode does not keep.")
+        keywords = []
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("#### Most Frequent Terms")
+        for i, (word, count) in enumerate(keywords[:10], 1):
+            st.write(f"{i}. **{word}** ({count:,} times)")
+    
+    with col2:
+        st.markdown("#### Medium Frequency")
+        for i, (word, count) in enumerate(keywords[10:20], 11):
+            st.write(f"{i}. **{word}** ({count:,} times)")
+    
+    with col3:
+        st.markdown("#### Emerging Terms")
+        for i, (word, count) in enumerate(keywords[20:30], 21):
+            st.write(f"{i}. **{word}** ({count:,} times)")
+    
+    # Word cloud style visualization
+    st.subheader("📊 Keyword Frequency Visualization")
+    keywords_df = pd.DataFrame(keywords[:20], columns=['Keyword', 'Count'])
+    fig = px.bar(
+        keywords_df,
+        x='Count',
+        y='Keyword',
+        orientation='h',
+        title='Top 20 Keywords in Automatable Tasks',
+        color='Count',
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=600)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Keyword drilldown: postings lookup intersected with the current filters
+    if index is not None:
+        st.subheader("🔎 Keyword Drilldown")
+        terms = list(dict.fromkeys([word for word, _ in keywords] + sorted(index.keyword_ids)))
+        term = st.selectbox(
+            "Keyword",
+            terms,
+            help="Taxonomy keywords match anywhere in a description; other terms match whole words"
+        ) if terms else None
+        
+        if term:
+            rows = index.term_rows(term)
+            rows = rows[selected_rows[rows]]
+            matches = with_derived(df.iloc[rows], ['Automatable_Hours'])
             
-            Example:
-            • Task: NDA Review (100% OLI automation)
-            • Time Spent: 10 hours
-            • Automatable: 10 × 1.00 = 10 hours (fully automatable)
-            • Manual Oversight: 0 hours
-            ```
-            """)
-        
-        st.markdown("---")
-        
-        # OLI Key metrics
-        st.subheader("📈 OLI Benchmark Metrics")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Matching Entries", f"{len(rows):,}")
+            with col2:
+                st.metric("Hours", f"{matches['Hours'].sum():,.0f}")
+            with col3:
+                st.metric("Automatable Hours", f"{matches['Automatable_Hours'].sum():,.0f}")
+            
+            if len(rows) > 0:
+                by_month = rollup(matches.assign(Entries=1), ['Year', 'Month'],
+                                  ['Entries', 'Hours', 'Automatable_Hours'])
+                by_month['Month'] = (by_month['Year'].astype(int).astype(str) + '-' +
+                                     by_month['Month'].astype(int).astype(str).str.zfill(2))
+                fig = px.bar(
+                    by_month,
+                    x='Month',
+                    y='Entries',
+                    title=f'Entries containing "{term}" by Month',
+                    hover_data=['Hours', 'Automatable_Hours']
+                )
+                fig.update_layout(height=350)
+                st.plotly_chart(fig, use_container_width=True)
+                
+                st.markdown("**Most Common Matching Tasks:**")
+                for task, count in index.top_descriptions(rows, n=5).items():
+                    st.write(f"• {task[:100]}{'...' if len(task) > 100 else ''} ({count} times)")
+
+# Top matters tables: one page of the ranking at a time. Ranking by matter number
+# keeps matters that share a description apart.
+MATTER_PAGE_SIZE = 15
+MATTER_RANK_KEYS = {
+    'Matter description': ['Matter description'],
+    'Matter number': ['Matter number', 'Matter description'],
+}
+
+def matter_rank_picker(key):
+    """'Rank by' choice for a top matters table"""
+    return st.radio(
+        "Rank by",
+        list(MATTER_RANK_KEYS),
+        horizontal=True,
+        help="Matter description merges matters that share a description",
+        key=f"{key}_rank_by"
+    )
+
+def matter_page(matters, column, key):
+    """The selected page of a per-matter rollup ranked by column, with a page picker"""
+    n_pages = max(1, -(-len(matters) // MATTER_PAGE_SIZE))
+    page_key = f"{key}_page"
+    # A narrower ranking or filter can leave the remembered page past the end
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = st.number_input(
+        f"Page (of {n_pages:,}, {MATTER_PAGE_SIZE} matters each)",
+        min_value=1,
+        max_value=n_pages,
+        step=1,
+        key=page_key
+    )
+    return top_k(matters, column, MATTER_PAGE_SIZE, offset=(page - 1) * MATTER_PAGE_SIZE).copy()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cost_savings_hours(_filtered_cube, selection_key):
+    """Parameter-free hour totals and rollups behind the Cost Savings tab (cached per filter selection)"""
+    return {
+        'total_hours': _filtered_cube['Hours'].sum(),
+        'automatable_hours': _filtered_cube['Automatable_Hours'].sum(),
+        'category_hours': rollup(_filtered_cube, ['Task_Category'], ['Automatable_Hours']),
+        'monthly_hours': rollup(_filtered_cube, ['Year', 'Month'], ['Automatable_Hours']).sort_values(['Year', 'Month']),
+        'matter_hours': {
+            rank_by: rollup(_filtered_cube, keys, ['Hours', 'Automatable_Hours'])
+            for rank_by, keys in MATTER_RANK_KEYS.items()
+        },
+    }
+
+def render_cost_savings_tab(filtered_cube, selection_key):
+    """Cost Savings tab: savings under the assumptions entered here"""
+    st.header("💰 Potential Cost Savings with AI")
+    
+    # Assumptions
+    st.subheader("⚙️ Assumptions & Parameters")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.number_input(
+            "Average Hourly Rate ($)",
+            min_value=100,
+            max_value=1000,
+            step=50,
+            key="avg_hourly_rate"
+        )
+    
+    with col2:
+        st.slider(
+            "AI Efficiency Gain (%)",
+            min_value=10,
+            max_value=90,
+            help="Percentage of time saved on automatable tasks",
+            key="ai_efficiency_gain_pct"
+        )
+    
+    with col3:
+        st.number_input(
+            "AI Cost per Hour ($)",
+            min_value=1,
+            max_value=100,
+            step=5,
+            help="Estimated cost of AI tools per hour",
+            key="ai_cost_per_hour"
+        )
+    
+    avg_hourly_rate, ai_efficiency_gain, ai_cost_per_hour = cost_assumptions()
+    
+    # Only the savings formulas depend on the inputs; the hours behind them are cached
+    hours = cost_savings_hours(filtered_cube, selection_key)
+    total_hours = hours['total_hours']
+    
+    st.markdown("---")
+    
+    # Calculate savings
+    savings = savings_summary(hours['automatable_hours'], ai_efficiency_gain, avg_hourly_rate, ai_cost_per_hour)
+    hours_saved = savings['hours_saved']
+    labor_cost_saved = savings['labor_cost_saved']
+    ai_cost = savings['ai_cost']
+    net_savings = savings['net_savings']
+    roi = savings['roi']
+    
+    # Display metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="Hours Potentially Saved",
+            value=f"{hours_saved:,.0f}",
+            delta=f"{(hours_saved/total_hours*100):.1f}% of total"
+        )
+    
+    with col2:
+        st.metric(
+            label="Labor Cost Savings",
+            value=f"${labor_cost_saved:,.0f}"
+        )
+    
+    with col3:
+        st.metric(
+            label="AI Implementation Cost",
+            value=f"${ai_cost:,.0f}"
+        )
+    
+    with col4:
+        st.metric(
+            label="Net Savings",
+            value=f"${net_savings:,.0f}",
+            delta=f"ROI: {roi:.0f}%"
+        )
+    
+    st.markdown("---")
+    
+    # Savings breakdown by category
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("💵 Savings by Task Category")
         
-        col1, col2, col3, col4 = st.columns(4)
+        category_savings = add_hour_savings(hours['category_hours'], ai_efficiency_gain, avg_hourly_rate)
+        category_savings = category_savings.sort_values('Cost_Savings', ascending=False)
         
-        oli_total_hours = filtered_df['Hours'].sum()
-        oli_automatable = filtered_df['OLI_Automatable_Hours'].sum()
-        oli_automation_rate = (oli_automatable / oli_total_hours * 100) if oli_total_hours > 0 else 0
-        oli_manual = filtered_df['OLI_Manual_Hours'].sum()
+        fig = px.bar(
+            category_savings,
+            x='Task_Category',
+            y='Cost_Savings',
+            title='Potential Savings by Category',
+            labels={'Cost_Savings': 'Savings ($)'},
+            color='Cost_Savings',
+            color_continuous_scale='Greens'
+        )
+        fig.update_layout(height=400, xaxis_tickangle=-45)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("📈 Cumulative Savings")
+        
+        # Monthly cumulative savings
+        monthly_savings = add_hour_savings(hours['monthly_hours'], ai_efficiency_gain, avg_hourly_rate,
+                                           column='Monthly_Savings')
+        monthly_savings['Cumulative_Savings'] = monthly_savings['Monthly_Savings'].cumsum()
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=monthly_savings.index,
+            y=monthly_savings['Cumulative_Savings'],
+            mode='lines+markers',
+            name='Cumulative Savings',
+            fill='tozeroy',
+            line=dict(color='green', width=3)
+        ))
+        fig.update_layout(
+            title='Cumulative Cost Savings Over Time',
+            xaxis_title='Month',
+            yaxis_title='Cumulative Savings ($)',
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Top matters for automation
+    st.subheader("🎯 Top Matters for AI Implementation")
+    
+    # Potential savings are proportional to automatable hours, so the ranking needs no inputs
+    rank_by = matter_rank_picker('cost_matters')
+    matter_analysis = matter_page(hours['matter_hours'][rank_by], 'Automatable_Hours', 'cost_matters')
+    matter_analysis['Automation_Rate'] = (
+        matter_analysis['Automatable_Hours'] / matter_analysis['Hours'] * 100
+    )
+    matter_analysis['Potential_Savings'] = (
+        matter_analysis['Automatable_Hours'] * ai_efficiency_gain * avg_hourly_rate
+    )
+    
+    st.dataframe(
+        matter_analysis.style.format({
+            'Hours': '{:.1f}',
+            'Automatable_Hours': '{:.1f}',
+            'Automation_Rate': '{:.1f}%',
+            'Potential_Savings': '${:,.0f}'
+        }),
+        use_container_width=True,
+        height=400
+    )
+
+# Central prediction interval and months ahead of the Predictions forecasts
+FORECAST_LEVEL = 0.8
+FORECAST_HORIZON = 12
+FORECAST_GROUPS = {'Task Category': 'Task_Category', 'User': 'User'}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def monthly_forecast(_filtered_cube, selection_key, measure, keys, horizon, start=None):
+    """Fitted monthly forecasts of a measure per group (cached per data version and filter selection)"""
+    return forecast_monthly(_filtered_cube, measure, keys=keys, horizon=horizon, level=FORECAST_LEVEL, start=start)
+
+def render_predictions_tab(filtered_cube, selection_key):
+    """Predictions tab: 2025 projections and scenarios"""
+    st.header("🔮 2025 Projections & Predictions")
+    
+    avg_hourly_rate, ai_efficiency_gain, ai_cost_per_hour = cost_assumptions()
+    
+    # Project full year based on current data
+    current_data = filtered_cube[filtered_cube['Year'] == 2025]
+    
+    if len(current_data) > 0:
+        # Forecast every 2025 month without data (gaps and the months after the
+        # latest one), fitted on every year's history
+        last_period = int((filtered_cube['Year'] * 12 + filtered_cube['Month'] - 1).max())
+        months_remaining = max(2025 * 12 + 11 - last_period, 0)
+        forecasts = {}
+        for measure in ['Hours', 'Automatable_Hours']:
+            forecast = monthly_forecast(filtered_cube, selection_key, measure, (), months_remaining, start=2025 * 12)
+            forecasts[measure] = forecast[forecast['Year'] == 2025].reset_index(drop=True)
+        months_forecast = len(forecasts['Hours'])
+        
+        projected_total_hours = (current_data['Hours'].sum() + 
+                                forecasts['Hours']['Forecast'].sum())
+        projected_automatable_hours = (current_data['Automatable_Hours'].sum() + 
+                                      forecasts['Automatable_Hours']['Forecast'].sum())
+        
+        # Display projections
+        col1, col2, col3 = st.columns(3)
         
         with col1:
             st.metric(
-                label="Total Hours Analyzed",
-                value=f"{oli_total_hours:,.0f}",
-                help="Total hours using OLI classification"
+                label="Projected Total Hours (2025)",
+                value=f"{projected_total_hours:,.0f}",
+                delta=f"+{months_forecast} months forecast"
             )
-            st.caption("📊 All activities reviewed")
         
         with col2:
             st.metric(
-                label="OLI AI-Automatable",
-                value=f"{oli_automatable:,.0f}",
-                delta=f"{oli_automation_rate:.1f}% of total",
-                help="Hours automatable per Scale Law Firm's assessment"
+                label="Projected Automatable Hours",
+                value=f"{projected_automatable_hours:,.0f}",
+                delta=f"{(projected_automatable_hours/projected_total_hours*100):.1f}%"
             )
-            st.caption("🤖 OLI automation potential")
         
         with col3:
+            projected_savings = projected_automatable_hours * ai_efficiency_gain * avg_hourly_rate
             st.metric(
-                label="Human-Required Hours",
-                value=f"{oli_manual:,.0f}",
-                delta=f"{(oli_manual/oli_total_hours*100):.1f}% of total",
-                delta_color="inverse",
-                help="Hours requiring human expertise"
+                label="Projected Annual Savings",
+                value=f"${projected_savings:,.0f}"
             )
-            st.caption("👨‍⚖️ Strategic human work")
         
-        with col4:
-            # Calculate potential savings at $500/hour
-            potential_savings = oli_automatable * 0.60 * 500  # 60% efficiency gain
-            st.metric(
-                label="Potential Annual Savings",
-                value=f"${potential_savings:,.0f}",
-                help="At 60% efficiency gain, $500/hour"
+        if months_forecast:
+            # Summed monthly bounds, a conservative range for the year
+            st.caption(
+                f"{forecasts['Hours']['Model'].iloc[0]} forecast of the months without data; "
+                f"{FORECAST_LEVEL:.0%} interval for total hours: "
+                f"{current_data['Hours'].sum() + forecasts['Hours']['Lower'].sum():,.0f} – "
+                f"{current_data['Hours'].sum() + forecasts['Hours']['Upper'].sum():,.0f}"
             )
-            st.caption("💰 Estimated savings")
         
         st.markdown("---")
         
-        # OLI Breakdown visualization
-        st.subheader("💰 What Could Have Been Saved (OLI Benchmark)")
-        
-        col1, col2 = st.columns([3, 2])
+        # Projection chart
+        col1, col2 = st.columns(2)
         
         with col1:
-            # OLI Monthly trend
-            oli_monthly = filtered_df.groupby(['Year', 'Month', 'Month_Name']).agg({
-                'Hours': 'sum',
-                'OLI_Automatable_Hours': 'sum',
-                'OLI_Manual_Hours': 'sum'
-            }).reset_index()
-            oli_monthly = oli_monthly.sort_values(['Year', 'Month'])
-            oli_monthly['Period'] = oli_monthly['Month_Name'] + ' ' + oli_monthly['Year'].astype(str)
+            st.subheader("📊 Monthly Projection")
+            
+            # Months with data and the forecast ones, in calendar order
+            actual_monthly = rollup(current_data, ['Month'], ['Hours', 'Automatable_Hours'])
+            actual_monthly['Type'] = 'Actual'
+            forecast_monthly_hours = forecasts['Hours'][['Month', 'Forecast', 'Lower', 'Upper']].rename(
+                columns={'Forecast': 'Hours'}
+            )
+            forecast_monthly_hours['Automatable_Hours'] = forecasts['Automatable_Hours']['Forecast'].to_numpy()
+            forecast_monthly_hours['Type'] = 'Projected'
+            projection_df = pd.concat([actual_monthly, forecast_monthly_hours], ignore_index=True)
+            projection_df = projection_df.sort_values('Month', kind='stable', ignore_index=True)
             
             fig = go.Figure()
             
-            fig.add_trace(go.Scatter(
-                x=oli_monthly['Period'],
-                y=oli_monthly['OLI_Automatable_Hours'],
-                name='AI-Automatable (OLI)',
-                mode='lines',
-                line=dict(width=0.5, color='rgb(0, 128, 0)'),
-                stackgroup='one',
-                fillcolor='rgba(0, 128, 0, 0.7)',
-                hovertemplate='%{y:.0f} automatable hours<extra></extra>'
+            # Actual data
+            actual = projection_df[projection_df['Type'] == 'Actual']
+            fig.add_trace(go.Bar(
+                x=actual['Month'],
+                y=actual['Hours'],
+                name='Actual Total',
+                marker_color='lightblue'
+            ))
+            fig.add_trace(go.Bar(
+                x=actual['Month'],
+                y=actual['Automatable_Hours'],
+                name='Actual Automatable',
+                marker_color='darkblue'
             ))
             
-            fig.add_trace(go.Scatter(
-                x=oli_monthly['Period'],
-                y=oli_monthly['OLI_Manual_Hours'],
-                name='Human-Required',
-                mode='lines',
-                line=dict(width=0.5, color='rgb(220, 20, 60)'),
-                stackgroup='one',
-                fillcolor='rgba(220, 20, 60, 0.7)',
-                hovertemplate='%{y:.0f} manual hours<extra></extra>'
+            # Projected data
+            projected = projection_df[projection_df['Type'] == 'Projected']
+            fig.add_trace(go.Bar(
+                x=projected['Month'],
+                y=projected['Hours'],
+                name='Projected Total',
+                marker_color='lightcoral',
+                opacity=0.6,
+                error_y=dict(
+                    type='data',
+                    symmetric=False,
+                    array=projected['Upper'] - projected['Hours'],
+                    arrayminus=projected['Hours'] - projected['Lower']
+                )
+            ))
+            fig.add_trace(go.Bar(
+                x=projected['Month'],
+                y=projected['Automatable_Hours'],
+                name='Projected Automatable',
+                marker_color='darkred',
+                opacity=0.6
             ))
             
             fig.update_layout(
-                title='OLI Benchmark: Monthly Hours Distribution',
+                title='2025 Monthly Hours Projection',
                 xaxis_title='Month',
                 yaxis_title='Hours',
-                height=400,
-                hovermode='x unified',
-                showlegend=True
+                barmode='group',
+                height=400
             )
-            
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            # OLI Donut chart
-            fig = go.Figure(data=[go.Pie(
-                labels=['AI-Automatable (OLI)', 'Human-Required'],
-                values=[oli_automatable, oli_manual],
-                hole=0.5,
-                marker_colors=['#008000', '#DC143C'],
-                textinfo='label+percent',
-                textposition='outside'
-            )])
+            st.subheader("💰 Cumulative Savings Projection")
             
-            fig.update_layout(
-                title='OLI Work Distribution',
-                height=400,
-                showlegend=False,
-                annotations=[dict(
-                    text=f'{oli_automation_rate:.1f}%<br>Automatable',
-                    x=0.5, y=0.5,
-                    font_size=20,
-                    showarrow=False
-                )]
+            projection_df['Monthly_Savings'] = (
+                projection_df['Automatable_Hours'] * ai_efficiency_gain * avg_hourly_rate
             )
+            projection_df['Cumulative_Savings'] = projection_df['Monthly_Savings'].cumsum()
             
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # OLI Category breakdown
-        st.subheader("📊 OLI Benchmark: Hours by Automation Tier")
-        
-        # Group by OLI categories (exclude Unclassified)
-        oli_category_data = filtered_df[filtered_df['OLI_Category'] != 'Unclassified'].groupby('OLI_Category').agg({
-            'Hours': 'sum',
-            'OLI_Automatable_Hours': 'sum',
-            'OLI_Automation_Potential': 'first'
-        }).reset_index()
-        
-        # Sort by automation potential descending
-        oli_category_data = oli_category_data.sort_values('OLI_Automation_Potential', ascending=False)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Horizontal bar chart by category
             fig = go.Figure()
             
-            fig.add_trace(go.Bar(
-                y=oli_category_data['OLI_Category'],
-                x=oli_category_data['Hours'],
-                name='Total Hours',
-                orientation='h',
-                marker_color='lightblue',
-                text=oli_category_data['Hours'].round(0),
-                textposition='inside'
+            # Actual cumulative
+            actual_cum = projection_df[projection_df['Type'] == 'Actual']
+            fig.add_trace(go.Scatter(
+                x=actual_cum['Month'],
+                y=actual_cum['Cumulative_Savings'],
+                mode='lines+markers',
+                name='Actual',
+                line=dict(color='green', width=3),
+                fill='tozeroy'
             ))
             
-            fig.add_trace(go.Bar(
-                y=oli_category_data['OLI_Category'],
-                x=oli_category_data['OLI_Automatable_Hours'],
-                name='Automatable',
-                orientation='h',
-                marker_color='darkgreen',
-                text=oli_category_data['OLI_Automatable_Hours'].round(0),
-                textposition='inside'
+            # Projected cumulative
+            fig.add_trace(go.Scatter(
+                x=projection_df['Month'],
+                y=projection_df['Cumulative_Savings'],
+                mode='lines+markers',
+                name='Projected',
+                line=dict(color='lightgreen', width=3, dash='dash'),
+                fill='tozeroy',
+                opacity=0.5
             ))
             
             fig.update_layout(
-                title='Hours by OLI Category',
-                xaxis_title='Hours',
-                height=450,
-                barmode='overlay',
-                yaxis={'categoryorder': 'array', 'categoryarray': oli_category_data['OLI_Category'].tolist()}
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Show automation % for each tier
-            fig = px.bar(
-                oli_category_data,
-                y='OLI_Category',
-                x='OLI_Automatable_Hours',
-                orientation='h',
-                title='Automatable Hours by Tier',
-                labels={'OLI_Automatable_Hours': 'Automatable Hours'},
-                color='OLI_Automation_Potential',
-                color_continuous_scale='RdYlGn',
-                text='OLI_Automatable_Hours'
-            )
-            
-            fig.update_traces(
-                texttemplate='%{text:.0f}h',
-                textposition='outside'
-            )
-            
-            fig.update_layout(
-                height=450,
-                yaxis={'categoryorder': 'array', 'categoryarray': oli_category_data['OLI_Category'].tolist()},
-                coloraxis_colorbar=dict(
-                    title="Automation<br>%"
-                )
+                title='Cumulative Savings Projection',
+                xaxis_title='Month',
+                yaxis_title='Cumulative Savings ($)',
+                height=400
             )
-            
             st.plotly_chart(fig, use_container_width=True)
         
-        st.markdown("---")
-        
-        # Top matters for automation (OLI)
-        st.subheader("🎯 Top Matters for AI Implementation (OLI Benchmark)")
+        # Scenario analysis (its inputs rerun only this section)
+        scenario_analysis_panel(projected_automatable_hours)
         
-        oli_matter_analysis = filtered_df[filtered_df['OLI_Category'] != 'Unclassified'].groupby('Matter description').agg({
-            'Hours': 'sum',
-            'OLI_Automatable_Hours': 'sum'
-        }).reset_index()
-        oli_matter_analysis['OLI_Automation_Rate'] = (
-            oli_matter_analysis['OLI_Automatable_Hours'] / oli_matter_analysis['Hours'] * 100
-        )
-        oli_matter_analysis = oli_matter_analysis.sort_values('OLI_Automatable_Hours', ascending=False).head(15)
+        # Projected automatable hours split across categories in their year-to-date proportions
+        category_hours = rollup(current_data, ['Task_Category'], ['Automatable_Hours'])
+        category_hours = category_hours[category_hours['Automatable_Hours'] > 0]
+        category_hours['Automatable_Hours'] *= projected_automatable_hours / current_data['Automatable_Hours'].sum()
+        sensitivity_panel(projected_automatable_hours, category_hours)
         
+        monte_carlo_panel(current_data, projected_total_hours / current_data['Hours'].sum())
+    else:
+        st.warning("No 2025 data available for projections")
+    
+    forecast_breakdown_panel(filtered_cube, selection_key)
+
+@st.fragment
+def forecast_breakdown_panel(filtered_cube, selection_key):
+    """Next months' forecast per category or user, with prediction intervals"""
+    started = time.perf_counter()
+    st.markdown("---")
+    st.subheader("📈 Forecast by Category and User")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        group_label = st.radio("Forecast by", list(FORECAST_GROUPS), horizontal=True, key="forecast_group")
+    with col2:
+        measure = st.radio("Measure", ['Hours', 'Automatable_Hours'], horizontal=True, key="forecast_measure")
+    group_column = FORECAST_GROUPS[group_label]
+    
+    forecast = monthly_forecast(filtered_cube, selection_key, measure, (group_column,), FORECAST_HORIZON)
+    if len(forecast) == 0:
+        st.info("No monthly history to forecast from")
+        return
+    
+    totals = forecast.groupby(group_column, observed=True)[['Forecast', 'Lower', 'Upper']].sum()
+    totals = totals.sort_values('Forecast', ascending=False)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown(f"**Next {FORECAST_HORIZON} Months ({FORECAST_LEVEL:.0%} interval)**")
         st.dataframe(
-            oli_matter_analysis.style.format({
-                'Hours': '{:.1f}',
-                'OLI_Automatable_Hours': '{:.1f}',
-                'OLI_Automation_Rate': '{:.1f}%'
-            }).background_gradient(subset=['OLI_Automatable_Hours'], cmap='Greens'),
+            totals.style.format('{:,.0f}'),
             use_container_width=True,
             height=400
         )
-        
-        st.markdown("---")
-        
-        # OLI Key Insights
-        st.subheader("💡 OLI Benchmark Key Insights")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Find 100% automatable hours
-            full_auto = filtered_df[filtered_df['OLI_Automation_Potential'] == 1.0]['Hours'].sum()
-            st.success(f"""
-            **🟢 100% Automatable:**
-            - {full_auto:,.0f} hours
-            - Standard contracts & docs
-            - Immediate AI deployment ready
-            """)
-        
-        with col2:
-            # Find 70% automatable (research)
-            research_auto = filtered_df[filtered_df['OLI_Automation_Potential'] == 0.7]['Hours'].sum()
-            st.info(f"""
-            **🟡 70% Automatable:**
-            - {research_auto:,.0f} hours
-            - Legal research & discovery
-            - High-value AI assistance
-            """)
-        
-        with col3:
-            # Find strategic work (0%)
-            strategic = filtered_df[filtered_df['OLI_Automation_Potential'] == 0.0]['Hours'].sum()
-            st.warning(f"""
-            **⚫ Strategic Work (0%):**
-            - {strategic:,.0f} hours
-            - Client relationships
-            - Stays human-led
-            """)
     
-    # TAB 3: Automation Analysis
-    with tab6:
-        st.header("🤖 AI Automation Analysis")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.subheader("Task Category Distribution")
-            category_data = filtered_df.groupby('Task_Category').agg({
-                'Hours': 'sum',
-                'Automatable_Hours': 'sum'
-            }).reset_index()
-            category_data = category_data.sort_values('Hours', ascending=False)
-            
-            fig = px.bar(
-                category_data,
-                x='Task_Category',
-                y=['Hours', 'Automatable_Hours'],
-                title="Hours by Task Category",
-                labels={'value': 'Hours', 'variable': 'Type'},
-                barmode='group',
-                color_discrete_map={'Hours': 'lightblue', 'Automatable_Hours': 'darkblue'}
-            )
-            fig.update_layout(height=500, xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("Automation Potential")
-            
-            # Pie chart
-            fig = px.pie(
-                category_data,
-                values='Hours',
-                names='Task_Category',
-                title='Task Distribution',
-                hole=0.4
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Top automatable keywords
-        st.subheader("🔑 Top Keywords in Automatable Tasks")
-        
-        high_automation_tasks = filtered_df[filtered_df['Automation_Potential'] > 0.7]
-        keywords = extract_keywords(high_automation_tasks['Description'].dropna())
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("#### Most Frequent Terms")
-            for i, (word, count) in enumerate(keywords[:10], 1):
-                st.write(f"{i}. **{word}** ({count:,} times)")
-        
-        with col2:
-            st.markdown("#### Medium Frequency")
-            for i, (word, count) in enumerate(keywords[10:20], 11):
-                st.write(f"{i}. **{word}** ({count:,} times)")
-        
-        with col3:
-            st.markdown("#### Emerging Terms")
-            for i, (word, count) in enumerate(keywords[20:30], 21):
-                st.write(f"{i}. **{word}** ({count:,} times)")
-        
-        # Word cloud style visualization
-        st.subheader("📊 Keyword Frequency Visualization")
-        keywords_df = pd.DataFrame(keywords[:20], columns=['Keyword', 'Count'])
-        fig = px.bar(
-            keywords_df,
-            x='Count',
-            y='Keyword',
-            orientation='h',
-            title='Top 20 Keywords in Automatable Tasks',
-            color='Count',
-            color_continuous_scale='Blues'
+    with col2:
+        group = st.selectbox(group_label, totals.index, key="forecast_group_value")
+        history = rollup(filtered_cube[filtered_cube[group_column] == group], ['Year', 'Month'], [measure])
+        history = history.sort_values(['Year', 'Month'])
+        group_forecast = forecast[forecast[group_column] == group]
+        history_labels = period_labels((history['Year'] * 12 + history['Month'] - 1).astype(int))
+        forecast_labels = period_labels(group_forecast['Year'] * 12 + group_forecast['Month'] - 1)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=forecast_labels,
+            y=group_forecast['Upper'],
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=forecast_labels,
+            y=group_forecast['Lower'],
+            mode='lines',
+            line=dict(width=0),
+            fill='tonexty',
+            fillcolor='rgba(255, 127, 80, 0.3)',
+            name=f'{FORECAST_LEVEL:.0%} interval'
+        ))
+        fig.add_trace(go.Scatter(
+            x=history_labels,
+            y=history[measure],
+            mode='lines+markers',
+            name='Actual',
+            line=dict(color='steelblue', width=2)
+        ))
+        fig.add_trace(go.Scatter(
+            x=forecast_labels,
+            y=group_forecast['Forecast'],
+            mode='lines+markers',
+            name=f"Forecast ({group_forecast['Model'].iloc[0]})",
+            line=dict(color='coral', width=2, dash='dash')
+        ))
+        fig.update_layout(
+            title=f'{group}: Monthly {measure.replace("_", " ")}',
+            xaxis_title='Month',
+            yaxis_title='Hours',
+            height=400
         )
-        fig.update_layout(height=600)
         st.plotly_chart(fig, use_container_width=True)
     
-    # TAB 4: Cost Savings
-    with tab6:
-        st.header("💰 Potential Cost Savings with AI")
-        
-        # Assumptions
-        st.subheader("⚙️ Assumptions & Parameters")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            avg_hourly_rate = st.number_input(
-                "Average Hourly Rate ($)",
-                min_value=100,
-                max_value=1000,
-                value=500,
-                step=50
-            )
-        
-        with col2:
-            ai_efficiency_gain = st.slider(
-                "AI Efficiency Gain (%)",
-                min_value=10,
-                max_value=90,
-                value=60,
-                help="Percentage of time saved on automatable tasks"
-            ) / 100
-        
-        with col3:
-            ai_cost_per_hour = st.number_input(
-                "AI Cost per Hour ($)",
-                min_value=1,
-                max_value=100,
-                value=10,
-                step=5,
-                help="Estimated cost of AI tools per hour"
-            )
-        
-        st.markdown("---")
-        
-        # Calculate savings
-        hours_saved = automatable_hours * ai_efficiency_gain
-        labor_cost_saved = hours_saved * avg_hourly_rate
-        ai_cost = automatable_hours * ai_cost_per_hour
-        net_savings = labor_cost_saved - ai_cost
-        roi = (net_savings / ai_cost * 100) if ai_cost > 0 else 0
-        
-        # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="Hours Potentially Saved",
-                value=f"{hours_saved:,.0f}",
-                delta=f"{(hours_saved/total_hours*100):.1f}% of total"
-            )
-        
-        with col2:
-            st.metric(
-                label="Labor Cost Savings",
-                value=f"${labor_cost_saved:,.0f}"
-            )
-        
-        with col3:
-            st.metric(
-                label="AI Implementation Cost",
-                value=f"${ai_cost:,.0f}"
-            )
-        
-        with col4:
-            st.metric(
-                label="Net Savings",
-                value=f"${net_savings:,.0f}",
-                delta=f"ROI: {roi:.0f}%"
-            )
-        
-        st.markdown("---")
-        
-        # Savings breakdown by category
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("💵 Savings by Task Category")
-            
-            category_savings = filtered_df.groupby('Task_Category').agg({
-                'Automatable_Hours': 'sum'
-            }).reset_index()
-            
-            category_savings['Hours_Saved'] = category_savings['Automatable_Hours'] * ai_efficiency_gain
-            category_savings['Cost_Savings'] = category_savings['Hours_Saved'] * avg_hourly_rate
-            category_savings = category_savings.sort_values('Cost_Savings', ascending=False)
-            
-            fig = px.bar(
-                category_savings,
-                x='Task_Category',
-                y='Cost_Savings',
-                title='Potential Savings by Category',
-                labels={'Cost_Savings': 'Savings ($)'},
-                color='Cost_Savings',
-                color_continuous_scale='Greens'
-            )
-            fig.update_layout(height=400, xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("📈 Cumulative Savings")
-            
-            # Monthly cumulative savings
-            monthly_savings = filtered_df.groupby(['Year', 'Month']).agg({
-                'Automatable_Hours': 'sum'
-            }).reset_index()
-            monthly_savings = monthly_savings.sort_values(['Year', 'Month'])
-            monthly_savings['Hours_Saved'] = monthly_savings['Automatable_Hours'] * ai_efficiency_gain
-            monthly_savings['Monthly_Savings'] = monthly_savings['Hours_Saved'] * avg_hourly_rate
-            monthly_savings['Cumulative_Savings'] = monthly_savings['Monthly_Savings'].cumsum()
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=monthly_savings.index,
-                y=monthly_savings['Cumulative_Savings'],
-                mode='lines+markers',
-                name='Cumulative Savings',
-                fill='tozeroy',
-                line=dict(color='green', width=3)
-            ))
-            fig.update_layout(
-                title='Cumulative Cost Savings Over Time',
-                xaxis_title='Month',
-                yaxis_title='Cumulative Savings ($)',
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Top matters for automation
-        st.subheader("🎯 Top Matters for AI Implementation")
-        
-        matter_analysis = filtered_df.groupby('Matter description').agg({
-            'Hours': 'sum',
-            'Automatable_Hours': 'sum'
-        }).reset_index()
-        matter_analysis['Automation_Rate'] = (
-            matter_analysis['Automatable_Hours'] / matter_analysis['Hours'] * 100
-        )
-        matter_analysis['Potential_Savings'] = (
-            matter_analysis['Automatable_Hours'] * ai_efficiency_gain * avg_hourly_rate
+    record_timing('Forecast Breakdown', started)
+
+# Efficiency levels compared in Predictions' scenario analysis (editable there)
+SCENARIO_DEFAULTS = [
+    ('Conservative', 40),
+    ('Moderate', 60),
+    ('Optimistic', 80),
+]
+
+@st.fragment
+def scenario_analysis_panel(projected_automatable_hours):
+    """Scenario comparison of projected savings; editing the efficiencies reruns only this section"""
+    started = time.perf_counter()
+    st.markdown("---")
+    st.subheader("🎲 Scenario Analysis")
+    
+    avg_hourly_rate, _, ai_cost_per_hour = cost_assumptions()
+    
+    scenarios = st.data_editor(
+        pd.DataFrame(SCENARIO_DEFAULTS, columns=['Scenario', 'Efficiency (%)']),
+        column_config={
+            'Efficiency (%)': st.column_config.NumberColumn(min_value=0, max_value=100, step=5)
+        },
+        disabled=['Scenario'],
+        hide_index=True,
+        key="scenario_efficiencies"
+    )
+    
+    # All scenarios in one array computation; a cleared cell counts as 0%
+    efficiency_pct = scenarios['Efficiency (%)'].fillna(0).to_numpy(dtype='float64')
+    savings = savings_grid(projected_automatable_hours, efficiency_pct / 100, avg_hourly_rate, ai_cost_per_hour)
+    scenario_df = pd.DataFrame({
+        'Scenario': [f"{name} ({pct:.0f}% efficiency)" for name, pct in zip(scenarios['Scenario'], efficiency_pct)],
+        'Hours Saved': savings['hours_saved'],
+        'Cost Saved': savings['labor_cost_saved'],
+        'AI Cost': savings['ai_cost'],
+        'Net Savings': savings['net_savings'],
+        'ROI (%)': savings['roi'],
+    })
+    
+    # Display scenarios
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=scenario_df['Scenario'],
+            y=scenario_df['Net Savings'],
+            name='Net Savings',
+            marker_color='green',
+            text=scenario_df['Net Savings'].apply(lambda x: f'${x:,.0f}'),
+            textposition='auto'
+        ))
+        
+        fig.update_layout(
+            title='Net Savings by Scenario',
+            xaxis_title='Scenario',
+            yaxis_title='Net Savings ($)',
+            height=400
         )
-        matter_analysis = matter_analysis.sort_values('Potential_Savings', ascending=False).head(15)
-        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
         st.dataframe(
-            matter_analysis.style.format({
-                'Hours': '{:.1f}',
-                'Automatable_Hours': '{:.1f}',
-                'Automation_Rate': '{:.1f}%',
-                'Potential_Savings': '${:,.0f}'
+            scenario_df.style.format({
+                'Hours Saved': '{:,.0f}',
+                'Cost Saved': '${:,.0f}',
+                'AI Cost': '${:,.0f}',
+                'Net Savings': '${:,.0f}',
+                'ROI (%)': '{:.0f}%'
             }),
             use_container_width=True,
             height=400
         )
     
-    # TAB 5: Predictions
-    with tab6:
-        st.header("🔮 2025 Projections & Predictions")
-        
-        # Project full year based on current data
-        current_data = filtered_df[filtered_df['Year'] == 2025]
-        
-        if len(current_data) > 0:
-            # Get latest month with data
-            latest_month = current_data['Month'].max()
-            
-            # Calculate monthly averages
-            monthly_avg = current_data.groupby('Month').agg({
-                'Hours': 'sum',
-                'Automatable_Hours': 'sum'
-            }).mean()
-            
-            # Project for remaining months
-            months_elapsed = latest_month
-            months_remaining = 12 - months_elapsed
-            
-            projected_total_hours = (current_data['Hours'].sum() + 
-                                    monthly_avg['Hours'] * months_remaining)
-            projected_automatable_hours = (current_data['Automatable_Hours'].sum() + 
-                                          monthly_avg['Automatable_Hours'] * months_remaining)
-            
-            # Display projections
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    label="Projected Total Hours (2025)",
-                    value=f"{projected_total_hours:,.0f}",
-                    delta=f"+{months_remaining} months projected"
-                )
-            
-            with col2:
-                st.metric(
-                    label="Projected Automatable Hours",
-                    value=f"{projected_automatable_hours:,.0f}",
-                    delta=f"{(projected_automatable_hours/projected_total_hours*100):.1f}%"
-                )
-            
-            with col3:
-                projected_savings = projected_automatable_hours * ai_efficiency_gain * avg_hourly_rate
-                st.metric(
-                    label="Projected Annual Savings",
-                    value=f"${projected_savings:,.0f}"
-                )
-            
-            st.markdown("---")
-            
-            # Projection chart
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("📊 Monthly Projection")
-                
-                # Create projection data
-                actual_monthly = current_data.groupby('Month').agg({
-                    'Hours': 'sum',
-                    'Automatable_Hours': 'sum'
-                }).reset_index()
-                
-                # Create full year projection
-                all_months = pd.DataFrame({'Month': range(1, 13)})
-                projection_df = all_months.merge(actual_monthly, on='Month', how='left')
-                
-                # Fill projected values
-                projection_df['Hours'] = projection_df['Hours'].fillna(monthly_avg['Hours'])
-                projection_df['Automatable_Hours'] = projection_df['Automatable_Hours'].fillna(
-                    monthly_avg['Automatable_Hours']
-                )
-                projection_df['Type'] = projection_df['Month'].apply(
-                    lambda x: 'Actual' if x <= months_elapsed else 'Projected'
-                )
-                
-                fig = go.Figure()
-                
-                # Actual data
-                actual = projection_df[projection_df['Type'] == 'Actual']
-                fig.add_trace(go.Bar(
-                    x=actual['Month'],
-                    y=actual['Hours'],
-                    name='Actual Total',
-                    marker_color='lightblue'
-                ))
-                fig.add_trace(go.Bar(
-                    x=actual['Month'],
-                    y=actual['Automatable_Hours'],
-                    name='Actual Automatable',
-                    marker_color='darkblue'
-                ))
-                
-                # Projected data
-                projected = projection_df[projection_df['Type'] == 'Projected']
-                fig.add_trace(go.Bar(
-                    x=projected['Month'],
-                    y=projected['Hours'],
-                    name='Projected Total',
-                    marker_color='lightcoral',
-                    opacity=0.6
-                ))
-                fig.add_trace(go.Bar(
-                    x=projected['Month'],
-                    y=projected['Automatable_Hours'],
-                    name='Projected Automatable',
-                    marker_color='darkred',
-                    opacity=0.6
-                ))
-                
-                fig.update_layout(
-                    title='2025 Monthly Hours Projection',
-                    xaxis_title='Month',
-                    yaxis_title='Hours',
-                    barmode='group',
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("💰 Cumulative Savings Projection")
-                
-                projection_df['Monthly_Savings'] = (
-                    projection_df['Automatable_Hours'] * ai_efficiency_gain * avg_hourly_rate
-                )
-                projection_df['Cumulative_Savings'] = projection_df['Monthly_Savings'].cumsum()
-                
-                fig = go.Figure()
-                
-                # Actual cumulative
-                actual_cum = projection_df[projection_df['Type'] == 'Actual']
-                fig.add_trace(go.Scatter(
-                    x=actual_cum['Month'],
-                    y=actual_cum['Cumulative_Savings'],
-                    mode='lines+markers',
-                    name='Actual',
-                    line=dict(color='green', width=3),
-                    fill='tozeroy'
-                ))
-                
-                # Projected cumulative
-                fig.add_trace(go.Scatter(
-                    x=projection_df['Month'],
-                    y=projection_df['Cumulative_Savings'],
-                    mode='lines+markers',
-                    name='Projected',
-                    line=dict(color='lightgreen', width=3, dash='dash'),
-                    fill='tozeroy',
-                    opacity=0.5
-                ))
-                
-                fig.update_layout(
-                    title='Cumulative Savings Projection',
-                    xaxis_title='Month',
-                    yaxis_title='Cumulative Savings ($)',
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Scenario analysis
-            st.markdown("---")
-            st.subheader("🎲 Scenario Analysis")
-            
-            scenarios = {
-                'Conservative (40% efficiency)': 0.40,
-                'Moderate (60% efficiency)': 0.60,
-                'Optimistic (80% efficiency)': 0.80
-            }
-            
-            scenario_results = []
-            for scenario_name, efficiency in scenarios.items():
-                hours_saved = projected_automatable_hours * efficiency
-                cost_saved = hours_saved * avg_hourly_rate
-                ai_cost = projected_automatable_hours * ai_cost_per_hour
-                net_savings = cost_saved - ai_cost
-                
-                scenario_results.append({
-                    'Scenario': scenario_name,
-                    'Hours Saved': hours_saved,
-                    'Cost Saved': cost_saved,
-                    'AI Cost': ai_cost,
-                    'Net Savings': net_savings,
-                    'ROI (%)': (net_savings / ai_cost * 100) if ai_cost > 0 else 0
-                })
+    record_timing('Scenario Analysis', started)
+
+# Axes of Predictions' sensitivity grid (100 x 100 x 50 points)
+SENSITIVITY_EFFICIENCIES = np.linspace(0.01, 1.0, 100)
+SENSITIVITY_HOURLY_RATES = np.linspace(50, 1000, 100)
+SENSITIVITY_AI_COSTS = np.arange(2, 101, 2)
+
+@st.fragment
+def sensitivity_panel(projected_automatable_hours, category_hours):
+    """Net savings and ROI over efficiency x hourly rate x AI cost, with the break-even line"""
+    started = time.perf_counter()
+    st.markdown("---")
+    st.subheader("🧭 Sensitivity Analysis")
+    
+    avg_hourly_rate, ai_efficiency_gain, ai_cost_per_hour = cost_assumptions()
+    
+    # The whole grid in one broadcast; the slider only picks a slice of it
+    grid = savings_grid(projected_automatable_hours, *np.ix_(
+        SENSITIVITY_EFFICIENCIES, SENSITIVITY_HOURLY_RATES, SENSITIVITY_AI_COSTS
+    ))
+    
+    nearest_cost = SENSITIVITY_AI_COSTS[np.abs(SENSITIVITY_AI_COSTS - ai_cost_per_hour).argmin()]
+    ai_cost = st.select_slider(
+        "AI Cost per Hour ($) for the heatmaps",
+        options=SENSITIVITY_AI_COSTS.tolist(),
+        value=int(nearest_cost),
+        key="sensitivity_ai_cost"
+    )
+    cost_index = int(np.flatnonzero(SENSITIVITY_AI_COSTS == ai_cost)[0])
+    net_savings = grid['net_savings'][:, :, cost_index]
+    roi = grid['roi'][:, :, cost_index]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Scenarios Evaluated", f"{grid['net_savings'].size:,}")
+    with col2:
+        st.metric("Scenarios Breaking Even", f"{(grid['net_savings'] >= 0).mean() * 100:.1f}%")
+    with col3:
+        # Net savings are hours x (efficiency x rate - AI cost), so break-even does not depend on hours
+        st.metric("Break-even Efficiency at Current Rate", f"{min(ai_cost / avg_hourly_rate, 1) * 100:.1f}%")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = go.Figure()
+        fig.add_trace(go.Heatmap(
+            x=SENSITIVITY_HOURLY_RATES,
+            y=SENSITIVITY_EFFICIENCIES * 100,
+            z=net_savings,
+            customdata=roi,
+            colorscale='RdYlGn',
+            zmid=0,
+            colorbar=dict(title='Net ($)'),
+            hovertemplate='Rate $%{x:,.0f}<br>Efficiency %{y:.0f}%<br>Net $%{z:,.0f}<br>ROI %{customdata:,.0f}%<extra></extra>'
+        ))
+        fig.add_trace(go.Contour(
+            x=SENSITIVITY_HOURLY_RATES,
+            y=SENSITIVITY_EFFICIENCIES * 100,
+            z=net_savings,
+            contours=dict(start=0, end=0, size=1, coloring='lines'),
+            line=dict(color='black', width=3),
+            showscale=False,
+            name='Break-even',
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=[avg_hourly_rate],
+            y=[ai_efficiency_gain * 100],
+            mode='markers',
+            marker=dict(color='black', size=12, symbol='x'),
+            name='Current assumptions'
+        ))
+        fig.update_layout(
+            title=f'Net Savings at ${ai_cost} AI Cost per Hour (line: break-even)',
+            xaxis_title='Average Hourly Rate ($)',
+            yaxis_title='AI Efficiency Gain (%)',
+            height=450
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Per category at the current hourly rate, across efficiencies
+        category_grid = savings_grid(
+            category_hours['Automatable_Hours'].to_numpy()[:, None], SENSITIVITY_EFFICIENCIES[None, :],
+            avg_hourly_rate, ai_cost
+        )
+        fig = go.Figure(go.Heatmap(
+            x=SENSITIVITY_EFFICIENCIES * 100,
+            y=category_hours['Task_Category'].astype(str),
+            z=category_grid['net_savings'],
+            colorscale='RdYlGn',
+            zmid=0,
+            colorbar=dict(title='Net ($)'),
+            hovertemplate='%{y}<br>Efficiency %{x:.0f}%<br>Net $%{z:,.0f}<extra></extra>'
+        ))
+        fig.update_layout(
+            title=f'Net Savings by Category at ${avg_hourly_rate:,.0f}/hour',
+            xaxis_title='AI Efficiency Gain (%)',
+            height=450
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    record_timing('Sensitivity Analysis', started)
+
+# Taxonomy choices of the Monte Carlo simulation: (category column, automatable hours column)
+MONTE_CARLO_TAXONOMIES = {
+    'LegalBench': ('Task_Category', 'Automatable_Hours'),
+    'OLI': ('OLI_Category', 'OLI_Automatable_Hours'),
+}
+MONTE_CARLO_DRAWS = [10_000, 50_000, 100_000, 200_000]
+
+@st.fragment
+def monte_carlo_panel(current_data, hours_scale):
+    """P10/P50/P90 projected net savings with uncertain category potentials and efficiency"""
+    started = time.perf_counter()
+    st.markdown("---")
+    st.subheader("🎰 Monte Carlo Simulation")
+    st.markdown("Automation potentials are point estimates; this samples each category's potential "
+                "and the efficiency gain around them to show the range of projected net savings.")
+    
+    avg_hourly_rate, ai_efficiency_gain, ai_cost_per_hour = cost_assumptions()
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        taxonomy = st.radio("Taxonomy", list(MONTE_CARLO_TAXONOMIES), horizontal=True, key="monte_carlo_taxonomy")
+        distribution = st.selectbox("Distribution", SIMULATION_DISTRIBUTIONS, key="monte_carlo_distribution")
+    with col2:
+        potential_spread = st.slider(
+            "Potential Uncertainty (± points)", min_value=0, max_value=30, value=10,
+            help="Half-width (standard deviation for Beta) around each category's automation potential",
+            key="monte_carlo_potential_spread"
+        )
+        efficiency_spread = st.slider(
+            "Efficiency Uncertainty (± points)", min_value=0, max_value=30, value=10,
+            key="monte_carlo_efficiency_spread"
+        )
+    with col3:
+        draws = st.select_slider("Draws", options=MONTE_CARLO_DRAWS, value=100_000, key="monte_carlo_draws")
+    
+    # Projected hours per category; each category's point estimate is its automatable share
+    category_column, automatable_column = MONTE_CARLO_TAXONOMIES[taxonomy]
+    categories = rollup(current_data, [category_column], ['Hours', automatable_column])
+    categories = categories[categories['Hours'] > 0]
+    potentials = categories[automatable_column] / categories['Hours']
+    
+    simulation_started = time.perf_counter()
+    net_savings = simulate_net_savings(
+        categories['Hours'] * hours_scale, potentials, ai_efficiency_gain, avg_hourly_rate, ai_cost_per_hour,
+        potential_spread / 100, efficiency_spread / 100, distribution, draws=draws
+    )
+    p10, p50, p90 = np.percentile(net_savings, [10, 50, 90])
+    simulation_seconds = time.perf_counter() - simulation_started
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("P10 Net Savings", f"${p10:,.0f}")
+    with col2:
+        st.metric("P50 Net Savings", f"${p50:,.0f}")
+    with col3:
+        st.metric("P90 Net Savings", f"${p90:,.0f}")
+    with col4:
+        st.metric("Chance of a Net Loss", f"{(net_savings < 0).mean() * 100:.1f}%")
+    
+    # Binned before plotting rather than sending every draw to the browser
+    counts, edges = np.histogram(net_savings, bins=60)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='steelblue',
+        hovertemplate='$%{x:,.0f}<br>%{y:,} draws<extra></extra>'
+    ))
+    for label, value in [('P10', p10), ('P50', p50), ('P90', p90)]:
+        fig.add_vline(x=value, line_dash='dash', annotation_text=label)
+    fig.update_layout(
+        title=f'Projected Net Savings over {draws:,} Draws',
+        xaxis_title='Net Savings ($)',
+        yaxis_title='Draws',
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{draws:,} draws x {len(categories)} categories simulated in {simulation_seconds * 1000:,.0f} ms")
+    
+    record_timing('Monte Carlo Simulation', started)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def category_top_descriptions(_index, _selected_rows, selection_key):
+    """Top 5 descriptions of every LegalBench category in one pass (cached per filter selection)"""
+    return _index.top_descriptions_by_category(np.flatnonzero(_selected_rows), n=5)
+
+def render_task_definitions_tab(index, selected_rows, selection_key):
+    """Task Definitions tab: LegalBench categories with the top matching tasks"""
+    st.header("📚 LegalBench Task Definitions")
+    st.markdown("""
+    Based on the **LegalBench: A Collaboratively Built Benchmark for Measuring Legal Reasoning 
+    in Large Language Models**, here are the key task categories that can be automated with AI:
+    """)
+    
+    # Streaming mode keeps no descriptions
+    top_tasks = category_top_descriptions(index, selected_rows, selection_key) if index is not None else {}
+    
+    for category, info in LEGALBENCH_TASKS.items():
+        with st.expander(f"**{category}** - Automation Potential: {info['automation_potential']*100:.0f}%"):
+            st.markdown(f"**Description:** {info['description']}")
             
-            scenario_df = pd.DataFrame(scenario_results)
+            st.markdown("**Common Keywords:**")
+            st.write(", ".join(info['keywords']))
             
-            # Display scenarios
-            col1, col2 = st.columns([2, 1])
+            st.markdown("**Example Tasks:**")
+            for example in info['examples']:
+                st.write(f"• {example}")
             
-            with col1:
-                fig = go.Figure()
-                
-                fig.add_trace(go.Bar(
-                    x=scenario_df['Scenario'],
-                    y=scenario_df['Net Savings'],
-                    name='Net Savings',
-                    marker_color='green',
-                    text=scenario_df['Net Savings'].apply(lambda x: f'${x:,.0f}'),
-                    textposition='auto'
-                ))
-                
-                fig.update_layout(
-                    title='Net Savings by Scenario',
-                    xaxis_title='Scenario',
-                    yaxis_title='Net Savings ($)',
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            # Show actual tasks from data
+            matching_tasks = top_tasks.get(category, pd.Series(dtype='int64'))
             
-            with col2:
-                st.dataframe(
-                    scenario_df.style.format({
-                        'Hours Saved': '{:,.0f}',
-                        'Cost Saved': '${:,.0f}',
-                        'AI Cost': '${:,.0f}',
-                        'Net Savings': '${:,.0f}',
-                        'ROI (%)': '{:.0f}%'
-                    }),
-                    use_container_width=True,
-                    height=400
-                )
-        else:
-            st.warning("No 2025 data available for projections")
+            if len(matching_tasks) > 0:
+                st.markdown("**Top 5 Actual Tasks in Your Data:**")
+                for task, count in matching_tasks.items():
+                    if pd.notna(task):
+                        st.write(f"• {task[:100]}{'...' if len(task) > 100 else ''} ({count} times)")
     
-    # TAB 6: Task Definitions
-    with tab6:
-        st.header("📚 LegalBench Task Definitions")
+    st.markdown("---")
+    st.subheader("📊 Automation Potential Summary")
+    
+    summary_df = pd.DataFrame([
+        {
+            'Category': cat,
+            'Automation Potential': f"{info['automation_potential']*100:.0f}%",
+            'Primary Use Cases': ', '.join(info['examples'][:2])
+        }
+        for cat, info in LEGALBENCH_TASKS.items()
+    ])
+    
+    st.dataframe(summary_df, use_container_width=True, height=400)
+    
+    # Implementation recommendations
+    st.markdown("---")
+    st.subheader("💡 Implementation Recommendations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
         st.markdown("""
-        Based on the **LegalBench: A Collaboratively Built Benchmark for Measuring Legal Reasoning 
-        in Large Language Models**, here are the key task categories that can be automated with AI:
+        #### Quick Wins (High Automation Potential)
+        1. **Document Review** (90%) - Implement AI-powered contract review
+        2. **Rule-Recall/Legal Research** (95%) - AI legal research assistants
+        3. **Routine Administrative** (95%) - Automated form filling and filing
+        4. **Issue-Spotting** (85%) - AI-assisted initial case assessment
         """)
-        
-        for category, info in LEGALBENCH_TASKS.items():
-            with st.expander(f"**{category}** - Automation Potential: {info['automation_potential']*100:.0f}%"):
-                st.markdown(f"**Description:** {info['description']}")
-                
-                st.markdown("**Common Keywords:**")
-                st.write(", ".join(info['keywords']))
-                
-                st.markdown("**Example Tasks:**")
-                for example in info['examples']:
-                    st.write(f"• {example}")
-                
-                # Show actual tasks from data
-                matching_tasks = filtered_df[
-                    filtered_df['Task_Category'] == category
-                ]['Description'].value_counts().head(5)
-                
-                if len(matching_tasks) > 0:
-                    st.markdown("**Top 5 Actual Tasks in Your Data:**")
-                    for task, count in matching_tasks.items():
-                        if pd.notna(task):
-                            st.write(f"• {task[:100]}{'...' if len(task) > 100 else ''} ({count} times)")
-        
-        st.markdown("---")
-        st.subheader("📊 Automation Potential Summary")
-        
-        summary_df = pd.DataFrame([
-            {
-                'Category': cat,
-                'Automation Potential': f"{info['automation_potential']*100:.0f}%",
-                'Primary Use Cases': ', '.join(info['examples'][:2])
-            }
-            for cat, info in LEGALBENCH_TASKS.items()
-        ])
-        
-        st.dataframe(summary_df, use_container_width=True, height=400)
-        
-        # Implementation recommendations
-        st.markdown("---")
-        st.subheader("💡 Implementation Recommendations")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            #### Quick Wins (High Automation Potential)
-            1. **Document Review** (90%) - Implement AI-powered contract review
-            2. **Rule-Recall/Legal Research** (95%) - AI legal research assistants
-            3. **Routine Administrative** (95%) - Automated form filling and filing
-            4. **Issue-Spotting** (85%) - AI-assisted initial case assessment
-            """)
-        
-        with col2:
-            st.markdown("""
-            #### Medium-Term Opportunities
-            1. **Interpretation** (80%) - Contract clause analysis tools
-            2. **Rule-Application** (70%) - Compliance assessment automation
-            3. **Rule-Conclusion** (65%) - AI-assisted legal opinions
-            4. **Rhetorical Understanding** (55%) - Assisted brief drafting
-            """)
-        
-        st.info("""
-        **Note:** The automation potentials are estimates based on current AI capabilities and 
-        the LegalBench framework. Actual results may vary based on specific use cases, 
-        implementation quality, and human oversight requirements.
+    
+    with col2:
+        st.markdown("""
+        #### Medium-Term Opportunities
+        1. **Interpretation** (80%) - Contract clause analysis tools
+        2. **Rule-Application** (70%) - Compliance assessment automation
+        3. **Rule-Conclusion** (65%) - AI-assisted legal opinions
+        4. **Rhetorical Understanding** (55%) - Assisted brief drafting
         """)
+    
+    st.info("""
+    **Note:** The automation potentials are estimates based on current AI capabilities and 
+    the LegalBench framework. Actual results may vary based on specific use cases, 
+    implementation quality, and human oversight requirements.
+    """)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,176 @@
+"""Headless activity pipeline: load, normalize, classify and aggregate without Streamlit
+
+Run from cron or a worker to precompute what the dashboard needs:
+
+    python pipeline.py "activities 2025-10-30 10-21-00.csv" --out artifacts --workers 4
+    python pipeline.py exports/ --out artifacts
+
+The dashboard then reads the artifacts instead of classifying on request.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from aggregates import aggregate_activities, compact_aggregates
+from description_index import DescriptionIndex
+from ingest import (
+    add_derived_columns,
+    apply_flat_fee_hours,
+    file_sha256,
+    read_activity_csv,
+    read_activity_store,
+    read_columnar_cache,
+    update_activity_store,
+    write_columnar_cache,
+)
+from task_classifier import classify_series
+from taxonomies import LEGALBENCH_MATCHER, OLI_MATCHER, TAXONOMY_VERSION
+
+# Files written to an artifact directory; the manifest is written last
+ARTIFACT_ROWS = 'rows.parquet'
+ARTIFACT_CUBE = 'cube.parquet'
+ARTIFACT_INDEX = 'index.npz'
+ARTIFACT_MANIFEST = 'manifest.json'
+
+
+def load_activities(csv_path):
+    """Typed activity rows of a CSV with derived columns (through the columnar cache)"""
+    # Typed columnar copy of a previous parse survives process restarts
+    df = read_columnar_cache(csv_path)
+    if df is not None:
+        return df
+
+    # Only the columns the dashboard uses, with declared dtypes; bad values are reported
+    df = read_activity_csv(csv_path)
+
+    # Zero-filled hours, Year/Month and the flat fee flag
+    add_derived_columns(df)
+
+    write_columnar_cache(csv_path, df)
+    return df
+
+
+def classify_rows(df, memo=None, workers=1):
+    """Add LegalBench and OLI category and potential columns to a frame (in place)"""
+    # Each unique description is classified once and broadcast back to its rows
+    df['Task_Category'], df['Automation_Potential'] = classify_series(
+        df['Description'], LEGALBENCH_MATCHER, memo=memo, workers=workers
+    )
+    df['OLI_Category'], df['OLI_Automation_Potential'] = classify_series(
+        df['Description'], OLI_MATCHER, memo=memo, workers=workers
+    )
+    return df
+
+
+def prepare_activities(csv_path, memo=None, workers=1):
+    """Load a CSV, count flat fee entries as 1 hour and classify every row"""
+    df = load_activities(csv_path)
+    apply_flat_fee_hours(df)
+    return classify_rows(df, memo=memo, workers=workers)
+
+
+def prepare_export_store(export_dir, memo=None, workers=1):
+    """Merge an export directory into its store and return (classified rows, store version)"""
+    summary = update_activity_store(
+        export_dir, lambda df: classify_rows(df, memo=memo, workers=workers), TAXONOMY_VERSION
+    )
+    return apply_flat_fee_hours(read_activity_store(export_dir)), summary['version']
+
+
+def write_artifacts(out_dir, rows, cube, manifest, index=None):
+    """Write rows, cube, description index and manifest; readers only trust a directory once its manifest exists"""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, ARTIFACT_MANIFEST)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    for frame, name in [(rows, ARTIFACT_ROWS), (cube, ARTIFACT_CUBE)]:
+        tmp_path = os.path.join(out_dir, f"{name}.tmp")
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(out_dir, name))
+    if index is not None:
+        tmp_path = os.path.join(out_dir, f"{ARTIFACT_INDEX}.tmp")
+        with open(tmp_path, 'wb') as f:
+            index.save(f)
+        os.replace(tmp_path, os.path.join(out_dir, ARTIFACT_INDEX))
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def read_artifact_manifest(out_dir):
+    """Manifest of a complete artifact directory built with the current taxonomy, or None"""
+    manifest_path = os.path.join(out_dir, ARTIFACT_MANIFEST)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('taxonomy_version') != TAXONOMY_VERSION:
+        return None
+    return manifest
+
+
+def read_artifacts(out_dir):
+    """Load (rows, cube) from an artifact directory, or None if it has no current manifest"""
+    manifest = read_artifact_manifest(out_dir)
+    if manifest is None:
+        return None
+    rows = pd.read_parquet(os.path.join(out_dir, ARTIFACT_ROWS))
+    cube = pd.read_parquet(os.path.join(out_dir, ARTIFACT_CUBE))
+    rows.attrs['schema_errors'] = manifest['schema_errors']
+    return rows, cube
+
+
+def read_artifact_index(out_dir):
+    """The persisted DescriptionIndex of an artifact directory, or None if it has none"""
+    index_path = os.path.join(out_dir, ARTIFACT_INDEX)
+    if not os.path.exists(index_path):
+        return None
+    return DescriptionIndex.load(index_path)
+
+
+def run(source, out_dir, workers=1):
+    """Build the artifacts for a CSV file or an export directory; returns the manifest"""
+    started = time.perf_counter()
+    if os.path.isdir(source):
+        rows, source_version = prepare_export_store(source, workers=workers)
+        data_version = source_version
+    else:
+        rows = prepare_activities(source, workers=workers)
+        data_version = f"{file_sha256(source)}-{TAXONOMY_VERSION}"
+    cube = compact_aggregates(aggregate_activities(rows))
+    index = DescriptionIndex(rows['Description'], rows['Task_Category'], LEGALBENCH_MATCHER)
+
+    manifest = {
+        'version': data_version,
+        'taxonomy_version': TAXONOMY_VERSION,
+        'source': os.path.abspath(source),
+        'rows': len(rows),
+        'cube_rows': len(cube),
+        'schema_errors': rows.attrs.get('schema_errors', {}),
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+    write_artifacts(out_dir, rows, cube, manifest, index=index)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('source', help="activities CSV or a directory of daily exports")
+    parser.add_argument('--out', default='artifacts', help="artifact directory (default: artifacts)")
+    parser.add_argument('--workers', type=int, default=1, help="classification processes (default: 1)")
+    args = parser.parse_args(argv)
+
+    manifest = run(args.source, args.out, workers=args.workers)
+    print(f"{manifest['rows']:,} rows -> {manifest['cube_rows']:,} cube rows in {manifest['seconds']}s "
+          f"({args.out}, version {manifest['version']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Precomputed row indexes behind the sidebar filters"""
+import numpy as np
+import pandas as pd
+
+# Columns the sidebar filters on by value
+FILTER_COLUMNS = ['Year', 'User', 'Matter number']
+# Columns with at most this many distinct values get one packed bitmap per value
+# (N / 8 bytes each, so 32 of them take as much as int32 codes); wider columns
+# are answered from their integer codes instead
+BITMAP_MAX_VALUES = 32
+
+
+def period_labels(periods):
+    """'YYYY-MM' labels for month periods (year * 12 + month - 1)"""
+    return [f"{period // 12}-{period % 12 + 1:02d}" for period in periods]
+
+
+class FilterIndex:
+    """Row selections for one frame (row-level or aggregated), built once per dataset
+
+    Every filter column is factorized; low-cardinality columns keep a packed
+    bitmap of their rows per value, so a selection is an OR over a few
+    bitmaps, and the others keep their integer codes. Months are kept as a sorted
+    period index, so a date range is a binary search plus a scatter. All
+    selections return boolean row masks to be combined with `&`.
+    """
+
+    def __init__(self, frame, columns=FILTER_COLUMNS):
+        self.n_rows = len(frame)
+        self.codes = {}
+        self.values = {}
+        self.bitmaps = {}
+        for column in columns:
+            codes, values = pd.factorize(frame[column], sort=True, use_na_sentinel=True)
+            self.values[column] = values
+            if len(values) <= BITMAP_MAX_VALUES:
+                bitmaps = np.zeros((len(values), (self.n_rows + 7) // 8), dtype=np.uint8)
+                for code in range(len(values)):
+                    bitmaps[code] = np.packbits(codes == code)
+                self.bitmaps[column] = bitmaps
+            else:
+                self.codes[column] = codes.astype(np.int32)
+
+        # Month periods (year * 12 + month - 1) in sorted order; rows without a date sort last
+        periods = (frame['Year'] * 12 + frame['Month'] - 1).to_numpy(dtype=np.float64)
+        self.period_order = np.argsort(periods, kind='stable')
+        self.sorted_periods = periods[self.period_order]
+        self.periods = np.unique(self.sorted_periods[~np.isnan(self.sorted_periods)]).astype(np.int64)
+
+    def options(self, column):
+        """Distinct non-null values of a filter column, sorted"""
+        return list(self.values[column])
+
+    def select(self, column, values):
+        """Mask of rows whose column is one of values"""
+        codes = self.values[column].get_indexer(list(values))
+        codes = codes[codes >= 0]
+        if column in self.bitmaps:
+            if not len(codes):
+                return np.zeros(self.n_rows, dtype=bool)
+            bits = np.bitwise_or.reduce(self.bitmaps[column][codes], axis=0)
+            return np.unpackbits(bits, count=self.n_rows).astype(bool)
+        wanted = np.zeros(len(self.values[column]) + 1, dtype=bool)
+        wanted[codes] = True
+        # Code -1 (missing value) reads the trailing False slot
+        return wanted[self.codes[column]]
+
+    def period_range(self, start, end):
+        """Mask of rows dated within months start..end inclusive (periods as in self.periods)"""
+        low = np.searchsorted(self.sorted_periods, start, side='left')
+        high = np.searchsorted(self.sorted_periods, end, side='right')
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.period_order[low:high]] = True
+        return mask
@@ -0,0 +1,100 @@
+"""Cost savings formulas shared by the Cost Savings and Predictions views"""
+import numpy as np
+
+# Monte Carlo draws are generated this many at a time, bounding memory to batch x categories
+SIMULATION_BATCH = 50_000
+# Triangular is the default: Beta draws take about three times as long
+SIMULATION_DISTRIBUTIONS = ['Triangular', 'Beta', 'Uniform']
+
+
+def savings_summary(automatable_hours, ai_efficiency_gain, avg_hourly_rate, ai_cost_per_hour):
+    """Hours saved, labor savings, AI cost, net savings and ROI (%) for a number of automatable hours"""
+    hours_saved = automatable_hours * ai_efficiency_gain
+    labor_cost_saved = hours_saved * avg_hourly_rate
+    ai_cost = automatable_hours * ai_cost_per_hour
+    net_savings = labor_cost_saved - ai_cost
+    roi = (net_savings / ai_cost * 100) if ai_cost > 0 else 0
+    return {
+        'hours_saved': hours_saved,
+        'labor_cost_saved': labor_cost_saved,
+        'ai_cost': ai_cost,
+        'net_savings': net_savings,
+        'roi': roi,
+    }
+
+
+def savings_grid(automatable_hours, ai_efficiency_gain, avg_hourly_rate, ai_cost_per_hour):
+    """savings_summary over arrays in one broadcast computation
+
+    Inputs broadcast against each other, so axes built with np.ix_ evaluate
+    every combination at once (e.g. efficiency x hourly rate x AI cost).
+    ROI is 0 where the AI cost is 0, as in savings_summary.
+    """
+    hours_saved = np.multiply(automatable_hours, ai_efficiency_gain)
+    labor_cost_saved = hours_saved * avg_hourly_rate
+    ai_cost = np.multiply(automatable_hours, ai_cost_per_hour)
+    net_savings = labor_cost_saved - ai_cost
+    ai_cost = np.broadcast_to(ai_cost, np.shape(net_savings))
+    roi = np.divide(net_savings * 100, ai_cost, out=np.zeros(np.shape(net_savings)), where=ai_cost > 0)
+    return {
+        'hours_saved': hours_saved,
+        'labor_cost_saved': labor_cost_saved,
+        'ai_cost': ai_cost,
+        'net_savings': net_savings,
+        'roi': roi,
+    }
+
+
+def add_hour_savings(frame, ai_efficiency_gain, avg_hourly_rate, column='Cost_Savings'):
+    """Copy of an hours frame with Hours_Saved and the given savings column from its Automatable_Hours"""
+    frame = frame.copy()
+    frame['Hours_Saved'] = frame['Automatable_Hours'] * ai_efficiency_gain
+    frame[column] = frame['Hours_Saved'] * avg_hourly_rate
+    return frame
+
+
+def sample_around(rng, center, spread, size, distribution='Triangular'):
+    """Draws in [0, 1] around center (broadcast to size)
+
+    spread is the standard deviation for 'Beta' (mean = center) and the
+    half-width for 'Triangular' (mode = center) and 'Uniform'; ranges are
+    clipped to [0, 1]. A spread of 0 returns center itself.
+    """
+    center = np.broadcast_to(np.asarray(center, dtype='float64'), size)
+    if spread <= 0:
+        return center.copy()
+    if distribution == 'Beta':
+        # Method of moments; the mean is kept off 0 and 1 and the variance below its maximum
+        mean = np.clip(center, 0.005, 0.995)
+        concentration = np.maximum(mean * (1 - mean) / spread ** 2 - 1, 0.5)
+        return rng.beta(mean * concentration, (1 - mean) * concentration)
+    low = np.clip(center - spread, 0, 1)
+    high = np.clip(center + spread, 0, 1)
+    if distribution == 'Triangular':
+        return rng.triangular(low, np.clip(center, 0, 1), high)
+    if distribution == 'Uniform':
+        return rng.uniform(low, high)
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def simulate_net_savings(category_hours, potentials, ai_efficiency_gain, avg_hourly_rate, ai_cost_per_hour,
+                         potential_spread, efficiency_spread, distribution='Triangular', draws=100_000, seed=0):
+    """Net savings of each Monte Carlo draw, with uncertain automation potentials and efficiency
+
+    Every draw samples one potential per category and one efficiency gain;
+    the category hours are fixed. Automatable hours of a whole batch are one
+    matrix product, then go through the savings formulas (see savings_grid).
+    """
+    rng = np.random.default_rng(seed)
+    category_hours = np.asarray(category_hours, dtype='float64')
+    potentials = np.asarray(potentials, dtype='float64')
+    net_savings = np.empty(draws)
+    for start in range(0, draws, SIMULATION_BATCH):
+        size = min(SIMULATION_BATCH, draws - start)
+        sampled_potentials = sample_around(rng, potentials, potential_spread, (size, len(potentials)), distribution)
+        efficiency = sample_around(rng, ai_efficiency_gain, efficiency_spread, size, distribution)
+        automatable_hours = sampled_potentials @ category_hours
+        net_savings[start:start + size] = savings_grid(
+            automatable_hours, efficiency, avg_hourly_rate, ai_cost_per_hour
+        )['net_savings']
+    return net_savings
@@ -0,0 +1,347 @@
+"""Keyword classification engine for the LegalBench and OLI task taxonomies"""
+import hashlib
+import json
+import multiprocessing
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+UNCLASSIFIED = 'Unclassified'
+
+# Unique descriptions per worker task when classifying in a process pool
+PARTITION_SIZE = 50_000
+
+# Matcher of a pool worker process, installed once by _init_worker
+_worker_matcher = None
+
+
+def _build_trie(keywords):
+    """Build a character trie from a list of keywords ('' marks a keyword end)"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def _trie_to_regex(node):
+    """Render a trie as a regex that prefers the longest keyword at each node"""
+    branches = [re.escape(char) + _trie_to_regex(child)
+                for char, child in sorted(node.items()) if char != '']
+    if not branches:
+        return ''
+    if len(branches) == 1:
+        body = branches[0]
+    else:
+        body = '(?:' + '|'.join(branches) + ')'
+    # A keyword can end here, so the longer continuation is optional (greedy)
+    if '' in node:
+        return '(?:' + body + ')?'
+    return body
+
+
+class TaxonomyMatcher:
+    """Compiled multi-keyword matcher for one task taxonomy
+
+    All keywords are folded into a single trie-shaped regex wrapped in a
+    lookahead, so one scan of a description reports the longest keyword
+    starting at every position. Every keyword is found this way because a
+    shorter keyword matching at the same position is a prefix of the longest
+    one. Scores and tie-breaking follow the original substring loop exactly:
+    each distinct keyword counts once per category it is listed in, and ties
+    go to the category defined first.
+    """
+
+    def __init__(self, taxonomy, default_potential, missing_potential=0.0, priority_category=None):
+        # Stable across reruns and processes; used to key memoized results
+        self.version = hashlib.sha256(json.dumps(
+            [taxonomy, default_potential, missing_potential, priority_category]
+        ).encode('utf-8')).hexdigest()[:16]
+        self.categories = list(taxonomy)
+        self.potentials = [taxonomy[category]['automation_potential'] for category in self.categories]
+        self.default_potential = default_potential
+        self.missing_potential = missing_potential
+        self.priority_index = (self.categories.index(priority_category)
+                               if priority_category is not None else None)
+
+        # keyword -> category indices (a keyword listed twice in one category scores twice)
+        self.keyword_categories = {}
+        for index, category in enumerate(self.categories):
+            for keyword in taxonomy[category]['keywords']:
+                self.keyword_categories.setdefault(keyword, []).append(index)
+
+        keywords = list(self.keyword_categories)
+        # longest match -> every keyword that is a prefix of it
+        self.prefixes = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+        self.pattern = re.compile('(?=(' + _trie_to_regex(_build_trie(keywords)) + '))')
+
+        # Integer (CSR-style) versions of the lookup tables for column-level classification
+        self.keyword_ids = {keyword: index for index, keyword in enumerate(keywords)}
+        self.prefix_offsets, self.prefix_ids = _to_csr(
+            [[self.keyword_ids[other] for other in self.prefixes[keyword]] for keyword in keywords]
+        )
+        self.category_offsets, self.category_ids = _to_csr(
+            [self.keyword_categories[keyword] for keyword in keywords]
+        )
+        # Category lookup tables; the extra trailing slot is 'Unclassified'
+        self.labels = self.categories + [UNCLASSIFIED]
+        self.potential_table = np.array(self.potentials + [default_potential], dtype=np.float32)
+
+    def matched_keywords(self, text):
+        """Return the set of keywords contained in an already lower-cased text"""
+        hits = set()
+        for match in self.pattern.finditer(text):
+            hits.update(self.prefixes[match.group(1)])
+        return hits
+
+    def score(self, text):
+        """Return per-category keyword counts for an already lower-cased text"""
+        scores = [0] * len(self.categories)
+        for keyword in self.matched_keywords(text):
+            for index in self.keyword_categories[keyword]:
+                scores[index] += 1
+        return scores
+
+    def best_index(self, scores):
+        """Pick the winning category index from a score list, or None"""
+        if self.priority_index is not None:
+            if scores[self.priority_index] > 0:
+                return self.priority_index
+            scores = list(scores)
+            scores[self.priority_index] = 0
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return best if scores[best] > 0 else None
+
+    def classify_code(self, description):
+        """Return the category code (index into self.labels) of a non-null description"""
+        best = self.best_index(self.score(description.lower()))
+        return len(self.categories) if best is None else best
+
+    def classify(self, description, memo=None):
+        """Classify a single description into (category, automation_potential)"""
+        if pd.isna(description):
+            return UNCLASSIFIED, self.missing_potential
+        if memo is None:
+            code = self.classify_code(description)
+        else:
+            key = (self.version, description)
+            code = memo.get(key)
+            if code is None:
+                code = self.classify_code(description)
+                memo.put(key, code)
+        if code == len(self.categories):
+            return UNCLASSIFIED, self.default_potential
+        return self.categories[code], self.potentials[code]
+
+
+class ClassificationMemo:
+    """Thread-safe, size-bounded LRU memo of description -> category code
+
+    Keys are (matcher version, description), so one memo can be shared by
+    several taxonomies. Besides memo hits and misses it tracks how many rows
+    were classified and how many of them were unique descriptions.
+    """
+
+    def __init__(self, maxsize=200_000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rows = 0
+        self.unique_descriptions = 0
+
+    def get(self, key):
+        """Return the memoized code for key, or None"""
+        with self._lock:
+            code = self._entries.get(key)
+            if code is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return code
+
+    def put(self, key, code):
+        """Store a code, evicting the least recently used entries beyond maxsize"""
+        with self._lock:
+            self._entries[key] = code
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_many(self, version, descriptions):
+        """Look up many descriptions at once; returns codes with -1 for misses"""
+        codes = np.full(len(descriptions), -1, dtype=np.int64)
+        with self._lock:
+            for position, description in enumerate(descriptions):
+                key = (version, description)
+                code = self._entries.get(key)
+                if code is not None:
+                    codes[position] = code
+                    self._entries.move_to_end(key)
+            found = int((codes >= 0).sum())
+            self.hits += found
+            self.misses += len(descriptions) - found
+        return codes
+
+    def put_many(self, version, descriptions, codes):
+        """Store many (description, code) results at once"""
+        with self._lock:
+            for description, code in zip(descriptions, codes):
+                self._entries[(version, description)] = int(code)
+                self._entries.move_to_end((version, description))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def record_batch(self, rows, unique_descriptions):
+        """Count a column classification for the dedup ratio"""
+        with self._lock:
+            self.rows += rows
+            self.unique_descriptions += unique_descriptions
+
+    def stats(self):
+        """Snapshot of the memo counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'rows': self.rows,
+                'unique_descriptions': self.unique_descriptions,
+                'dedup_ratio': self.rows / self.unique_descriptions if self.unique_descriptions else 0.0,
+            }
+
+
+def _to_csr(rows):
+    """Pack a list of integer lists into (offsets, values) arrays"""
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(row) for row in rows])
+    values = np.array([value for row in rows for value in row], dtype=np.int64)
+    return offsets, values
+
+
+def _expand(owners, ids, offsets, values):
+    """Expand each (owner, id) pair into one pair per CSR value of that id"""
+    starts = offsets[ids]
+    counts = offsets[ids + 1] - starts
+    repeat = np.repeat(np.arange(len(ids)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners[repeat], values[starts[repeat] + within]
+
+
+def keyword_matches(matcher, texts):
+    """Every (text position, keyword id) pair where a keyword occurs in a non-null text
+
+    Pairs are unique and sorted by text position; keyword ids index
+    `list(matcher.keyword_ids)`.
+    """
+    # One regex scan per text, then flatten to (row, longest keyword) pairs
+    longest = pd.Series(texts, dtype=object).str.lower().str.findall(matcher.pattern).explode().dropna()
+    rows = longest.index.to_numpy(dtype=np.int64)
+    keyword_ids = longest.map(matcher.keyword_ids).to_numpy(dtype=np.int64)
+
+    # Longest match -> all keywords found at that position; each keyword counts once per row
+    rows, keyword_ids = _expand(rows, keyword_ids, matcher.prefix_offsets, matcher.prefix_ids)
+    n_keywords = len(matcher.keyword_ids)
+    pairs = np.unique(rows * n_keywords + keyword_ids)
+    return pairs // n_keywords, pairs % n_keywords
+
+
+def _classify_texts(matcher, texts):
+    """Vectorized category codes for an array of non-null descriptions"""
+    n_rows = len(texts)
+    n_categories = len(matcher.categories)
+    rows, keyword_ids = keyword_matches(matcher, texts)
+
+    # Keyword -> categories, then per-(row, category) scores
+    rows, category_ids = _expand(rows, keyword_ids, matcher.category_offsets, matcher.category_ids)
+    cells, scores = np.unique(rows * n_categories + category_ids, return_counts=True)
+    rows, category_ids = cells // n_categories, cells % n_categories
+
+    codes = np.full(n_rows, n_categories, dtype=np.int64)
+    if matcher.priority_index is not None:
+        priority = category_ids == matcher.priority_index
+        codes[rows[priority]] = matcher.priority_index
+        keep = ~priority & (codes[rows] == n_categories)
+        rows, category_ids, scores = rows[keep], category_ids[keep], scores[keep]
+
+    # Highest score per row, ties going to the earlier category
+    order = np.lexsort((category_ids, -scores, rows))
+    rows, category_ids = rows[order], category_ids[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = rows[1:] != rows[:-1]
+    codes[rows[first]] = category_ids[first]
+    return codes
+
+
+def _init_worker(matcher):
+    """Install the read-only matcher in a pool worker"""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _classify_partition(texts):
+    """Pool task: category codes for one partition of descriptions"""
+    return _classify_texts(_worker_matcher, texts)
+
+
+def classify_texts_parallel(matcher, texts, workers, partition_size=PARTITION_SIZE):
+    """Category codes for non-null descriptions, computed over partitions in a process pool
+
+    Partitions are contiguous slices and results are concatenated in
+    order, so the codes are identical to _classify_texts(matcher, texts).
+    Each worker receives the matcher once. Small inputs skip the pool.
+    """
+    if workers <= 1 or len(texts) <= partition_size:
+        return _classify_texts(matcher, texts)
+    partitions = [texts[start:start + partition_size] for start in range(0, len(texts), partition_size)]
+    # spawn, because forking a multithreaded server process is unsafe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(matcher,)) as pool:
+        return np.concatenate(list(pool.map(_classify_partition, partitions)))
+
+
+def classify_series(descriptions, taxonomy, memo=None, workers=1):
+    """Classify a whole Description column against a compiled taxonomy
+
+    `taxonomy` is a TaxonomyMatcher. Each unique description is classified
+    once (optionally through a shared ClassificationMemo) and broadcast back
+    to its rows; with workers > 1 large batches are split across processes.
+    Returns a pd.Categorical of category labels and a float32 array of
+    automation potentials, both aligned with `descriptions`.
+    """
+    matcher = taxonomy
+    row_codes, uniques = pd.factorize(pd.Series(descriptions), use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+
+    if memo is None:
+        unique_codes = classify_texts_parallel(matcher, uniques, workers)
+    else:
+        unique_codes = memo.get_many(matcher.version, uniques)
+        todo = np.flatnonzero(unique_codes < 0)
+        if len(todo):
+            unique_codes[todo] = classify_texts_parallel(matcher, uniques[todo], workers)
+            memo.put_many(matcher.version, uniques[todo], unique_codes[todo])
+        memo.record_batch(len(row_codes), len(uniques))
+
+    # Broadcast back to rows; NaN descriptions (code -1) are Unclassified
+    missing = row_codes < 0
+    codes = np.full(len(row_codes), len(matcher.categories), dtype=np.int64)
+    codes[~missing] = unique_codes[row_codes[~missing]]
+    potentials = matcher.potential_table[codes]
+    potentials[missing] = matcher.missing_potential
+    categories = pd.Categorical.from_codes(codes, categories=matcher.labels)
+    return categories, potentials
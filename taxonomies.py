@@ -0,0 +1,420 @@
+"""LegalBench and OLI task taxonomies and their compiled matchers"""
+import hashlib
+import json
+
+from task_classifier import TaxonomyMatcher
+
+# Comprehensive LegalBench Task Categories with automation potential
+# Based on 162 tasks from LegalBench framework
+LEGALBENCH_TASKS = {
+    # CONTRACT ANALYSIS & REVIEW (High automation 85-95%)
+    'Contract-Clause-Identification': {
+        'description': 'Identifying and extracting specific contract clauses (CUAD tasks)',
+        'automation_potential': 0.92,
+        'keywords': ['anti-assignment', 'audit rights', 'cap on liability', 'change of control', 
+                    'competitive restriction', 'covenant not to sue', 'effective date', 'exclusivity',
+                    'expiration date', 'governing law', 'insurance', 'ip ownership', 'license grant',
+                    'liquidated damages', 'minimum commitment', 'most favored nation', 'non-compete',
+                    'notice period', 'post-termination', 'price restrictions', 'renewal term',
+                    'revenue share', 'rofr', 'source code escrow', 'termination', 'warranty duration',
+                    'volume restriction', 'unlimited liability', 'clause review', 'provision'],
+        'examples': ['CUAD contract review', 'Clause extraction', 'Contract provision identification']
+    },
+    'Contract-NLI-Analysis': {
+        'description': 'Natural language inference for contract interpretation',
+        'automation_potential': 0.88,
+        'keywords': ['confidentiality', 'explicit identification', 'limited use', 'no licensing',
+                    'notice on disclosure', 'permissible copy', 'sharing with employees',
+                    'sharing with third parties', 'survival of obligations', 'contract entailment',
+                    'agreement interpretation', 'contract meaning'],
+        'examples': ['Contract clause interpretation', 'Confidentiality analysis', 'Obligation identification']
+    },
+    'Contract-QA': {
+        'description': 'Question answering about contract terms and provisions',
+        'automation_potential': 0.85,
+        'keywords': ['contract question', 'agreement terms', 'what does contract say', 'contract provision',
+                    'consumer contract', 'terms of service', 'contract language'],
+        'examples': ['Contract Q&A', 'Consumer contract analysis', 'Terms clarification']
+    },
+    
+    # M&A AND CORPORATE (Medium-High automation 75-90%)
+    'MA-Deal-Terms': {
+        'description': 'M&A deal terms analysis (MAUD tasks)',
+        'automation_potential': 0.82,
+        'keywords': ['maud', 'accuracy of target', 'accuracy of fundamental', 'capitalization',
+                    'matching rights', 'buyer consent', 'change in law', 'changes in gaap',
+                    'cor permitted', 'cor standard', 'intervening event', 'liability standard',
+                    'ordinary course', 'pandemic', 'public health', 'relational language',
+                    'tail period', 'type of consideration', 'merger agreement', 'acquisition'],
+        'examples': ['M&A agreement review', 'Deal term extraction', 'Acquisition document analysis']
+    },
+    'Corporate-Transactions': {
+        'description': 'Corporate transaction elements and terms',
+        'automation_potential': 0.80,
+        'keywords': ['ability to consummate', 'accounting principles', 'negative covenant',
+                    'outstanding shares', 'superior offer', 'no shop', 'shop breach',
+                    'determination trigger', 'transferable license', 'corporate action'],
+        'examples': ['Transaction document review', 'Corporate covenant analysis', 'Deal structure review']
+    },
+    'Corporate-Governance': {
+        'description': 'Corporate governance and compliance matters',
+        'automation_potential': 0.75,
+        'keywords': ['corporate lobbying', 'supply chain disclosure', 'best practice audits',
+                    'disclosed training', 'governance', 'compliance disclosure', 'corporate policy'],
+        'examples': ['Corporate lobbying analysis', 'Supply chain compliance', 'Disclosure review']
+    },
+    
+    # LITIGATION & PROCEDURE (Medium automation 70-85%)
+    'Case-Law-Analysis': {
+        'description': 'Case law research and citation analysis',
+        'automation_potential': 0.90,
+        'keywords': ['citation prediction', 'citation open', 'overruling', 'precedent',
+                    'case law', 'judicial decision', 'court opinion', 'legal authority'],
+        'examples': ['Citation research', 'Precedent analysis', 'Case law review']
+    },
+    'Legal-Issue-Spotting': {
+        'description': 'Identifying legal issues across practice areas (Learned Hands)',
+        'automation_potential': 0.85,
+        'keywords': ['learned hands', 'business law', 'consumer law', 'courts', 'crime',
+                    'divorce', 'domestic violence', 'education law', 'employment law',
+                    'estates', 'family law', 'health law', 'housing law', 'immigration',
+                    'torts', 'legal issue', 'identify problem', 'legal matter'],
+        'examples': ['Issue identification', 'Practice area classification', 'Legal problem spotting']
+    },
+    'Litigation-Documents': {
+        'description': 'Securities complaints and litigation document analysis',
+        'automation_potential': 0.87,
+        'keywords': ['securities complaint', 'ssla', 'company defendants', 'individual defendants',
+                    'plaintiff', 'complaint extraction', 'litigation document', 'pleading'],
+        'examples': ['Complaint analysis', 'Securities litigation review', 'Pleading extraction']
+    },
+    'Procedural-Analysis': {
+        'description': 'Court procedures and jurisdiction',
+        'automation_potential': 0.75,
+        'keywords': ['personal jurisdiction', 'diversity jurisdiction', 'oral argument',
+                    'question purpose', 'function of decision', 'court procedure'],
+        'examples': ['Jurisdiction analysis', 'Procedural review', 'Court filing analysis']
+    },
+    
+    # REGULATORY & COMPLIANCE (High automation 80-95%)
+    'Regulatory-Compliance': {
+        'description': 'Regulatory requirements and compliance analysis',
+        'automation_potential': 0.88,
+        'keywords': ['telemarketing sales rule', 'privacy policy', 'unfair tos',
+                    'unfair terms', 'consumer protection', 'regulatory requirement',
+                    'compliance check', 'regulation'],
+        'examples': ['Regulatory compliance review', 'Privacy policy analysis', 'Consumer protection']
+    },
+    'Privacy-Policy-Analysis': {
+        'description': 'Privacy policy interpretation and Q&A (OPP-115)',
+        'automation_potential': 0.90,
+        'keywords': ['opp-115', 'privacy policy qa', 'privacy policy entailment',
+                    'data collection', 'user choice', 'first party use', 'third party sharing',
+                    'data retention', 'data security', 'policy change', 'privacy'],
+        'examples': ['Privacy policy review', 'Data practice analysis', 'Privacy compliance']
+    },
+    'Insurance-Policy': {
+        'description': 'Insurance policy interpretation',
+        'automation_potential': 0.83,
+        'keywords': ['insurance policy', 'policy interpretation', 'coverage analysis',
+                    'insurance claim', 'policy language', 'insurance terms'],
+        'examples': ['Insurance policy review', 'Coverage determination', 'Policy interpretation']
+    },
+    
+    # STATUTORY INTERPRETATION (Medium-High automation 75-85%)
+    'Statutory-Interpretation': {
+        'description': 'Textualism and statutory construction',
+        'automation_potential': 0.78,
+        'keywords': ['textualism', 'tool dictionaries', 'tool plain', 'statutory interpretation',
+                    'statute', 'legislative intent', 'plain meaning', 'statutory construction'],
+        'examples': ['Statute interpretation', 'Legislative analysis', 'Statutory meaning']
+    },
+    'Legal-Rule-Application': {
+        'description': 'Applying legal rules to specific scenarios',
+        'automation_potential': 0.82,
+        'keywords': ['rule qa', 'abercrombie', 'hearsay', 'ucc v common law',
+                    'successor liability', 'legal reasoning causality', 'apply rule',
+                    'legal standard', 'legal test'],
+        'examples': ['Rule application', 'Legal standard analysis', 'UCC analysis']
+    },
+    'Trademark-Law': {
+        'description': 'Trademark distinctiveness analysis (Abercrombie)',
+        'automation_potential': 0.80,
+        'keywords': ['abercrombie', 'trademark', 'distinctiveness', 'generic', 'descriptive',
+                    'suggestive', 'arbitrary', 'fanciful', 'trademark analysis'],
+        'examples': ['Trademark classification', 'Distinctiveness analysis', 'Brand protection']
+    },
+    
+    # EVIDENCE & DISCOVERY (High automation 85-92%)
+    'Evidence-Analysis': {
+        'description': 'Hearsay and evidence rules',
+        'automation_potential': 0.85,
+        'keywords': ['hearsay', 'evidence', 'admissibility', 'exception', 'testimonial',
+                    'declaration', 'evidence rule', 'proof'],
+        'examples': ['Hearsay analysis', 'Evidence admissibility', 'Evidentiary review']
+    },
+    'Document-Discovery': {
+        'description': 'Document review and discovery analysis',
+        'automation_potential': 0.92,
+        'keywords': ['document production', 'discovery', 'responsive document', 'privilege',
+                    'work product', 'review document', 'ediscovery', 'document analysis'],
+        'examples': ['Discovery document review', 'Privilege review', 'Document production']
+    },
+    
+    # SPECIALIZED LEGAL DOMAINS (Medium automation 70-85%)
+    'Tax-Law': {
+        'description': 'Tax court outcomes and tax law analysis',
+        'automation_potential': 0.73,
+        'keywords': ['canada tax court', 'tax court outcomes', 'tax law', 'tax analysis',
+                    'tax dispute', 'tax assessment', 'tax ruling'],
+        'examples': ['Tax case analysis', 'Tax outcome prediction', 'Tax law research']
+    },
+    'International-Law': {
+        'description': 'International citizenship and cross-border legal questions',
+        'automation_potential': 0.85,
+        'keywords': ['international citizenship', 'citizenship questions', 'immigration',
+                    'nationality', 'cross-border', 'international law'],
+        'examples': ['Citizenship law analysis', 'Immigration questions', 'International legal research']
+    },
+    'Employment-Law': {
+        'description': 'Employment contracts and non-compete analysis',
+        'automation_potential': 0.80,
+        'keywords': ['solicit of employees', 'solicit of customers', 'employment',
+                    'non-compete', 'non-solicitation', 'employee agreement', 'restrictive covenant'],
+        'examples': ['Employment contract review', 'Non-compete analysis', 'Solicitation restrictions']
+    },
+    'Ethics-Professional': {
+        'description': 'Legal ethics and professional responsibility',
+        'automation_potential': 0.70,
+        'keywords': ['nys judicial ethics', 'judicial ethics', 'professional responsibility',
+                    'ethics rules', 'conflict of interest', 'attorney ethics'],
+        'examples': ['Ethics analysis', 'Conflict checking', 'Professional conduct review']
+    },
+    
+    # LEGAL REASONING & ANALYSIS (Medium automation 65-80%)
+    'Legal-Reasoning': {
+        'description': 'Causality and legal reasoning patterns',
+        'automation_potential': 0.75,
+        'keywords': ['legal reasoning causality', 'intra rule distinguishing',
+                    'legal analysis', 'reasoning', 'distinguish cases', 'analogize'],
+        'examples': ['Legal reasoning analysis', 'Case distinction', 'Analogical reasoning']
+    },
+    'Definition-Extraction': {
+        'description': 'Extracting and classifying legal definitions',
+        'automation_potential': 0.88,
+        'keywords': ['definition extraction', 'definition classification', 'defined term',
+                    'legal definition', 'term meaning', 'glossary'],
+        'examples': ['Definition extraction', 'Term identification', 'Glossary creation']
+    },
+    'Legal-Entailment': {
+        'description': 'SARA entailment and logical inference',
+        'automation_potential': 0.80,
+        'keywords': ['sara entailment', 'sara numeric', 'logical inference', 'entailment',
+                    'legal implication', 'follows from'],
+        'examples': ['Statutory entailment', 'Logical analysis', 'Inference tasks']
+    },
+    
+    # CORPORATE ACTIONS & DEALS (Medium-High automation 75-85%)
+    'Deal-Structure': {
+        'description': 'Deal structure and agreement terms',
+        'automation_potential': 0.78,
+        'keywords': ['jcrew blocker', 'termination services', 'agreement possession',
+                    'consistent with past practice', 'occur after signing', 'deal structure',
+                    'transaction structure'],
+        'examples': ['Deal structure analysis', 'Transaction term review', 'Agreement structuring']
+    },
+    'Financial-Impact': {
+        'description': 'Disproportionate impact and financial analysis',
+        'automation_potential': 0.72,
+        'keywords': ['disproportionate impact', 'financial impact', 'material adverse',
+                    'financial analysis', 'impact assessment'],
+        'examples': ['Financial impact analysis', 'Material adverse effect', 'Impact assessment']
+    },
+    'Private-Rights': {
+        'description': 'Private right of action analysis',
+        'automation_potential': 0.77,
+        'keywords': ['proa', 'private right of action', 'standing', 'cause of action',
+                    'statutory right', 'enforcement mechanism'],
+        'examples': ['Private right analysis', 'Standing determination', 'Enforcement review']
+    },
+    
+    # DOCUMENT PROCESSING (Very High automation 90-95%)
+    'Document-Classification': {
+        'description': 'Automated document classification and routing',
+        'automation_potential': 0.93,
+        'keywords': ['classify', 'categorize', 'document type', 'filing', 'organize',
+                    'sort documents', 'document management', 'routing'],
+        'examples': ['Document classification', 'File organization', 'Document routing']
+    },
+    'Form-Completion': {
+        'description': 'Automated form filling and template completion',
+        'automation_potential': 0.95,
+        'keywords': ['form', 'fill out', 'complete form', 'template', 'standardized',
+                    'form completion', 'data entry', 'populate'],
+        'examples': ['Form automation', 'Template completion', 'Data population']
+    },
+    'Legal-Research': {
+        'description': 'General legal research and information retrieval',
+        'automation_potential': 0.90,
+        'keywords': ['research', 'find', 'search', 'locate', 'legal research',
+                    'case search', 'statute search', 'secondary source', 'treatise'],
+        'examples': ['Legal research', 'Case law search', 'Statute research']
+    },
+    
+    # ADMINISTRATIVE & ROUTINE (Very High automation 92-98%)
+    'Calendar-Deadlines': {
+        'description': 'Calendar management and deadline tracking',
+        'automation_potential': 0.96,
+        'keywords': ['calendar', 'deadline', 'docket', 'schedule', 'date',
+                    'hearing date', 'filing deadline', 'statute of limitations'],
+        'examples': ['Deadline tracking', 'Calendar management', 'Docket control']
+    },
+    'Filing-Service': {
+        'description': 'Court filing and document service',
+        'automation_potential': 0.94,
+        'keywords': ['file', 'filing', 'serve', 'service', 'efiling', 'electronic filing',
+                    'court filing', 'submit'],
+        'examples': ['E-filing', 'Document filing', 'Service of process']
+    },
+    'Time-Billing': {
+        'description': 'Time entry and billing tasks',
+        'automation_potential': 0.92,
+        'keywords': ['time entry', 'billing', 'invoice', 'billable', 'hourly',
+                    'time tracking', 'matter', 'client billing'],
+        'examples': ['Time tracking', 'Billing preparation', 'Invoice generation']
+    },
+    
+    # DRAFTING & WRITING (Lower-Medium automation 55-75%)
+    'Brief-Drafting': {
+        'description': 'Legal brief and memorandum drafting',
+        'automation_potential': 0.58,
+        'keywords': ['draft brief', 'memorandum', 'motion', 'opposition', 'reply',
+                    'brief', 'legal writing', 'argument'],
+        'examples': ['Motion drafting', 'Brief preparation', 'Legal memoranda']
+    },
+    'Contract-Drafting': {
+        'description': 'Contract and agreement drafting',
+        'automation_potential': 0.65,
+        'keywords': ['draft contract', 'draft agreement', 'prepare contract', 'new agreement',
+                    'create contract', 'contract preparation'],
+        'examples': ['Contract creation', 'Agreement drafting', 'Document preparation']
+    },
+    'Client-Communication': {
+        'description': 'Client correspondence and communications',
+        'automation_potential': 0.55,
+        'keywords': ['email client', 'client communication', 'correspondence', 'letter',
+                    'client update', 'status update', 'client call'],
+        'examples': ['Client emails', 'Status updates', 'Client correspondence']
+    }
+}
+
+# OLI BENCHMARK - Scale Law Firm's Custom Automation Estimates
+# Based on real-world assessment of AI capabilities for specific legal tasks
+OLI_BENCHMARK_TASKS = {
+    '100% AI Replaceable - NDAs & Standard Agreements': {
+        'automation_potential': 1.00,
+        'keywords': [
+            'nda', 'non-disclosure agreement', 'non disclosure agreement', 'non disclosure',
+            'msa', 'master service agreement',
+            'confidentiality agreement',
+            'employment agreement',
+            'consultation agreement', 'consulting agreement', 'contractor agreement',
+            'vendor agreement',
+            '1099 agreement',
+            'lease agreement', 'leases',
+            'licensing agreement',
+            'procurement agreement',
+            'commercial contract',
+            'promissory note',
+            'release',
+            'order', 'orders', 'court orders',
+            'advisor agreement',
+            'ip assignment', 'assignment', 'ip agreement',
+            'convertible note',
+            'hold letter',
+            'termination letter'
+        ],
+        'description': 'Standard contract drafting, review, and analysis - highly templated work',
+        'examples': ['NDA drafting', 'MSA review', 'Employment agreement preparation']
+    },
+    '100% AI Replaceable - Document Search': {
+        'automation_potential': 1.00,
+        'keywords': [
+            'searching for document', 'search for document', 'find document', 'locate document',
+            'document search', 'retrieve document'
+        ],
+        'description': 'Document search and retrieval tasks',
+        'examples': ['Finding contracts', 'Locating agreements', 'Document retrieval']
+    },
+    '70% AI Replaceable - Legal Research & Analysis': {
+        'automation_potential': 0.70,
+        'keywords': [
+            'search case law', 'case law research', 'case search',
+            'interpret bill', 'interpret statute', 'interpret law', 'interpret ordinance', 'interpret regulations',
+            'statute interpretation', 'statutory analysis',
+            'discovery requests', 'discovery', 'written discovery', 'document production'
+        ],
+        'description': 'Legal research, statutory interpretation, and discovery work',
+        'examples': ['Case law research', 'Bill interpretation', 'Discovery requests']
+    },
+    '30% AI Replaceable - Complex Agreements': {
+        'automation_potential': 0.30,
+        'keywords': [
+            'drafting memo', 'memorandum', 'draft memo',
+            'loan document', 'loan agreement',
+            'saas agreement', 'software agreement',
+            'ecommerce agreement',
+            'agreement of purchase and sale', 'purchase agreement',
+            'settlement agreement',
+            'trademark office actions', 'trademark response', 'trademark application',
+            'patent office actions', 'patent office responses', 'patent application',
+            'closing documents', 'transaction',
+            'financing documents', 'finance',
+            'motion', 'notice of motion', 'draft motion',
+            'complaints', 'answer to complaint', 'claim',
+            'reseller agreement',
+            'referral agreement',
+            'term sheet', 'term agreement',
+            'sales representative agreement',
+            'option agreement',
+            'opinion', 'legal opinion',
+            'click agreement'
+        ],
+        'description': 'Complex agreements and documents requiring more judgment',
+        'examples': ['Loan documents', 'Settlement agreements', 'Patent responses']
+    },
+    '20% AI Replaceable - General Drafting': {
+        'automation_potential': 0.20,
+        'keywords': [
+            'draft email', 'draft letter', 'draft amendments', 'draft subscription agreement',
+            'draft update', 'drafting', 'prepare',
+            'email', 'response to', 'respond to', 'communication', 'correspondence'
+        ],
+        'description': 'General drafting and communications - requires significant human input',
+        'examples': ['Email drafting', 'Letter preparation', 'General correspondence']
+    },
+    '0% AI Replaceable - Strategic Work': {
+        'automation_potential': 0.00,
+        'keywords': [
+            'strategy', 'confer', 'spoke with', 'conference call', 'attended',
+            'meeting', 'discussion', 'call with', 'spoke to', 'consultation',
+            'advise', 'counseling', 'negotiate', 'negotiation'
+        ],
+        'description': 'Strategic work, client communications, and relationship management',
+        'examples': ['Strategy sessions', 'Client meetings', 'Negotiations']
+    }
+}
+
+# Compiled keyword matchers, built once from the taxonomy dicts above
+LEGALBENCH_MATCHER = TaxonomyMatcher(LEGALBENCH_TASKS, default_potential=0.3)
+OLI_MATCHER = TaxonomyMatcher(
+    OLI_BENCHMARK_TASKS,
+    default_potential=0.0,
+    # Strategic work wins outright whenever any of its keywords appear
+    priority_category='0% AI Replaceable - Strategic Work'
+)
+
+# Changes whenever a category, keyword or potential changes, invalidating cached classifications
+TAXONOMY_VERSION = hashlib.sha256(
+    json.dumps([LEGALBENCH_TASKS, OLI_BENCHMARK_TASKS]).encode('utf-8')
+).hexdigest()[:16]
@@ -0,0 +1,61 @@
+"""Forecasts of noise-free synthetic series must continue them (near) exactly"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from forecasting import forecast_monthly, forecast_series  # noqa: E402
+
+HORIZON = 12
+
+
+def seasonal_pattern(t):
+    return 10 * np.sin(2 * np.pi * t / 12) + 5 * (t % 12 == 3)
+
+
+@pytest.mark.parametrize('name, n_periods, series, model', [
+    ('constant', 13, lambda t: np.full(len(t), 100.0), "Holt's linear"),
+    ('short linear', 3, lambda t: 100 + 2 * t, "Holt's linear"),
+    ('linear', 13, lambda t: 100 + 2 * t, "Holt's linear"),
+    ('seasonal', 36, lambda t: 100 + seasonal_pattern(t), 'Holt-Winters'),
+    ('trend and season', 36, lambda t: 100 + 1.5 * t + seasonal_pattern(t), 'Holt-Winters'),
+])
+def test_noise_free_series_forecast_exactly(name, n_periods, series, model):
+    history = series(np.arange(n_periods, dtype='float64'))
+    expected = series(np.arange(n_periods, n_periods + HORIZON, dtype='float64'))
+    forecast, lower, upper, models = forecast_series(history[None, :], HORIZON)
+    assert models[0] == model
+    np.testing.assert_allclose(forecast[0], expected, atol=1e-6)
+    np.testing.assert_allclose(upper[0] - lower[0], 0, atol=1e-6)
+
+
+def test_unknown_months_keep_the_trend():
+    t = np.arange(30, dtype='float64')
+    history = 100 + 1.5 * t + seasonal_pattern(t)
+    history[[14, 20, 21]] = np.nan
+    expected = 100 + 1.5 * np.arange(30, 30 + HORIZON) + seasonal_pattern(np.arange(30, 30 + HORIZON))
+    forecast, *_ = forecast_series(history[None, :], HORIZON)
+    np.testing.assert_allclose(forecast[0], expected, atol=1e-6)
+
+
+def test_noisy_trend_interval_covers_the_trend():
+    rng = np.random.default_rng(0)
+    t = np.arange(36, dtype='float64')
+    history = 200 + 3 * t + seasonal_pattern(t) + rng.normal(0, 2, len(t))
+    expected = 200 + 3 * np.arange(36, 36 + HORIZON) + seasonal_pattern(np.arange(36, 36 + HORIZON))
+    forecast, lower, upper, _ = forecast_series(history[None, :], HORIZON)
+    assert np.all((lower[0] <= expected) & (expected <= upper[0]))
+    np.testing.assert_allclose(forecast[0], expected, atol=8)
+
+
+def test_months_without_data_are_forecast_from_start():
+    months = [3, 4, 6, 7, 8]
+    frame = pd.DataFrame({'Year': 2025, 'Month': months, 'Hours': [100.0 + 10 * (month - 1) for month in months]})
+    forecast = forecast_monthly(frame, 'Hours', horizon=4, start=2025 * 12)
+    assert list(forecast['Month']) == [1, 2, 5, 9, 10, 11, 12]
+    np.testing.assert_allclose(forecast['Forecast'], 100 + 10 * (forecast['Month'] - 1), atol=1e-6)
+    assert list(forecast_monthly(frame, 'Hours', horizon=4)['Month']) == [9, 10, 11, 12]
@@ -0,0 +1,92 @@
+"""classify_series must match the original per-keyword scoring loops exactly"""
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from task_classifier import ClassificationMemo, classify_series  # noqa: E402
+from taxonomies import LEGALBENCH_MATCHER, LEGALBENCH_TASKS, OLI_BENCHMARK_TASKS, OLI_MATCHER  # noqa: E402
+
+STRATEGIC = '0% AI Replaceable - Strategic Work'
+
+
+def reference_legalbench(description):
+    """classify_task as it was before the matcher rewrite"""
+    if pd.isna(description):
+        return 'Unclassified', 0.0
+    description_lower = description.lower()
+    scores = {}
+    for category, info in LEGALBENCH_TASKS.items():
+        score = sum(1 for keyword in info['keywords'] if keyword in description_lower)
+        if score > 0:
+            scores[category] = score
+    if scores:
+        best_category = max(scores, key=scores.get)
+        return best_category, LEGALBENCH_TASKS[best_category]['automation_potential']
+    return 'Unclassified', 0.3
+
+
+def reference_oli(description):
+    """classify_task_oli as it was before the matcher rewrite"""
+    if pd.isna(description):
+        return 'Unclassified', 0.0
+    description_lower = description.lower()
+    if any(keyword in description_lower for keyword in OLI_BENCHMARK_TASKS[STRATEGIC]['keywords']):
+        return STRATEGIC, 0.0
+    scores = {}
+    for category, info in OLI_BENCHMARK_TASKS.items():
+        if category == STRATEGIC:
+            continue
+        score = sum(1 for keyword in info['keywords'] if keyword in description_lower)
+        if score > 0:
+            scores[category] = score
+    if scores:
+        best_category = max(scores, key=scores.get)
+        return best_category, OLI_BENCHMARK_TASKS[best_category]['automation_potential']
+    return 'Unclassified', 0.0
+
+
+def sample_descriptions():
+    """Mixed-case, punctuated, overlapping-keyword and degenerate descriptions"""
+    keywords = sorted({keyword for taxonomy in (LEGALBENCH_TASKS, OLI_BENCHMARK_TASKS)
+                       for info in taxonomy.values() for keyword in info['keywords']})
+    rng = random.Random(0)
+    samples = [
+        None, np.nan, '', '   ', 'no matching words here', 'ÉCOLE résumé Straße',
+        'Review CONTRACT; draft Memo re: NDA.', 'review/revise the (draft) contract-review memo!!',
+        'Call w/ client re strategy, negotiation & settlement', 'e-mail: research case law; cite-check brief',
+    ]
+    for _ in range(2000):
+        words = rng.sample(keywords, rng.randint(1, 4))
+        # Overlapping keywords: fragments and concatenations of neighbouring keywords
+        if rng.random() < 0.3:
+            word = rng.choice(words)
+            words.append(word[:max(1, len(word) // 2)])
+        if rng.random() < 0.3:
+            words.append(''.join(rng.sample(keywords, 2)))
+        separator = rng.choice([' ', ', ', '; ', '/', ' - ', '.', '(', ')'])
+        text = separator.join(words)
+        samples.append(rng.choice([str.lower, str.upper, str.title, lambda value: value])(text))
+    return samples
+
+
+@pytest.mark.parametrize('matcher, reference', [
+    (LEGALBENCH_MATCHER, reference_legalbench),
+    (OLI_MATCHER, reference_oli),
+])
+def test_classify_series_matches_reference(matcher, reference):
+    descriptions = sample_descriptions()
+    expected = [reference(description) for description in descriptions]
+    for memo in (None, ClassificationMemo(maxsize=1000)):
+        # Twice with the memo, so the second pass is answered from it
+        for _ in range(2 if memo else 1):
+            categories, potentials = classify_series(pd.Series(descriptions, dtype=object), matcher, memo=memo)
+            assert list(categories) == [category for category, _ in expected]
+            np.testing.assert_array_equal(
+                potentials, np.array([potential for _, potential in expected], dtype=potentials.dtype)
+            )